@@ -1,16 +1,54 @@
-from flask import Flask, request, jsonify, send_file, render_template_string, url_for, abort
+from flask import Flask, Request, Response, request, jsonify, send_file, url_for, abort, stream_with_context
 import os
 import re
 from datetime import datetime
-import pandas as pd
+import io
+import csv
 from io import BytesIO
 import json
 import time
 import threading
+import queue
 import shutil
+import tempfile
 import concurrent.futures
-import docx2txt
-from functools import wraps
+import gzip
+import hashlib
+import zipfile
+import logging
+import importlib
+import itertools
+import mimetypes
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.datastructures import FileStorage
+from urllib.parse import unquote
+from functools import wraps, lru_cache
+from collections import OrderedDict
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    from lxml import etree as xml_etree
+except ImportError:
+    import xml.etree.ElementTree as xml_etree
 
 try:
     from secrets_store import store_api_key, get_api_key as get_stored_api_key, delete_api_key
@@ -24,6 +62,11 @@ try:
 except Exception:
     call_llm_extract = None
 
+try:
+    import llm_cache
+except Exception:
+    llm_cache = None
+
 try:
     from resume_parser import parse_resume, extract_text
 except Exception:
@@ -31,27 +74,422 @@ except Exception:
     extract_text = None
 
 
+# Requests up to this size keep their uploads in memory; larger ones are streamed
+# straight to named temp files so parse workers can open them by path instead of
+# receiving another copy of the bytes.
+_SPOOL_TO_DISK_BYTES = 512 * 1024
+
+# Per-file and per-request upload caps. Each batch POST may carry several files,
+# so the request cap is separate from the per-file one.
+_MAX_FILE_BYTES = int(os.getenv('PARSE_MAX_FILE_MB', '5')) * 1024 * 1024
+_MAX_REQUEST_BYTES = int(os.getenv('PARSE_MAX_TOTAL_MB', '50')) * 1024 * 1024
+
+
+class _CappedStream:
+    """File-like wrapper that aborts the upload as soon as one part exceeds `limit`."""
+
+    def __init__(self, stream, limit):
+        self._stream = stream
+        self._limit = limit
+        self._written = 0
+
+    @property
+    def written(self):
+        """Bytes written so far, i.e. the upload's size once the body is parsed."""
+        return self._written
+
+    def write(self, data):
+        self._written += len(data)
+        if self._written > self._limit:
+            raise RequestEntityTooLarge(f'File too large (max: {self._limit / (1024*1024):.0f} MB)')
+        return self._stream.write(data)
+
+    def __iter__(self):
+        return iter(self._stream)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class UploadRequest(Request):
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # Reject a part up front when the client declared its size
+        if content_length is not None and content_length > _MAX_FILE_BYTES:
+            raise RequestEntityTooLarge(f'File too large (max: {_MAX_FILE_BYTES / (1024*1024):.0f} MB)')
+        if total_content_length is not None and total_content_length <= _SPOOL_TO_DISK_BYTES:
+            return BytesIO()
+        # Deleted automatically when Werkzeug closes the upload at request teardown
+        return _CappedStream(tempfile.NamedTemporaryFile(suffix=os.path.splitext(filename or '')[1]), _MAX_FILE_BYTES)
+
+
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider backed by orjson; falls back to Flask's `default` for unknown types."""
+
+        def dumps(self, obj, **kwargs):
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if kwargs.get('indent'):
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.request_class = UploadRequest
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 # Security Configuration
-app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('PARSE_MAX_FILE_MB', '5')) * 1024 * 1024
+app.config['MAX_CONTENT_LENGTH'] = _MAX_REQUEST_BYTES
 app.config['SESSION_COOKIE_SECURE'] = os.getenv('FLASK_ENV', 'production') != 'development'
 app.config['SESSION_COOKIE_HTTPONLY'] = True
 app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
 
+# Static assets are cache-busted by content hash, so browsers may keep them for a year
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000
+
+# Text extraction and rule-based parsing are CPU-bound, so they run in a process
+# pool instead of threads that would all contend for one GIL. The pool is created
+# lazily so each server worker (e.g. gunicorn fork) gets its own.
+_PARSE_POOL = None
+_PARSE_POOL_SIZE = max(1, int(os.getenv('PARSE_PROCESSES', str(os.cpu_count() or 2))))
+_PARSE_POOL_LOCK = threading.Lock()
+# Upper bound on one file's extraction + parse in the pool; a stuck worker then
+# yields an error row instead of holding the request forever
+_PARSE_TIMEOUT = float(os.getenv('PARSE_TIMEOUT', '60'))
+
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _optional_module(name):
+    """
+    Import an optional extraction library once per process; None if it is missing.
+    Resolved on first use rather than at import, so the web process only loads
+    what it actually parses with.
+    """
+    try:
+        return importlib.import_module(name)
+    except Exception:
+        return None
+
+
+def _init_parse_worker():
+    """Import the extraction libraries up front so no request pays for it."""
+    for name in ('pypdfium2', 'PyPDF2', 'pdfplumber', 'docx2txt', 'docx'):
+        _optional_module(name)
+
+
+def _worker_ready():
+    return os.getpid()
+
+
+def _get_parse_pool():
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            _PARSE_POOL = concurrent.futures.ProcessPoolExecutor(
+                max_workers=_PARSE_POOL_SIZE, initializer=_init_parse_worker
+            )
+        return _PARSE_POOL
+
+
+def _reset_parse_pool(broken, terminate=False):
+    """
+    Drop `broken` so the next _get_parse_pool() builds a fresh pool (unless another
+    thread already did). With `terminate`, its workers are killed as well: a worker
+    stuck on a pathological file would otherwise hold its slot until it finished.
+    """
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is broken:
+            _PARSE_POOL = None
+    # ProcessPoolExecutor has no public way to stop running workers before 3.14
+    processes = list((getattr(broken, '_processes', None) or {}).values()) if terminate else []
+    broken.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+_REQUEST_POOL = None
+_REQUEST_POOL_LOCK = threading.Lock()
+
+
+def _get_request_pool():
+    """Thread pool shared by all /parse requests for per-file work (pool hand-off, LLM calls)."""
+    global _REQUEST_POOL
+    with _REQUEST_POOL_LOCK:
+        if _REQUEST_POOL is None:
+            _REQUEST_POOL = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, int(os.getenv('PARSE_WORKERS', '4'))), thread_name_prefix='parse'
+            )
+        return _REQUEST_POOL
+
+
+def warm_parse_pool():
+    """
+    Spawn the pool processes and wait for trivial jobs to come back, so the
+    first real request does not pay for process start-up and library imports.
+    Returns the pool size.
+    """
+    pool = _get_parse_pool()
+    # One trivial job per worker makes the executor spawn the full pool
+    futures = [pool.submit(_worker_ready) for _ in range(_PARSE_POOL_SIZE)]
+    for future in futures:
+        future.result(timeout=60)
+    return _PARSE_POOL_SIZE
+
+
+def _extract_and_parse(filename, source):
+    """
+    Extract text from an upload and parse it (runs in a pool process).
+    `source` is either the raw bytes or the path of the spooled upload on disk.
+    """
+    if isinstance(source, str):
+        with open(source, 'rb') as fh:
+            content = read_file_content(FileStorage(stream=fh, filename=filename))
+    else:
+        content = read_file_content(FileStorage(stream=BytesIO(source), filename=filename))
+    return content, parse_resume_text(content)
+
+
+# Bump whenever extraction or parsing output changes so stale cache entries miss
+PARSER_VERSION = '1'
+_PARSE_CACHE_MAX = int(os.getenv('PARSE_CACHE_SIZE', '512'))
+# Entries hold the extracted text, so the total is capped in characters too
+_PARSE_CACHE_MAX_CHARS = int(os.getenv('PARSE_CACHE_MAX_CHARS', str(64 * 1024 * 1024)))
+
+
+class _ParseCache:
+    """
+    LRU of (content, parsed) bounded by entry count and by the total length of
+    the cached text; a single text over a quarter of the budget is not kept.
+    """
+    def __init__(self, max_entries, max_chars):
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self._entries = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None:
+                self._entries.move_to_end(key)
+            return hit
+
+    def put(self, key, value):
+        size = len(value[0])
+        if size > self.max_chars // 4:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._chars -= len(old[0])
+            self._entries[key] = value
+            self._chars += size
+            while len(self._entries) > self.max_entries or self._chars > self.max_chars:
+                _, evicted = self._entries.popitem(last=False)
+                self._chars -= len(evicted[0])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._chars = 0
+
+
+_PARSE_CACHE = _ParseCache(_PARSE_CACHE_MAX, _PARSE_CACHE_MAX_CHARS)
+# Optional on-disk tier behind the in-memory LRU, shared by all app processes and
+# kept across restarts (PARSE_CACHE_DIR, needs diskcache)
+_PARSE_CACHE_DIR = os.getenv('PARSE_CACHE_DIR', '')
+_PARSE_DISK_CACHE = diskcache.Cache(_PARSE_CACHE_DIR) if diskcache is not None and _PARSE_CACHE_DIR else None
+
+
+def _parse_cache_key(filename, source):
+    """SHA-256 of the upload plus the bits that change how it is parsed."""
+    digest = hashlib.sha256()
+    if isinstance(source, str):
+        with open(source, 'rb') as fh:
+            for chunk in iter(lambda: fh.read(1024 * 1024), b''):
+                digest.update(chunk)
+    else:
+        digest.update(source)
+    return (digest.hexdigest(), os.path.splitext(filename or '')[1].lower(), PARSER_VERSION)
+
+
+def _run_parse(filename, source):
+    """
+    Run `_extract_and_parse` in the process pool. If the pool breaks (a worker
+    died, possibly on this very file) the job is retried once on a fresh pool;
+    it never falls back to the web process, which a crashing file would take down.
+    A job still running after PARSE_TIMEOUT raises TimeoutError and the pool is
+    replaced, killing the stuck worker. Results are memoised by file content, so re-uploads skip the parse entirely.
+    """
+    key = _parse_cache_key(filename, source) if _PARSE_CACHE_MAX > 0 else None
+    disk_key = ':'.join(key) if key is not None and _PARSE_DISK_CACHE is not None else None
+    if key is not None:
+        hit = _PARSE_CACHE.get(key)
+        if hit is None and disk_key is not None:
+            try:
+                hit = _PARSE_DISK_CACHE.get(disk_key)
+            except Exception:
+                hit = None
+            if hit is not None:
+                _PARSE_CACHE.put(key, hit)
+        if hit is not None:
+            # Callers annotate the parsed dict with links, so hand out a copy
+            return hit[0], dict(hit[1])
+
+    for attempt in range(2):
+        pool = _get_parse_pool()
+        try:
+            content, parsed = pool.submit(_extract_and_parse, filename, source).result(timeout=_PARSE_TIMEOUT)
+            break
+        except concurrent.futures.process.BrokenProcessPool:
+            _reset_parse_pool(pool)
+            if attempt:
+                raise
+        except concurrent.futures.TimeoutError:
+            # The worker is still busy with this file; replace the pool so its
+            # slot comes back. Other jobs in flight see BrokenProcessPool and retry.
+            _reset_parse_pool(pool, terminate=True)
+            raise
+
+    if disk_key is not None:
+        try:
+            _PARSE_DISK_CACHE.set(disk_key, (content, dict(parsed)))
+        except Exception:
+            pass
+    if key is not None:
+        _PARSE_CACHE.put(key, (content, dict(parsed)))
+    return content, parsed
+
+
+def _upload_size(file_storage):
+    """
+    Size of a parsed upload without seeking: counted while spooling to disk, or
+    the length of the in-memory buffer. Other streams fall back to seek/tell.
+    """
+    stream = file_storage.stream
+    if isinstance(stream, _CappedStream):
+        return stream.written
+    if isinstance(stream, BytesIO):
+        with stream.getbuffer() as view:
+            return view.nbytes
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+    return size
+
+
+def _upload_source(file_storage):
+    """Path of an upload spooled to disk, or its bytes when it was kept in memory."""
+    stream = file_storage.stream
+    path = getattr(stream, 'name', None)
+    if isinstance(path, str) and os.path.isfile(path):
+        stream.flush()
+        return path
+    stream.seek(0)
+    return stream.read()
+
+
+def _save_upload(file_storage, dest):
+    """
+    Copy an upload to `dest`. Spooled uploads are copied file-to-file with
+    shutil.copyfile, which uses os.sendfile on Linux so the bytes never pass
+    through Python; in-memory ones are written straight from their buffer.
+    """
+    source = _upload_source(file_storage)
+    if isinstance(source, str):
+        shutil.copyfile(source, dest)
+    else:
+        with open(dest, 'wb') as fh:
+            fh.write(source)
+
+
+_RAW_UPLOAD_CHUNK_BYTES = 256 * 1024
+
+
+def _raw_upload():
+    """
+    A single file sent as the raw request body (application/octet-stream, name in
+    X-Filename), copied to a temp file in fixed-size chunks under the per-file cap.
+    """
+    filename = unquote(request.headers.get('X-Filename', ''))
+    spool = _CappedStream(tempfile.NamedTemporaryFile(suffix=os.path.splitext(filename)[1]), _MAX_FILE_BYTES)
+    while True:
+        chunk = request.stream.read(_RAW_UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            break
+        spool.write(chunk)
+    spool.seek(0)
+    return FileStorage(stream=spool, filename=filename)
+
+
+@app.before_request
+def reject_oversized_requests():
+    """Refuse bodies over the request cap from Content-Length alone, before reading any bytes."""
+    if request.content_length is not None and request.content_length > _MAX_REQUEST_BYTES:
+        return jsonify({'error': f'Request too large (max: {_MAX_REQUEST_BYTES / (1024*1024):.0f} MB)'}), 413
+
+
+@app.errorhandler(RequestEntityTooLarge)
+def request_too_large(e):
+    return jsonify({'error': e.description or 'Request too large'}), 413
+
+
 # Security Headers Middleware
+SECURITY_HEADERS = {
+    'X-Content-Type-Options': 'nosniff',
+    'X-Frame-Options': 'DENY',
+    'X-XSS-Protection': '1; mode=block',
+    'Strict-Transport-Security': 'max-age=31536000; includeSubDomains',
+    'Content-Security-Policy': "default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'; img-src 'self' data:; font-src 'self'",
+    'Referrer-Policy': 'strict-origin-when-cross-origin',
+    'Permissions-Policy': 'geolocation=(), microphone=(), camera=()',
+}
+
+
 @app.after_request
 def add_security_headers(response):
     """Add security headers to every response"""
-    response.headers['X-Content-Type-Options'] = 'nosniff'
-    response.headers['X-Frame-Options'] = 'DENY'
-    response.headers['X-XSS-Protection'] = '1; mode=block'
-    response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
-    response.headers['Content-Security-Policy'] = "default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'; img-src 'self' data:; font-src 'self'"
-    response.headers['Referrer-Policy'] = 'strict-origin-when-cross-origin'
-    response.headers['Permissions-Policy'] = 'geolocation=(), microphone=(), camera=()'
+    response.headers.update(SECURITY_HEADERS)
     return response
 
+@app.route('/warmup')
+def warmup():
+    """Readiness hook for orchestrators: spawns the parse pool before traffic arrives."""
+    try:
+        workers = warm_parse_pool()
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 503
+    return jsonify({'status': 'ready', 'workers': workers})
+
+
+_WARM_ON_START = os.getenv('PARSE_WARM_ON_START', '0') == '1'
+_warm_started = threading.Event()
+
+
+@app.before_request
+def warm_on_first_request():
+    """
+    With PARSE_WARM_ON_START=1, start warming the pool in the background on the
+    first request. Not at import: pool workers forked while `app` is still being
+    imported inherit a half-initialised module and block unpickling jobs from it.
+    """
+    if _WARM_ON_START and not _warm_started.is_set():
+        _warm_started.set()
+        threading.Thread(target=warm_parse_pool, daemon=True).start()
+
 HTML_TEMPLATE = '''
 <!DOCTYPE html>
 <html lang="en">
@@ -59,6 +497,7 @@ HTML_TEMPLATE = '''
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Resume Parser AI Agent</title>
+    <link rel="stylesheet" href="{{ css_url }}">
     <style>
         {% if not default_theme %}
         :root {
@@ -138,718 +577,9 @@ HTML_TEMPLATE = '''
             {% endif %}
         }
         {% endif %}
-
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-            transition: background-color 0.3s ease, color 0.3s ease, border-color 0.3s ease;
-        }
-        
-        *::selection {
-            background: transparent;
-            color: inherit;
-        }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            background: var(--bg-secondary);
-            min-height: 100vh;
-            padding: 20px;
-            color: var(--text-primary);
-            scroll-behavior: smooth;
-            overflow-x: hidden;
-        }
-        
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-        }
-
-        .header {
-            background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
-            border-radius: 20px;
-            box-shadow: 0 20px 60px var(--shadow-lg);
-            padding: 40px;
-            margin-bottom: 30px;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .header::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            right: -50%;
-            width: 200%;
-            height: 200%;
-            background: radial-gradient(circle, rgba(255,255,255,0.1) 0%, transparent 70%);
-            animation: float 15s infinite ease-in-out;
-        }
-
-        @keyframes float {
-            0%, 100% { transform: translate(0, 0) rotate(0deg); }
-            50% { transform: translate(-20px, -20px) rotate(180deg); }
-        }
-
-        @keyframes rotate {
-            from { transform: rotate(0deg); }
-            to { transform: rotate(360deg); }
-        }
-
-        @keyframes slideInDown {
-            from {
-                opacity: 0;
-                transform: translateY(-20px);
-            }
-            to {
-                opacity: 1;
-                transform: translateY(0);
-            }
-        }
-
-        @keyframes slideInUp {
-            from {
-                opacity: 0;
-                transform: translateY(20px);
-            }
-            to {
-                opacity: 1;
-                transform: translateY(0);
-            }
-        }
-
-        @keyframes pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.5; }
-        }
-
-        @keyframes shimmer {
-            0% { background-position: -1000px 0; }
-            100% { background-position: 1000px 0; }
-        }
-
-        .header-content {
-            position: relative;
-            z-index: 1;
-        }
-
-        .header-top {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 20px;
-        }
-
-        h1 {
-            font-size: 2.5em;
-            color: white;
-            display: flex;
-            align-items: center;
-            gap: 15px;
-            margin: 0;
-        }
-
-        {% if not default_theme %}
-        .theme-toggle {
-            background: rgba(255, 255, 255, 0.12);
-            border: 1px solid rgba(255, 255, 255, 0.18);
-            color: white;
-            padding: 10px 18px;
-            border-radius: 12px;
-            cursor: pointer;
-            font-size: 1.05em;
-            backdrop-filter: blur(6px);
-            transition: all 0.2s ease;
-            box-shadow: 0 6px 18px rgba(79,70,229,0.18);
-        }
-        {% endif %}
-
-        .snow-toggle {
-            background: rgba(255, 255, 255, 0.12);
-            border: 1px solid rgba(255, 255, 255, 0.14);
-            color: white;
-            padding: 8px 12px;
-            border-radius: 12px;
-            cursor: pointer;
-            font-size: 1.05em;
-            margin-left: 10px;
-            backdrop-filter: blur(6px);
-            transition: all 0.2s ease;
-            box-shadow: 0 6px 18px rgba(6,182,212,0.12);
-        }
-
-        /* full-screen snow canvas */
-        #snowCanvas {
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            pointer-events: none;
-            z-index: 9999;
-            opacity: 0.95;
-        }
-
-        {% if not default_theme %}
-        .theme-toggle:hover {
-            background: rgba(255, 255, 255, 0.3);
-            transform: scale(1.05);
-        }
-        {% endif %}
-        
-        .subtitle {
-            color: rgba(255, 255, 255, 0.9);
-            font-size: 1.1em;
-        }
-
-        .stats-container {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }
-
-        .stat-card {
-            background: var(--bg-primary);
-            border-radius: 15px;
-            padding: 25px;
-            box-shadow: 0 4px 15px var(--shadow);
-            border: 1px solid var(--border-color);
-        }
-
-        .stat-label {
-            color: var(--text-secondary);
-            font-size: 0.9em;
-            margin-bottom: 8px;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-
-        .stat-value {
-            font-size: 2em;
-            font-weight: bold;
-            color: var(--text-primary);
-        }
-
-        .stat-value.success { color: var(--success); }
-        .stat-value.danger { color: var(--danger); }
-        .stat-value.warning { color: var(--warning); }
-
-        .main-card {
-            background: var(--bg-primary);
-            border-radius: 20px;
-            box-shadow: 0 10px 40px var(--shadow);
-            padding: 40px;
-            margin-bottom: 30px;
-            border: 1px solid var(--border-color);
-        }
-        
-        .upload-area {
-            border: 3px dashed var(--border-color);
-            border-radius: 15px;
-            padding: 60px 40px;
-            text-align: center;
-            margin: 30px 0;
-            background: var(--bg-secondary);
-            transition: all 0.4s cubic-bezier(0.34, 1.56, 0.64, 1);
-            cursor: pointer;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .upload-area::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent, rgba(255,255,255,0.1), transparent);
-            transition: left 0.5s ease;
-        }
-        
-        .upload-area:hover {
-            border-color: var(--primary);
-            background: var(--bg-tertiary);
-            transform: translateY(-4px) scale(1.01);
-            box-shadow: 0 10px 30px rgba(217, 119, 6, 0.2);
-        }
-
-        .upload-area:hover::before {
-            left: 100%;
-        }
-        
-        .upload-area.dragover {
-            border-color: var(--success);
-            background: var(--bg-tertiary);
-            transform: scale(1.04);
-            box-shadow: 0 15px 40px rgba(22, 163, 74, 0.25);
-            border-width: 4px;
-        }
-        
-        .upload-icon {
-            font-size: 4em;
-            margin-bottom: 15px;
-            animation: bounce 2s infinite;
-            display: inline-block;
-        }
-
-        @keyframes bounce {
-            0%, 100% { transform: translateY(0) scale(1); }
-            50% { transform: translateY(-15px) scale(1.05); }
-        }
-        
-        .upload-text {
-            font-size: 1.2em;
-            color: var(--text-primary);
-            margin-bottom: 10px;
-            font-weight: 600;
-        }
-        
-        .upload-hint {
-            color: var(--text-muted);
-            font-size: 0.95em;
-        }
-
-        /* Modal / settings */
-        .modal-backdrop { position: fixed; inset: 0; background: rgba(2,6,23,0.6); display: none; align-items: center; justify-content: center; z-index: 10001; }
-        .modal { background: var(--bg-primary); width: 720px; max-width: 94%; border-radius: 12px; padding: 20px; box-shadow: 0 20px 60px var(--shadow-lg); }
-        .modal-header { display:flex; justify-content:space-between; align-items:center; margin-bottom:12px }
-        .modal-title { font-weight:700; font-size:1.1em }
-        .modal-body { max-height: 60vh; overflow:auto; }
-        .row { display:flex; gap:12px; margin-bottom:12px; align-items:center }
-        .field { flex:1 }
-        .small { font-size:0.9em; color:var(--text-muted) }
-        .pill { padding:8px 12px; border-radius:999px; background:var(--bg-secondary); border:1px solid var(--border-color); }
-        
-        #fileInput {
-            display: none;
-        }
-        
-        .file-list {
-            margin: 20px 0;
-            padding: 20px;
-            background: var(--bg-secondary);
-            border-radius: 10px;
-            display: none;
-        }
-
-        .file-list-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-        }
-
-        .file-list-title {
-            font-size: 1.1em;
-            font-weight: 600;
-            color: var(--text-primary);
-        }
-
-        .clear-files {
-            background: var(--danger);
-            color: white;
-            border: none;
-            padding: 8px 16px;
-            border-radius: 8px;
-            cursor: pointer;
-            font-size: 0.9em;
-            transition: all 0.3s ease;
-        }
-
-        .clear-files:hover {
-            background: #dc2626;
-            transform: translateY(-2px);
-        }
-        
-        .file-item {
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            padding: 12px;
-            background: var(--bg-primary);
-            margin-bottom: 8px;
-            border-radius: 8px;
-            border-left: 4px solid var(--primary);
-            position: relative;
-            overflow: hidden;
-        }
-
-        .file-item.parsing {
-            border-left-color: var(--warning);
-        }
-
-        .file-item.success {
-            border-left-color: var(--success);
-        }
-
-        .file-item.failed {
-            border-left-color: var(--danger);
-        }
-
-        .file-icon {
-            font-size: 1.5em;
-        }
-
-        .file-info {
-            flex: 1;
-        }
-
-        .file-name {
-            color: var(--text-primary);
-            font-weight: 500;
-        }
-
-        .file-size {
-            color: var(--text-muted);
-            font-size: 0.85em;
-        }
-
-        .file-status {
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            font-size: 0.9em;
-            font-weight: 600;
-        }
-
-        .file-status.pending { color: var(--text-muted); }
-        .file-status.parsing { color: var(--warning); }
-        .file-status.success { color: var(--success); }
-        .file-status.failed { color: var(--danger); }
-
-        .file-progress {
-            position: absolute;
-            bottom: 0;
-            left: 0;
-            height: 3px;
-            background: var(--primary);
-            width: 0%;
-            transition: width 0.3s ease;
-        }
-        
-        .btn-container {
-            display: flex;
-            gap: 15px;
-            margin: 20px 0;
-        }
-
-        .btn {
-            flex: 1;
-            background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
-            color: white;
-            padding: 15px 40px;
-            border: none;
-            border-radius: 10px;
-            font-size: 1.1em;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            box-shadow: 0 4px 15px rgba(102, 126, 234, 0.4);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 10px;
-        }
-        
-        .btn:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 6px 20px rgba(102, 126, 234, 0.6);
-        }
-        
-        .btn:disabled {
-            background: var(--text-muted);
-            cursor: not-allowed;
-            transform: none;
-            box-shadow: none;
-        }
-        
-        .btn-success {
-            background: linear-gradient(135deg, var(--success) 0%, var(--success-dark) 100%);
-            box-shadow: 0 4px 15px rgba(16, 185, 129, 0.4);
-        }
-        
-        .btn-success:hover {
-            box-shadow: 0 6px 20px rgba(16, 185, 129, 0.6);
-        }
-
-        .btn-secondary {
-            background: var(--bg-tertiary);
-            color: var(--text-primary);
-            box-shadow: 0 2px 10px var(--shadow);
-        }
-
-        .btn-secondary:hover {
-            background: var(--border-color);
-        }
-        
-        .progress-container {
-            display: none;
-            margin: 30px 0;
-        }
-
-        .progress-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-        }
-
-        .progress-title {
-            font-size: 1.2em;
-            font-weight: 600;
-            color: var(--text-primary);
-        }
-
-        .progress-stats {
-            display: flex;
-            gap: 20px;
-            font-size: 0.9em;
-        }
-
-        .progress-stat {
-            display: flex;
-            align-items: center;
-            gap: 5px;
-        }
-
-        .progress-bar-container {
-            background: var(--bg-secondary);
-            border-radius: 10px;
-            height: 30px;
-            overflow: hidden;
-            position: relative;
-            box-shadow: inset 0 2px 4px var(--shadow);
-        }
-
-        .progress-bar {
-            height: 100%;
-            background: linear-gradient(90deg, var(--primary), var(--secondary));
-            transition: width 0.5s ease;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-weight: 600;
-            font-size: 0.9em;
-        }
-
-        .progress-bar.complete {
-            background: linear-gradient(90deg, var(--success), var(--success-dark));
-        }
-        
-        .alert {
-            padding: 15px 20px;
-            border-radius: 10px;
-            margin: 20px 0;
-            display: none;
-            animation: slideIn 0.3s ease;
-        }
-
-        @keyframes slideIn {
-            from { opacity: 0; transform: translateY(-10px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        
-        .alert-success {
-            background: rgba(16, 185, 129, 0.1);
-            color: var(--success);
-            border-left: 4px solid var(--success);
-        }
-        
-        .alert-error {
-            background: rgba(239, 68, 68, 0.1);
-            color: var(--danger);
-            border-left: 4px solid var(--danger);
-        }
-
-        .alert-warning {
-            background: rgba(245, 158, 11, 0.1);
-            color: var(--warning);
-            border-left: 4px solid var(--warning);
-        }
-        
-        .results-container {
-            margin-top: 30px;
-            display: none;
-        }
-        
-        .results-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 20px;
-            padding-bottom: 15px;
-            border-bottom: 2px solid var(--border-color);
-            flex-wrap: wrap;
-            gap: 15px;
-        }
-        
-        .results-title {
-            font-size: 1.5em;
-            color: var(--text-primary);
-            font-weight: 600;
-        }
-
-        .results-actions {
-            display: flex;
-            gap: 10px;
-        }
-
-        .action-btn {
-            background: var(--bg-secondary);
-            color: var(--text-primary);
-            border: 1px solid var(--border-color);
-            padding: 10px 20px;
-            border-radius: 8px;
-            cursor: pointer;
-            font-size: 0.9em;
-            transition: all 0.3s ease;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }
-
-        .action-btn:hover {
-            background: var(--bg-tertiary);
-            transform: translateY(-2px);
-        }
-
-        .search-box {
-            padding: 10px 15px;
-            border: 1px solid var(--border-color);
-            border-radius: 8px;
-            background: var(--bg-secondary);
-            color: var(--text-primary);
-            font-size: 0.95em;
-            width: 250px;
-        }
-
-        .search-box:focus {
-            outline: none;
-            border-color: var(--primary);
-        }
-        
-        .table-responsive {
-            overflow-x: auto;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px var(--shadow);
-        }
-
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            background: var(--bg-primary);
-        }
-        
-        thead {
-            background: linear-gradient(135deg, var(--primary) 0%, var(--secondary) 100%);
-            color: white;
-            position: sticky;
-            top: 0;
-            z-index: 10;
-        }
-        
-        th {
-            padding: 15px;
-            text-align: left;
-            font-weight: 600;
-            font-size: 0.9em;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            white-space: nowrap;
-        }
-        
-        td {
-            padding: 12px 15px;
-            border-bottom: 1px solid var(--border-color);
-            color: var(--text-primary);
-        }
-        
-        tbody tr {
-            transition: all 0.3s ease;
-            background: var(--bg-primary);
-        }
-        
-        tbody tr:hover {
-            background: var(--bg-secondary);
-            transform: translateX(4px);
-            box-shadow: -4px 0 12px rgba(217, 119, 6, 0.15);
-        }
-        
-        tbody tr:nth-child(even) {
-            background: rgba(0, 0, 0, 0.02);
-        }
-        
-        [data-theme="dark"] tbody tr:nth-child(even) {
-            background: rgba(255, 255, 255, 0.02);
-        }
-            transition: background 0.2s ease;
-        }
-        
-        tbody tr:hover {
-            background: var(--bg-secondary);
-        }
-        
-        .null-value {
-            color: var(--text-muted);
-            font-style: italic;
-        }
-
-        .filter-tabs {
-            display: flex;
-            gap: 10px;
-            margin-bottom: 20px;
-            flex-wrap: wrap;
-        }
-
-        .filter-tab {
-            padding: 8px 16px;
-            border: 2px solid var(--border-color);
-            background: var(--bg-secondary);
-            color: var(--text-primary);
-            border-radius: 20px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            font-size: 0.9em;
-            font-weight: 500;
-        }
-
-        .filter-tab:hover {
-            border-color: var(--primary);
-        }
-
-        .filter-tab.active {
-            background: var(--primary);
-            color: white;
-            border-color: var(--primary);
-        }
-
-        .empty-state {
-            text-align: center;
-            padding: 60px 20px;
-            color: var(--text-muted);
-        }
-
-        .empty-icon {
-            font-size: 4em;
-            margin-bottom: 20px;
-            opacity: 0.5;
-        }
-
-        @media (max-width: 768px) {
-            h1 { font-size: 1.8em; }
-            .stats-container { grid-template-columns: 1fr 1fr; }
-            .btn-container { flex-direction: column; }
-            .results-header { flex-direction: column; align-items: flex-start; }
-            .search-box { width: 100%; }
-        }
     </style>
 </head>
 <body data-theme="{{ default_theme or 'light' }}" data-server-default-theme="{{ default_theme }}">
-    <canvas id="snowCanvas"></canvas>
     <div class="container">
         <div class="header">
             <div class="header-content">
@@ -859,7 +589,7 @@ HTML_TEMPLATE = '''
                         {% if not default_theme %}
                         <button class="theme-toggle" onclick="toggleTheme()" title="Toggle dark/light">🌙</button>
                         {% endif %}
-                        <button class="snow-toggle" id="snowToggle" onclick="toggleSnow()" title="Toggle snow">❄️ Snow</button>
+                        <button class="snow-toggle" id="snowToggle" onclick="toggleSnow()" title="Toggle snow">🌨️ Off</button>
                         <button class="snow-toggle" id="settingsBtn" onclick="openSettings()" title="Settings">⚙️</button>
                         <button class="snow-toggle" id="clearParsedBtn" onclick="clearParsed()" title="Clear parsed previews">🧹 Clear Parsed</button>
                     </div>
@@ -957,6 +687,15 @@ HTML_TEMPLATE = '''
                             <input type="range" id="snowIntensity" min="0" max="200" value="120" style="width:100%">
                         </div>
                     </div>
+                    <div class="row">
+                        <div class="field">
+                            <label><strong>Parallel Uploads</strong></label>
+                            <div class="small">How many upload batches are sent at once (1-8).</div>
+                        </div>
+                        <div style="width:160px; text-align:right">
+                            <input type="number" id="concurrencyInput" min="1" max="8" value="4" style="width:80px; padding:8px; border-radius:8px; border:1px solid var(--border-color)">
+                        </div>
+                    </div>
                     <div class="row">
                         <div class="field">
                             <label><strong>API Key (optional)</strong></label>
@@ -989,10 +728,13 @@ HTML_TEMPLATE = '''
                 <div class="results-header">
                     <div class="results-title">📊 Parsed Results</div>
                     <div class="results-actions">
-                        <input type="text" class="search-box" id="searchBox" placeholder="🔍 Search candidates..." onkeyup="searchTable()">
+                        <input type="text" class="search-box" id="searchBox" placeholder="🔍 Search candidates..." oninput="queueSearch()">
                         <button class="action-btn" onclick="downloadExcel()">
                             💾 Download Excel
                         </button>
+                        <button class="action-btn" onclick="downloadCSV()">
+                            🧾 Download CSV
+                        </button>
                         <button class="action-btn" onclick="downloadJSON()">
                             📋 Download JSON
                         </button>
@@ -1000,10 +742,10 @@ HTML_TEMPLATE = '''
                 </div>
 
                 <div class="filter-tabs" id="filterTabs">
-                    <div class="filter-tab active" onclick="filterResults('all')">All Candidates</div>
-                    <div class="filter-tab" onclick="filterResults('success')">✅ Successful</div>
-                    <div class="filter-tab" onclick="filterResults('failed')">❌ Failed</div>
-                    <div class="filter-tab" onclick="filterResults('incomplete')">⚠️ Incomplete Data</div>
+                    <div class="filter-tab active" data-filter="all">All Candidates</div>
+                    <div class="filter-tab" data-filter="success">✅ Successful</div>
+                    <div class="filter-tab" data-filter="failed">❌ Failed</div>
+                    <div class="filter-tab" data-filter="incomplete">⚠️ Incomplete Data</div>
                 </div>
 
                 <div class="table-responsive">
@@ -1022,6 +764,10 @@ HTML_TEMPLATE = '''
         let parsedData = [];
         let startTime;
         let currentFilter = 'all';
+        // Per-file list elements, captured once by displayFileList()
+        let statusEls = [];
+        let infoEls = [];
+        let progressEls = [];
         
         const fileInput = document.getElementById('fileInput');
         const uploadArea = document.getElementById('uploadArea');
@@ -1035,6 +781,7 @@ HTML_TEMPLATE = '''
         const errorAlert = document.getElementById('errorAlert');
         const warningAlert = document.getElementById('warningAlert');
         const resultsContainer = document.getElementById('resultsContainer');
+        const processingTimeEl = document.getElementById('processingTime');
         
         {% if not default_theme %}
         // Enhanced theme toggle with smooth transition
@@ -1068,6 +815,8 @@ HTML_TEMPLATE = '''
         
         const MAX_UPLOADS = {{max_uploads}};
         const MAX_FILE_SIZE_MB = {{max_file_size_mb}};
+        const MAX_REQUEST_BYTES = {{max_request_bytes}};
+        const EVENTS_ENABLED = {{ 'true' if events_enabled else 'false' }};
 
         // File input change
         fileInput.addEventListener('change', function(e) {
@@ -1089,6 +838,17 @@ HTML_TEMPLATE = '''
             uploadArea.classList.remove('dragover');
             handleFiles(e.dataTransfer.files);
         });
+
+        // One delegated listener each for the (re-rendered) file list and the filter tabs
+        fileList.addEventListener('click', function(e) {
+            const target = e.target.closest('[data-action]');
+            if (target && target.dataset.action === 'clear-all') clearFiles();
+        });
+
+        document.getElementById('filterTabs').addEventListener('click', function(e) {
+            const tab = e.target.closest('.filter-tab');
+            if (tab) filterResults(tab.dataset.filter);
+        });
         
         function handleFiles(files) {
             const all = Array.from(files);
@@ -1131,7 +891,7 @@ HTML_TEMPLATE = '''
         function displayFileList() {
             let html = '<div class="file-list-header">';
             html += '<div class="file-list-title">📁 Selected Files (' + selectedFiles.length + ')</div>';
-            html += '<button class="clear-files" onclick="clearFiles()">Clear All</button>';
+            html += '<button class="clear-files" data-action="clear-all">Clear All</button>';
             html += '</div>';
 
             selectedFiles.forEach((file, index) => {
@@ -1149,6 +909,15 @@ HTML_TEMPLATE = '''
 
             fileList.innerHTML = html;
             fileList.style.display = 'block';
+
+            statusEls = [];
+            infoEls = [];
+            progressEls = [];
+            for (let i = 0; i < selectedFiles.length; i++) {
+                statusEls.push(document.getElementById('status-' + i));
+                infoEls.push(document.getElementById('info-' + i));
+                progressEls.push(document.getElementById('progress-' + i));
+            }
         }
 
         function clearFiles() {
@@ -1196,6 +965,35 @@ HTML_TEMPLATE = '''
             document.getElementById('failedCount').textContent = failed;
         }
         
+        // Aggregate progress is written at most once per animation frame, however
+        // many batches finish within it; only the latest values are kept.
+        let pendingProgress = null;
+        let progressRAF = 0;
+
+        function scheduleProgress(done, total) {
+            pendingProgress = { done: done, total: total };
+            if (!progressRAF) progressRAF = requestAnimationFrame(flushProgress);
+        }
+
+        function flushProgress() {
+            if (progressRAF) cancelAnimationFrame(progressRAF);
+            progressRAF = 0;
+            if (!pendingProgress) return;
+            const { done, total } = pendingProgress;
+            pendingProgress = null;
+            const progress = (done / total) * 100;
+            progressBar.style.width = progress + '%';
+            progressBar.textContent = Math.round(progress) + '%';
+            progressText.textContent = done + '/' + total;
+            updateStats();
+            processingTimeEl.textContent = ((Date.now() - startTime) / 1000).toFixed(1) + 's';
+        }
+
+        function getConcurrency() {
+            const n = parseInt(localStorage.getItem('concurrency') || '4', 10);
+            return Math.min(8, Math.max(1, isNaN(n) ? 4 : n));
+        }
+
         async function parseResumes() {
             if (selectedFiles.length === 0) {
                 showError('Please select at least one resume file');
@@ -1203,46 +1001,140 @@ HTML_TEMPLATE = '''
             }
             
             hideAlerts();
-            resultsContainer.style.display = 'none';
+            parsing = true;
+            syncSnowPause();
             progressContainer.style.display = 'block';
             parseBtn.disabled = true;
             clearBtn.disabled = true;
             
-            parsedData = [];
+            // Results are stored by file index since batches can finish out of order
+            parsedData = new Array(selectedFiles.length);
             let successCount = 0;
             let failedCount = 0;
+            let done = 0;
             startTime = Date.now();
 
-            // Use a single progress display; send one file per request sequentially
-            for (let i = 0; i < selectedFiles.length; i++) {
-                const file = selectedFiles[i];
-                const formData = new FormData();
-                formData.append('files', file);
-
-                // per-file UI elements
-                const statusEl = document.getElementById('status-' + i);
-                const infoEl = document.getElementById('info-' + i);
-                const progressEl = document.getElementById('progress-' + i);
-
-                if (statusEl) {
-                    statusEl.className = 'file-status parsing';
-                    statusEl.innerHTML = '⚡ Parsing...';
+            // Rows are added to the table as each batch comes back, not at the end
+            resultsContainer.style.display = 'block';
+            currentFilter = 'all';
+            updateFilterTabs();
+            renderTable([]);
+
+            // Upload in small batches: each request stays small, the server starts
+            // parsing early, and a network blip only costs one batch. A batch is also
+            // closed early once it would exceed the server's request size cap.
+            const BATCH_SIZE = 8;
+            const BATCH_BYTES = MAX_REQUEST_BYTES * 0.9;
+            const BATCH_PAUSE_MS = 250;
+            // Larger files go alone as the raw request body, which the browser streams
+            // from disk and the server copies to a temp file in chunks
+            const RAW_UPLOAD_BYTES = 2 * 1024 * 1024;
+
+            // Per-file completions arrive over Server-Sent Events while a batch is in flight
+            const jobId = Date.now().toString(36) + Math.random().toString(36).slice(2, 10);
+            let events = null;
+            if (EVENTS_ENABLED && window.EventSource) {
+                events = new EventSource('/events/' + jobId + '?total=' + selectedFiles.length);
+                // The server ends the stream with 'done'; closing stops EventSource reconnecting
+                events.addEventListener('done', () => events.close());
+                events.onmessage = (e) => {
+                    const msg = JSON.parse(e.data);
+                    const statusEl = statusEls[msg.index];
+                    const progressEl = progressEls[msg.index];
+                    if (statusEl && statusEl.classList.contains('parsing')) statusEl.innerHTML = '⏳ Finishing...';
+                    if (progressEl) progressEl.style.width = '90%';
+                };
+                await new Promise(r => { events.onopen = r; setTimeout(r, 500); });
+            }
+            const errorRow = (name) => ({
+                full_name: 'Error: ' + name,
+                email: null,
+                phone_number: null,
+                alternate_phone_number: null,
+                highest_qualification: null,
+                years_of_experience: null,
+                current_company: null,
+                current_designation: null,
+                city: null,
+                state: null
+            });
+
+            // Keep several batch requests in flight to hide per-request latency
+            const concurrency = getConcurrency();
+            const batches = [];
+            let current = null;
+            selectedFiles.forEach((file, i) => {
+                if (file.size > RAW_UPLOAD_BYTES) {
+                    batches.push({ start: i, end: i + 1, raw: true });
+                    current = null;
+                    return;
+                }
+                if (!current || current.end - current.start === BATCH_SIZE || current.bytes + file.size > BATCH_BYTES) {
+                    current = { start: i, end: i, bytes: 0 };
+                    batches.push(current);
+                }
+                current.end = i + 1;
+                current.bytes += file.size;
+            });
+            let nextBatch = 0;
+
+            const runBatch = async ({ start, end, raw }) => {
+                const batch = selectedFiles.slice(start, end);
+                let body = batch[0];
+                if (!raw) {
+                    body = new FormData();
+                    batch.forEach(file => body.append('files', file));
                 }
-                if (progressEl) progressEl.style.width = '50%';
+                batch.forEach((file, offset) => {
+                    const statusEl = statusEls[start + offset];
+                    const progressEl = progressEls[start + offset];
+                    if (statusEl) {
+                        statusEl.className = 'file-status parsing';
+                        statusEl.innerHTML = '⚡ Parsing...';
+                    }
+                    if (progressEl) progressEl.style.width = '50%';
+                });
 
+                let batchResults = null;
+                let batchError = null;
                 try {
                     // include optional per-request API key and model
                     const headers = {};
                     const storedKey = sessionStorage.getItem('GROK_API_KEY');
                     if (document.getElementById('llmToggle').checked && storedKey) headers['X-API-KEY'] = storedKey;
                     headers['X-MODEL'] = document.getElementById('modelSelect').value || 'gpt-4o-mini';
+                    if (raw) {
+                        headers['Content-Type'] = 'application/octet-stream';
+                        headers['X-Filename'] = encodeURIComponent(batch[0].name);
+                    }
 
-                    const response = await fetch('/parse', { method: 'POST', body: formData, headers: headers });
+                    const response = await fetch('/parse?job=' + jobId + '&offset=' + start, { method: 'POST', body: body, headers: headers });
                     if (!response.ok) throw new Error('Failed to parse');
 
                     const data = await response.json();
-                    const result = data.results[0];
-                    parsedData.push(result);
+                    batchResults = data.results || [];
+                } catch (error) {
+                    batchError = error;
+                }
+
+                batch.forEach((file, offset) => {
+                    const i = start + offset;
+                    const statusEl = statusEls[i];
+                    const infoEl = infoEls[i];
+                    const progressEl = progressEls[i];
+                    const result = batchResults ? batchResults[offset] : null;
+
+                    if (!result) {
+                        parsedData[i] = errorRow(file.name);
+                        failedCount++;
+                        const message = batchError ? batchError.message : 'No result returned';
+                        if (infoEl) infoEl.innerHTML = '<div class="file-name">Parsing error</div><div class="small">' + message + '</div>';
+                        if (statusEl) { statusEl.className = 'file-status failed'; statusEl.innerHTML = '❌ Failed'; }
+                        if (progressEl) progressEl.style.width = '100%';
+                        return;
+                    }
+
+                    parsedData[i] = result;
 
                     // replace file info with parsed data
                     if (infoEl) {
@@ -1269,45 +1161,37 @@ HTML_TEMPLATE = '''
                     }
 
                     if (progressEl) progressEl.style.width = '100%';
-
-                } catch (error) {
-                    parsedData.push({
-                        full_name: 'Error: ' + file.name,
-                        email: null,
-                        phone_number: null,
-                        alternate_phone_number: null,
-                        highest_qualification: null,
-                        years_of_experience: null,
-                        current_company: null,
-                        current_designation: null,
-                        city: null,
-                        state: null
-                    });
-                    failedCount++;
-                    if (infoEl) infoEl.innerHTML = '<div class="file-name">Parsing error</div><div class="small">' + error.message + '</div>';
-                    if (statusEl) { statusEl.className = 'file-status failed'; statusEl.innerHTML = '❌ Failed'; }
-                    if (progressEl) progressEl.style.width = '100%';
+                });
+                parsedVersion++;
+                renderTable(rowsForFilter(currentFilter), true);
+
+                done += batch.length;
+                scheduleProgress(done, selectedFiles.length);
+            };
+
+            const worker = async () => {
+                let b;
+                while ((b = nextBatch++) < batches.length) {
+                    await runBatch(batches[b]);
+                    if (nextBatch < batches.length) {
+                        await new Promise(r => setTimeout(r, BATCH_PAUSE_MS));
+                    }
                 }
-
-                // Update aggregate progress
-                const progress = ((i + 1) / selectedFiles.length) * 100;
-                progressBar.style.width = progress + '%';
-                progressBar.textContent = Math.round(progress) + '%';
-                progressText.textContent = (i + 1) + '/' + selectedFiles.length;
-
-                // Update counts and elapsed time
-                updateStats();
-                const elapsed = ((Date.now() - startTime) / 1000).toFixed(1);
-                document.getElementById('processingTime').textContent = elapsed + 's';
-            }
+            };
+            await Promise.all(Array.from({ length: Math.min(concurrency, batches.length) }, worker));
             
+            if (events) events.close();
+            flushProgress();
+            parsing = false;
+            syncSnowPause();
+
             // Complete
             progressBar.classList.add('complete');
             parseBtn.disabled = false;
             clearBtn.disabled = false;
             
             const totalTime = ((Date.now() - startTime) / 1000).toFixed(1);
-            document.getElementById('processingTime').textContent = totalTime + 's';
+            processingTimeEl.textContent = totalTime + 's';
             
             // Show results
             if (successCount > 0) {
@@ -1317,144 +1201,240 @@ HTML_TEMPLATE = '''
             if (failedCount > 0) {
                 showWarning('⚠️ ' + failedCount + ' resume(s) failed to parse. Check the file list for details.');
             }
-            
-            if (parsedData.length > 0) {
-                displayResults(parsedData);
+
+            updateFilterTabs();
+        }
+
+        // Results table is virtualised: only rows near the viewport exist in the DOM,
+        // with spacer rows standing in for everything above and below.
+        const TABLE_COLUMNS = 12;
+        const ROW_OVERSCAN = 10;
+        let baseRows = [];      // rows for the active filter tab
+        let tableRows = [];     // baseRows narrowed by the search box
+        let rowHeight = 0;      // measured from the first rendered row
+        let renderedRange = [-1, -1];
+        let scrollRAF = 0;
+
+        // keepScroll leaves the scroll position alone, for rows arriving mid-parse
+        function renderTable(results, keepScroll) {
+            baseRows = results;
+            tableRows = applySearch(baseRows, document.getElementById('searchBox').value.toLowerCase());
+            const table = document.getElementById('resultsTable');
+            if (!table.tHead) {
+                let head = '<thead><tr>';
+                head += '<th>#</th>';
+                head += '<th>Status</th>';
+                head += '<th>Full Name</th>';
+                head += '<th>Email</th>';
+                head += '<th>Phone Number</th>';
+                head += '<th>Alt. Phone</th>';
+                head += '<th>Qualification</th>';
+                head += '<th>Experience (Yrs)</th>';
+                head += '<th>Current Company</th>';
+                head += '<th>Designation</th>';
+                head += '<th>City</th>';
+                head += '<th>State</th>';
+                head += '</tr></thead><tbody></tbody>';
+                table.innerHTML = head;
+                table.parentElement.addEventListener('scroll', onTableScroll, { passive: true });
+            }
+            if (!keepScroll) table.parentElement.scrollTop = 0;
+            renderedRange = [-1, -1];
+            renderVisibleRows();
+        }
+
+        function onTableScroll() {
+            if (scrollRAF) return;
+            scrollRAF = requestAnimationFrame(() => { scrollRAF = 0; renderVisibleRows(); });
+        }
+
+        // Row markup is parsed once; each rendered row is a clone filled via textContent
+        const RESULT_FIELDS = ['full_name', 'email', 'phone_number', 'alternate_phone_number',
+                               'highest_qualification', 'years_of_experience', 'current_company',
+                               'current_designation', 'city', 'state'];
+        const rowTpl = document.createElement('template');
+        rowTpl.innerHTML = '<tr>' + '<td></td>'.repeat(TABLE_COLUMNS) + '</tr>'
+            + '<span class="null-value">-</span>'
+            + '<span style="color: var(--danger);">❌ Failed</span>'
+            + '<span style="color: var(--warning);">⚠️ Incomplete</span>'
+            + '<span style="color: var(--success);">✅ Success</span>';
+        const [ROW_NODE, NULL_NODE, FAILED_NODE, INCOMPLETE_NODE, SUCCESS_NODE] = rowTpl.content.children;
+
+        function spacerRow(height) {
+            const tr = document.createElement('tr');
+            tr.className = 'spacer-row';
+            const td = document.createElement('td');
+            td.colSpan = TABLE_COLUMNS;
+            td.style.height = height + 'px';
+            tr.appendChild(td);
+            return tr;
+        }
+
+        function renderVisibleRows() {
+            const table = document.getElementById('resultsTable');
+            const wrap = table.parentElement;
+            const total = tableRows.length;
+            const rh = rowHeight || 48;
+            // The wrapper is capped at 70vh, so the window height bounds the visible rows
+            const viewport = window.innerHeight;
+            const start = Math.max(0, Math.floor(wrap.scrollTop / rh) - ROW_OVERSCAN);
+            const end = Math.min(total, start + Math.ceil(viewport / rh) + 2 * ROW_OVERSCAN);
+            if (start === renderedRange[0] && end === renderedRange[1]) return;
+            renderedRange = [start, end];
+
+            const fragment = document.createDocumentFragment();
+            if (start > 0) fragment.appendChild(spacerRow(start * rh));
+            for (let idx = start; idx < end; idx++) {
+                fragment.appendChild(buildRow(tableRows[idx], idx));
+            }
+            if (end < total) fragment.appendChild(spacerRow((total - end) * rh));
+            table.tBodies[0].replaceChildren(fragment);
+
+            if (!rowHeight && end > start) {
+                const first = table.tBodies[0].querySelector('tr:not(.spacer-row)');
+                if (first && first.offsetHeight) {
+                    rowHeight = first.offsetHeight;
+                    renderedRange = [-1, -1];
+                    renderVisibleRows();
+                }
+            }
+        }
+
+        function fillCell(td, value) {
+            if (value === null || value === undefined || value === '') {
+                td.appendChild(NULL_NODE.cloneNode(true));
+            } else {
+                td.textContent = value;
             }
         }
-        
-        function displayResults(results) {
-            resultsContainer.style.display = 'block';
-            currentFilter = 'all';
-            updateFilterTabs();
-            renderTable(results);
+
+        const STATUS_NODES = { failed: FAILED_NODE, incomplete: INCOMPLETE_NODE, success: SUCCESS_NODE };
+
+        function buildRow(row, idx) {
+            const tr = ROW_NODE.cloneNode(true);
+            const cells = tr.children;
+
+            cells[0].textContent = idx + 1;
+            cells[1].appendChild(STATUS_NODES[rowStatus(row)].cloneNode(true));
+
+            const link = row.original_link || row.file_link;
+            if (link) {
+                const a = document.createElement('a');
+                a.href = link;
+                a.target = '_blank';
+                a.textContent = row.full_name || '-';
+                cells[2].appendChild(a);
+            } else {
+                fillCell(cells[2], row.full_name);
+            }
+            for (let c = 1; c < RESULT_FIELDS.length; c++) {
+                fillCell(cells[c + 2], row[RESULT_FIELDS[c]]);
+            }
+            return tr;
         }
 
-        function renderTable(results) {
-            let html = '<thead><tr>';
-            html += '<th>#</th>';
-            html += '<th>Status</th>';
-            html += '<th>Full Name</th>';
-            html += '<th>Email</th>';
-            html += '<th>Phone Number</th>';
-            html += '<th>Alt. Phone</th>';
-            html += '<th>Qualification</th>';
-            html += '<th>Experience (Yrs)</th>';
-            html += '<th>Current Company</th>';
-            html += '<th>Designation</th>';
-            html += '<th>City</th>';
-                html += '<th>State</th>';
-            
-            html += '</tr></thead><tbody>';
-            
-            results.forEach((row, idx) => {
-                const isFailed = row.full_name?.startsWith('Error:');
-                const isIncomplete = !isFailed && countNullFields(row) > 5;
-                
-                html += '<tr>';
-                html += '<td>' + (idx + 1) + '</td>';
-                
-                if (isFailed) {
-                    html += '<td><span style="color: var(--danger);">❌ Failed</span></td>';
-                } else if (isIncomplete) {
-                    html += '<td><span style="color: var(--warning);">⚠️ Incomplete</span></td>';
-                } else {
-                    html += '<td><span style="color: var(--success);">✅ Success</span></td>';
-                }
-                
-                let nameCell = formatValue(row.full_name);
-                if (row.original_link) {
-                    nameCell = '<a href="' + row.original_link + '" target="_blank">' + (row.full_name || '-') + '</a>';
-                } else if (row.file_link) {
-                    nameCell = '<a href="' + row.file_link + '" target="_blank">' + (row.full_name || '-') + '</a>';
-                }
-                html += '<td>' + nameCell + '</td>';
-                html += '<td>' + formatValue(row.email) + '</td>';
-                html += '<td>' + formatValue(row.phone_number) + '</td>';
-                html += '<td>' + formatValue(row.alternate_phone_number) + '</td>';
-                html += '<td>' + formatValue(row.highest_qualification) + '</td>';
-                html += '<td>' + formatValue(row.years_of_experience) + '</td>';
-                html += '<td>' + formatValue(row.current_company) + '</td>';
-                html += '<td>' + formatValue(row.current_designation) + '</td>';
-                html += '<td>' + formatValue(row.city) + '</td>';
-                html += '<td>' + formatValue(row.state) + '</td>';
-                
-                        html += '</tr>';
-            });
-            
-            html += '</tbody>';
-            document.getElementById('resultsTable').innerHTML = html;
+        // Lower-cased searchable text, computed once per parsed row
+        const searchText = new WeakMap();
+
+        function rowSearchText(row) {
+            let text = searchText.get(row);
+            if (text === undefined) {
+                text = RESULT_FIELDS.map(f => row[f] ?? '').join(' ').toLowerCase();
+                searchText.set(row, text);
+            }
+            return text;
         }
 
-        
+        function applySearch(rows, query) {
+            if (!query) return rows;
+            const matches = [];
+            for (let i = 0, n = rows.length; i < n; i++) {
+                if (rowSearchText(rows[i]).includes(query)) matches.push(rows[i]);
+            }
+            return matches;
+        }
 
         function countNullFields(row) {
             let count = 0;
-            for (let key in row) {
-                if (row[key] === null || row[key] === undefined || row[key] === '') {
-                    count++;
-                }
+            for (let i = 0; i < RESULT_FIELDS.length; i++) {
+                const value = row[RESULT_FIELDS[i]];
+                if (value === null || value === undefined || value === '') count++;
             }
             return count;
         }
-        
-        function formatValue(value) {
-            if (value === null || value === undefined || value === '') {
-                return '<span class="null-value">-</span>';
+
+        // 'failed' | 'incomplete' | 'success', computed once per parsed row. Kept off
+        // the row object itself so it never ends up in exports.
+        const statusCache = new WeakMap();
+
+        function rowStatus(row) {
+            let status = statusCache.get(row);
+            if (status === undefined) {
+                status = row.full_name?.startsWith('Error:') ? 'failed'
+                    : countNullFields(row) > 5 ? 'incomplete' : 'success';
+                statusCache.set(row, status);
+            }
+            return status;
+        }
+
+        // Rows split by filter tab in one pass, rebuilt only when parsedData changes
+        // (a new array, or parsedVersion bumped after a batch), so switching tabs
+        // just hands a ready list to the virtualised table.
+        let parsedVersion = 0;
+        let rowGroups = { data: null, version: -1, lists: null };
+
+        function rowsForFilter(type) {
+            if (rowGroups.data !== parsedData || rowGroups.version !== parsedVersion) {
+                const lists = { all: [], success: [], failed: [], incomplete: [] };
+                for (let i = 0, n = parsedData.length; i < n; i++) {
+                    const row = parsedData[i];
+                    if (!row) continue;  // batch still in flight
+                    lists.all.push(row);
+                    lists[rowStatus(row)].push(row);
+                }
+                rowGroups = { data: parsedData, version: parsedVersion, lists: lists };
             }
-            return value;
+            return rowGroups.lists[type] || rowGroups.lists.all;
         }
 
         function filterResults(type) {
             currentFilter = type;
             updateFilterTabs();
-            
-            let filtered = parsedData;
-            
-            if (type === 'success') {
-                filtered = parsedData.filter(d => !d.full_name?.startsWith('Error:') && countNullFields(d) <= 5);
-            } else if (type === 'failed') {
-                filtered = parsedData.filter(d => d.full_name?.startsWith('Error:'));
-            } else if (type === 'incomplete') {
-                filtered = parsedData.filter(d => !d.full_name?.startsWith('Error:') && countNullFields(d) > 5);
-            }
-            
-            renderTable(filtered);
+            renderTable(rowsForFilter(type));
         }
 
         function updateFilterTabs() {
-            const tabs = document.querySelectorAll('.filter-tab');
-            tabs.forEach((tab, idx) => {
-                tab.classList.remove('active');
-                const filters = ['all', 'success', 'failed', 'incomplete'];
-                if (filters[idx] === currentFilter) {
-                    tab.classList.add('active');
-                }
+            document.querySelectorAll('.filter-tab').forEach(tab => {
+                tab.classList.toggle('active', tab.dataset.filter === currentFilter);
             });
         }
 
+        // Keystrokes only schedule a search; it runs at most once per animation frame
+        let searchRAF = 0;
+
+        function queueSearch() {
+            if (searchRAF) return;
+            searchRAF = requestAnimationFrame(() => { searchRAF = 0; searchTable(); });
+        }
+
         function searchTable() {
-            const input = document.getElementById('searchBox').value.toLowerCase();
-            const table = document.getElementById('resultsTable');
-            const rows = table.getElementsByTagName('tr');
-            
-            for (let i = 1; i < rows.length; i++) {
-                const row = rows[i];
-                const text = row.textContent.toLowerCase();
-                
-                if (text.includes(input)) {
-                    row.style.display = '';
-                } else {
-                    row.style.display = 'none';
-                }
-            }
+            // Off-screen rows are not in the DOM, so search filters the data instead
+            renderTable(baseRows);
         }
         
         async function downloadExcel() {
+            await downloadExport('/export', 'xlsx', 'Excel');
+        }
+
+        async function downloadCSV() {
+            await downloadExport('/export.csv', 'csv', 'CSV');
+        }
+
+        async function downloadExport(endpoint, extension, label) {
             if (parsedData.length === 0) return;
             
             try {
-                const response = await fetch('/export', {
+                const response = await fetch(endpoint, {
                     method: 'POST',
                     headers: {
                         'Content-Type': 'application/json',
@@ -1463,32 +1443,39 @@ HTML_TEMPLATE = '''
                 });
                 
                 if (!response.ok) {
-                    throw new Error('Failed to export to Excel');
+                    throw new Error('Failed to export to ' + label);
                 }
                 
                 const blob = await response.blob();
                 const url = window.URL.createObjectURL(blob);
                 const a = document.createElement('a');
                 a.href = url;
-                a.download = 'parsed_resumes_' + new Date().getTime() + '.xlsx';
+                a.download = 'parsed_resumes_' + new Date().getTime() + '.' + extension;
                 document.body.appendChild(a);
                 a.click();
                 document.body.removeChild(a);
                 window.URL.revokeObjectURL(url);
                 
-                showSuccess('📥 Excel file downloaded successfully!');
+                showSuccess('📥 ' + label + ' file downloaded successfully!');
                 
             } catch (error) {
-                showError('Error downloading Excel: ' + error.message);
+                showError('Error downloading ' + label + ': ' + error.message);
             }
         }
 
+        // Last JSON export, reused while parsedData is the same array with the same rows filled
+        let jsonExport = { data: null, filled: -1, blob: null };
+
         async function downloadJSON() {
             if (parsedData.length === 0) return;
             
             try {
-                const dataStr = JSON.stringify(parsedData, null, 2);
-                const blob = new Blob([dataStr], { type: 'application/json' });
+                const filled = parsedData.filter(Boolean).length;
+                if (jsonExport.data !== parsedData || jsonExport.filled !== filled) {
+                    const dataStr = JSON.stringify(parsedData, null, 2);
+                    jsonExport = { data: parsedData, filled: filled, blob: new Blob([dataStr], { type: 'application/json' }) };
+                }
+                const blob = jsonExport.blob;
                 const url = window.URL.createObjectURL(blob);
                 const a = document.createElement('a');
                 a.href = url;
@@ -1543,6 +1530,7 @@ HTML_TEMPLATE = '''
             document.getElementById('snowIntensity').value = snowVal;
             const llm = localStorage.getItem('use_llm') === '1';
             document.getElementById('llmToggle').checked = llm;
+            document.getElementById('concurrencyInput').value = getConcurrency();
         }
 
         function closeSettings() {
@@ -1557,6 +1545,7 @@ HTML_TEMPLATE = '''
             localStorage.setItem('model', model);
             localStorage.setItem('snow-intensity', snowVal);
             localStorage.setItem('use_llm', use_llm ? '1' : '0');
+            localStorage.setItem('concurrency', document.getElementById('concurrencyInput').value);
             if (use_llm && key) {
                 // store in session for server requests
                 sessionStorage.setItem('GROK_API_KEY', key);
@@ -1573,17 +1562,19 @@ HTML_TEMPLATE = '''
             localStorage.removeItem('model');
             localStorage.removeItem('snow-intensity');
             localStorage.removeItem('use_llm');
+            localStorage.removeItem('concurrency');
             sessionStorage.removeItem('GROK_API_KEY');
             showSuccess('Settings reset');
         }
 
         
 
+        const SAMPLE_TEXT = `John Doe\njohn.doe@example.com\n+1 (555) 123-4567\n\nExperience\nSenior Developer at Acme Corp, Jan 2020 - Present\n\nEducation\nMaster of Science in Computer Science\n\n6 years of experience\n\nSpringfield, Illinois`;
+        let sampleUrl = null;  // created on first use and kept; the content never changes
+
         function downloadSample() {
-            const sample = `John Doe\njohn.doe@example.com\n+1 (555) 123-4567\n\nExperience\nSenior Developer at Acme Corp, Jan 2020 - Present\n\nEducation\nMaster of Science in Computer Science\n\n6 years of experience\n\nSpringfield, Illinois`;
-            const blob = new Blob([sample], {type:'text/plain'});
-            const url = URL.createObjectURL(blob);
-            const a = document.createElement('a'); a.href = url; a.download = 'sample_resume.txt'; a.click(); URL.revokeObjectURL(url);
+            if (!sampleUrl) sampleUrl = URL.createObjectURL(new Blob([SAMPLE_TEXT], {type:'text/plain'}));
+            const a = document.createElement('a'); a.href = sampleUrl; a.download = 'sample_resume.txt'; a.click();
         }
 
         // Preview modal
@@ -1597,83 +1588,81 @@ HTML_TEMPLATE = '''
         }
         
         // --- Snow animation ---
-        let snowEnabled = true;
+        // Off by default; the full-viewport canvas only exists while snow is on.
+        // Where supported the animation runs in a worker on an OffscreenCanvas;
+        // otherwise static/snow.js is loaded and drives the canvas here.
+        const SNOW_JS_URL = '{{ snow_js_url }}';
+        const SNOW_WORKER_URL = '{{ snow_worker_url }}';
+        let snowEnabled = false;
+        const reducedMotion = window.matchMedia && window.matchMedia('(prefers-reduced-motion: reduce)').matches;
         let snowCanvas = null;
-        let ctx = null;
-        let flakes = [];
-        let snowAnimId = null;
-
-        function initSnowCanvas() {
-            snowCanvas = document.getElementById('snowCanvas');
-            if (!snowCanvas) {
-                snowCanvas = document.createElement('canvas');
-                snowCanvas.id = 'snowCanvas';
-                document.body.insertBefore(snowCanvas, document.body.firstChild);
-            }
-            ctx = snowCanvas.getContext ? snowCanvas.getContext('2d') : null;
-            resizeSnow();
-        }
-
-        function resizeSnow() {
-            if (!snowCanvas) return;
-            snowCanvas.width = window.innerWidth;
-            snowCanvas.height = window.innerHeight;
-        }
-
-        function createFlakes(count) {
-            flakes = [];
-            for (let i = 0; i < count; i++) {
-                flakes.push({
-                    x: Math.random() * snowCanvas.width,
-                    y: Math.random() * snowCanvas.height,
-                    r: 1 + Math.random() * 4,
-                    d: 0.5 + Math.random() * 1.5
-                });
-            }
-        }
-
-        function drawSnow() {
-            if (!ctx || !snowEnabled) return;
-            ctx.clearRect(0, 0, snowCanvas.width, snowCanvas.height);
-            for (let i = 0; i < flakes.length; i++) {
-                const f = flakes[i];
-                ctx.beginPath();
-                ctx.fillStyle = 'rgba(255,255,255,' + (0.6 + Math.random()*0.35) + ')';
-                ctx.arc(f.x, f.y, f.r, 0, Math.PI * 2, true);
-                ctx.fill();
-            }
-            updateFlakes();
+        let snowWorker = null;
+        let snowField = null;
+        // Snow holds still while the tab is hidden or a parse is running
+        let snowPaused = false;
+        let parsing = false;
+
+        function snowCount() {
+            return Math.max(120, Math.floor(window.innerWidth / 12));
+        }
+
+        function loadSnowScript() {
+            return new Promise((resolve, reject) => {
+                if (window.SnowField) return resolve();
+                const script = document.createElement('script');
+                script.src = SNOW_JS_URL;
+                script.onload = resolve;
+                script.onerror = reject;
+                document.head.appendChild(script);
+            });
         }
 
-        function updateFlakes() {
-            for (let i = 0; i < flakes.length; i++) {
-                const f = flakes[i];
-                f.y += Math.pow(f.d, 1.2) + 0.3 + f.r * 0.08;
-                f.x += Math.sin(f.y * 0.01) * (0.5 + f.r * 0.02);
-
-                if (f.y > snowCanvas.height + 10) {
-                    flakes[i] = { x: Math.random() * snowCanvas.width, y: -10 - Math.random()*50, r: f.r, d: f.d };
-                }
+        async function startSnow() {
+            if (snowCanvas) return;
+            const canvas = document.createElement('canvas');
+            canvas.id = 'snowCanvas';
+            document.body.insertBefore(canvas, document.body.firstChild);
+            snowCanvas = canvas;
+            const width = window.innerWidth;
+            const height = window.innerHeight;
+            if (canvas.transferControlToOffscreen && window.Worker) {
+                const offscreen = canvas.transferControlToOffscreen();
+                snowWorker = new Worker(SNOW_WORKER_URL);
+                snowWorker.postMessage({ type: 'init', canvas: offscreen, width: width, height: height, count: snowCount(), paused: snowPaused }, [offscreen]);
+            } else {
+                try { await loadSnowScript(); } catch (e) { return; }
+                // Snow may have been switched off while the script loaded
+                if (snowCanvas !== canvas || !canvas.getContext) return;
+                snowField = new SnowField(canvas.getContext('2d'), width, height, snowCount());
+                snowField.resize(width, height);
+                if (!snowPaused) snowField.start();
             }
         }
 
-        function animateSnow() {
-            drawSnow();
-            snowAnimId = requestAnimationFrame(animateSnow);
+        function syncSnowPause() {
+            const paused = document.hidden || parsing;
+            if (paused === snowPaused) return;
+            snowPaused = paused;
+            if (snowWorker) snowWorker.postMessage({ type: paused ? 'pause' : 'resume' });
+            else if (snowField && paused) snowField.pause();
+            else if (snowField) snowField.start();
         }
 
-        function startSnow() {
-            if (!snowCanvas || !ctx) initSnowCanvas();
-            if (!ctx) return;
-            resizeSnow();
-            createFlakes(Math.max(120, Math.floor(window.innerWidth / 12)));
-            if (!snowAnimId) animateSnow();
+        function resizeSnow() {
+            const width = window.innerWidth;
+            const height = window.innerHeight;
+            if (snowWorker) snowWorker.postMessage({ type: 'resize', width: width, height: height });
+            else if (snowField) snowField.resize(width, height);
         }
 
         function stopSnow() {
-            if (snowAnimId) cancelAnimationFrame(snowAnimId);
-            snowAnimId = null;
-            if (ctx && snowCanvas) ctx.clearRect(0, 0, snowCanvas.width, snowCanvas.height);
+            if (snowWorker) snowWorker.terminate();
+            if (snowField) snowField.stop();
+            snowWorker = null;
+            snowField = null;
+            // Drop the overlay entirely so the compositor has no extra layer to blend
+            if (snowCanvas) snowCanvas.remove();
+            snowCanvas = null;
         }
 
         function toggleSnow() {
@@ -1690,21 +1679,56 @@ HTML_TEMPLATE = '''
         window.toggleSnow = toggleSnow;
 
         window.addEventListener('resize', function() { if (snowEnabled) resizeSnow(); });
+        document.addEventListener('visibilitychange', syncSnowPause);
         window.addEventListener('DOMContentLoaded', function() {
-            const saved = localStorage.getItem('snow');
-            if (saved === '0') {
-                snowEnabled = false;
-                const btn = document.getElementById('snowToggle'); if (btn) btn.textContent = '🌨️ Off';
-            } else {
+            // Only an explicit opt-in turns snow on, and never under reduced motion
+            if (localStorage.getItem('snow') === '1' && !reducedMotion) {
                 snowEnabled = true;
+                const btn = document.getElementById('snowToggle'); if (btn) btn.textContent = '❄️ Snow';
+                startSnow();
             }
-            if (snowEnabled) startSnow();
         });
     </script>
 </body>
 </html>
 '''
 
+# Compile the page template once at import; the index view only renders it.
+_INDEX_TPL = app.jinja_env.from_string(HTML_TEMPLATE)
+
+
+def _static_version(*filenames: str) -> str:
+    """Short content hash of one or more static files, used as a cache-busting query param."""
+    digest = hashlib.sha1()
+    try:
+        for filename in filenames:
+            with open(os.path.join(app.static_folder, filename), 'rb') as fh:
+                digest.update(fh.read())
+    except OSError:
+        return '0'
+    return digest.hexdigest()[:12]
+
+
+_CSS_VERSION = _static_version('app.css')
+# The worker imports snow.js with its own query string, so both share one version
+_SNOW_VERSION = _static_version('snow.js', 'snow-worker.js')
+
+# Rendered index pages keyed by (default_theme, max_uploads, max_file_size_mb).
+# The page only depends on these three values, so each variant is rendered and
+# pre-compressed once; requests then just pick the best encoding.
+_INDEX_CACHE = {}
+
+
+def _build_index_variants(html: bytes) -> dict:
+    """Return the rendered page in every Content-Encoding we can serve."""
+    # Insertion order is the server preference when the client accepts both.
+    variants = {}
+    if brotli is not None:
+        variants['br'] = brotli.compress(html, quality=11, mode=brotli.MODE_TEXT)
+    variants['gzip'] = gzip.compress(html, compresslevel=9)
+    return variants
+
+
 @app.route('/')
 def index():
     max_uploads = int(os.getenv('PARSE_MAX_UPLOADS', '500'))
@@ -1712,18 +1736,77 @@ def index():
     # Allow enforcing a default theme via DEFAULT_THEME env var ('dark' or 'light')
     raw_theme = os.getenv('DEFAULT_THEME', '').lower()
     default_theme = raw_theme if raw_theme in ('dark', 'light') else ''
-    return render_template_string(
-        HTML_TEMPLATE,
-        max_uploads=max_uploads,
-        max_file_size_mb=max_file_size_mb,
-        default_theme=default_theme
-    )
+
+    key = (default_theme, max_uploads, max_file_size_mb)
+    entry = _INDEX_CACHE.get(key)
+    if entry is None:
+        html = _INDEX_TPL.render(
+            css_url=url_for('static', filename='app.css', v=_CSS_VERSION),
+            snow_js_url=url_for('static', filename='snow.js', v=_SNOW_VERSION),
+            snow_worker_url=url_for('static', filename='snow-worker.js', v=_SNOW_VERSION),
+            max_uploads=max_uploads,
+            max_file_size_mb=max_file_size_mb,
+            max_request_bytes=_MAX_REQUEST_BYTES,
+            events_enabled=_EVENTS_ENABLED,
+            default_theme=default_theme
+        ).encode('utf-8')
+        entry = (html, _build_index_variants(html))
+        _INDEX_CACHE[key] = entry
+
+    html, variants = entry
+    encoding = request.accept_encodings.best_match(list(variants))
+    body = variants[encoding] if encoding else html
+
+    response = Response(body, mimetype='text/html')
+    response.headers['Vary'] = 'Accept-Encoding'
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    return response
+
+# Unique prefix for stored originals: nanosecond clock plus a process-wide counter,
+# so names never collide under concurrency and no strftime runs per file
+_FNAME_COUNTER = itertools.count()
+
+
+def _unique_prefix():
+    return f'{time.time_ns()}_{next(_FNAME_COUNTER)}'
+
+
+_PREVIEW_MAX_CHARS = 1024 * 500  # limit preview size to prevent disk exhaustion
+
+
+def _write_preview(uploads_dir, content):
+    """
+    Store the text preview under the SHA-256 of its contents and return the file
+    name. Previews are content-addressed, so re-uploads and duplicate resumes
+    reuse the file already on disk instead of writing up to 500 KB again; new
+    ones are written to a temp file and renamed so a concurrent reader never
+    sees a partial preview.
+    """
+    text = content[:_PREVIEW_MAX_CHARS]
+    data = text.encode('utf-8', 'replace')
+    text_fname = hashlib.sha256(data).hexdigest() + '.txt'
+    text_path = os.path.join(uploads_dir, text_fname)
+    if not os.path.exists(text_path):
+        fd, tmp_path = tempfile.mkstemp(dir=uploads_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as tf:
+                tf.write(data)
+            os.replace(tmp_path, text_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    return text_fname
+
 
 @app.route('/parse', methods=['POST'])
 def parse():
     """Parse resume files with security validation"""
     try:
-        files = request.files.getlist('files')
+        if request.mimetype == 'application/octet-stream':
+            files = [_raw_upload()]
+        else:
+            files = request.files.getlist('files')
         if not files:
             return jsonify({'error': 'No files uploaded'}), 400
         
@@ -1746,10 +1829,8 @@ def parse():
             if ext not in valid_extensions:
                 return jsonify({'error': f'Invalid file type: {ext}. Allowed: {", ".join(valid_extensions)}'}), 400
             
-            # Check file size (in-memory)
-            file.seek(0, os.SEEK_END)
-            file_size = file.tell()
-            file.seek(0)
+            # Check file size
+            file_size = _upload_size(file)
             if file_size > max_size:
                 return jsonify({'error': f'File too large (max: {max_size / (1024*1024):.0f} MB)'}), 400
             elif file_size == 0:
@@ -1764,44 +1845,38 @@ def parse():
         if req_model and req_model not in allowed_models:
             req_model = 'gpt-4o-mini'
 
-        uploads_dir = os.path.join(os.getcwd(), 'uploads')
-        originals_dir = os.path.join(uploads_dir, 'originals')
-        
-        # Verify directories are within cwd (path traversal protection)
-        try:
-            uploads_dir = os.path.realpath(uploads_dir)
-            originals_dir = os.path.realpath(originals_dir)
-            if not uploads_dir.startswith(os.path.realpath(os.getcwd())):
-                raise ValueError('Invalid uploads directory')
-            if not originals_dir.startswith(os.path.realpath(os.getcwd())):
-                raise ValueError('Invalid originals directory')
-        except (ValueError, OSError) as e:
-            return jsonify({'error': 'Invalid directory configuration'}), 500
-        
-        os.makedirs(uploads_dir, exist_ok=True)
+        # Resolved once at import; see _UPLOADS_ROOT
+        uploads_dir = _UPLOADS_ROOT
+        originals_dir = _ORIGINALS_ROOT
         os.makedirs(originals_dir, exist_ok=True)
 
         # batching and concurrency settings
         batch_size = int(os.getenv('PARSE_BATCH_SIZE', '50'))
-        workers = int(os.getenv('PARSE_WORKERS', '4'))
         llm_concurrency = int(os.getenv('PARSE_LLM_CONCURRENCY', '2'))
         save_originals = os.getenv('STORE_ORIGINALS', '0') == '1'
 
         llm_sema = threading.Semaphore(llm_concurrency)
 
+        # Optional per-file progress for a client listening on /events/<job>
+        progress = _progress_queue(request.args.get('job', ''))
+        try:
+            progress_offset = max(0, int(request.args.get('offset', '0')))
+        except ValueError:
+            progress_offset = 0
+
         results = [None] * len(files)
 
-        def _sanitize_filename(filename):
+        def _sanitize_filename(filename, prefix):
             """Safely sanitize filename to prevent path traversal and injection"""
             # Remove any path components
             filename = os.path.basename(filename)
             # Keep only safe characters
-            safe_name = re.sub(r'[^A-Za-z0-9._-]', '_', filename)
+            safe_name = _UNSAFE_FILENAME_RE.sub('_', filename)
             # Limit length
             safe_name = safe_name[:150]
             # Prevent empty names
             if not safe_name or safe_name.startswith('.'):
-                safe_name = 'resume_' + datetime.now().strftime('%Y%m%d%H%M%S%f')
+                safe_name = 'resume_' + prefix
             return safe_name
 
         def _process(idx, file_storage):
@@ -1810,56 +1885,37 @@ def parse():
                 orig_name = None
                 if save_originals:
                     try:
-                        safe_name = _sanitize_filename(file_storage.filename)
-                        ts = datetime.now().strftime('%Y%m%d%H%M%S%f')
-                        orig_name = f"{ts}_{safe_name}"
-                        orig_path = os.path.join(originals_dir, orig_name)
-                        
-                        # Verify path is still within originals_dir
-                        orig_path_real = os.path.realpath(orig_path)
-                        if not orig_path_real.startswith(os.path.realpath(originals_dir)):
-                            raise ValueError('Path traversal attempt detected')
-                        
-                        file_storage.stream.seek(0)
-                        file_storage.save(orig_path_real)
+                        prefix = _unique_prefix()
+                        safe_name = _sanitize_filename(file_storage.filename, prefix)
+                        orig_name = f"{prefix}_{safe_name}"
+                        # orig_name is only [A-Za-z0-9._-] and never starts with
+                        # '.', so it cannot leave originals_dir
+                        _save_upload(file_storage, os.path.join(originals_dir, orig_name))
                     except Exception:
                         orig_name = None
 
-                try:
-                    file_storage.stream.seek(0)
-                except Exception:
-                    pass
-                content = read_file_content(file_storage)
+                # Only a path (or the bytes of a small upload) crosses the process
+                # boundary; each thread has at most one job in flight, so
+                # PARSE_WORKERS bounds outstanding work.
+                content, parsed = _run_parse(file_storage.filename, _upload_source(file_storage))
 
                 # Save a reduced text preview
                 text_fname = None
                 try:
-                    safe_name = _sanitize_filename(file_storage.filename)
-                    ts = datetime.now().strftime('%Y%m%d%H%M%S%f')
-                    text_fname = f"{ts}_{safe_name}.txt"
-                    text_path = os.path.join(uploads_dir, text_fname)
-                    
-                    # Verify path is still within uploads_dir
-                    text_path_real = os.path.realpath(text_path)
-                    if not text_path_real.startswith(os.path.realpath(uploads_dir)):
-                        raise ValueError('Path traversal attempt detected')
-                    
-                    # Limit content size to prevent disk exhaustion
-                    max_content = 1024 * 500  # 500 KB
-                    with open(text_path_real, 'w', encoding='utf-8') as tf:
-                        tf.write(content[:max_content])
+                    text_fname = _write_preview(uploads_dir, content)
                 except Exception:
                     text_fname = None
 
-                parsed = parse_resume_text(content)
-
                 llm_result = None
                 if call_llm_extract is not None:
                     try:
                         acquired = llm_sema.acquire(timeout=30)
                         if acquired:
                             try:
-                                llm_out = call_llm_extract(content, api_key=req_api_key, model=req_model or 'gpt-4o-mini')
+                                if llm_cache is not None:
+                                    llm_out = llm_cache.get_or_compute(content, call_llm_extract, api_key=req_api_key, model=req_model or 'gpt-4o-mini')
+                                else:
+                                    llm_out = call_llm_extract(content, api_key=req_api_key, model=req_model or 'gpt-4o-mini')
                                 if llm_out and isinstance(llm_out, list) and len(llm_out) > 0:
                                     llm_result = llm_out[0]
                             finally:
@@ -1911,22 +1967,25 @@ def parse():
                     'state': None
                 }
 
+            if progress is not None:
+                failed = str(results[idx].get('full_name') or '').startswith('Error:')
+                progress.put({'index': progress_offset + idx, 'ok': not failed})
+
+        # PARSE_BATCH_SIZE bounds how much of one request sits in the shared queue
+        executor = _get_request_pool()
         total = len(files)
         for start in range(0, total, batch_size):
             batch = files[start:start+batch_size]
-            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
-                futures = []
-                for idx_offset, file in enumerate(batch):
-                    idx = start + idx_offset
-                    futures.append(executor.submit(_process, idx, file))
-                concurrent.futures.wait(futures)
+            futures = [executor.submit(_process, start + idx_offset, file) for idx_offset, file in enumerate(batch)]
+            concurrent.futures.wait(futures)
 
         return jsonify({'results': results})
     
+    except RequestEntityTooLarge:
+        raise
     except Exception as e:
         # Don't leak detailed error messages in production
-        import logging
-        logging.error(f'Parse error: {str(e)}', exc_info=True)
+        logger.error(f'Parse error: {str(e)}', exc_info=True)
         
         if os.getenv('FLASK_ENV') == 'development':
             return jsonify({'error': str(e)}), 500
@@ -1934,6 +1993,78 @@ def parse():
             return jsonify({'error': 'An error occurred while processing files'}), 500
 
 
+_UNSAFE_FILENAME_RE = re.compile(r'[^A-Za-z0-9._-]')
+
+
+# Progress queues live in this process's memory, so /events only works when the
+# /parse batches of a job reach the same process as its stream (the dev server, or
+# one gunicorn worker with --threads). Multi-process sync workers would also tie up
+# a worker per open stream, so it is opt-in via PARSE_EVENTS=1.
+_EVENTS_ENABLED = os.getenv('PARSE_EVENTS', '0') == '1'
+_EVENTS_IDLE_SECONDS = 60
+_PROGRESS_QUEUES = {}
+_PROGRESS_LOCK = threading.Lock()
+_JOB_ID_RE = re.compile(r'^[A-Za-z0-9_-]{8,64}$')
+
+
+def _progress_queue(job_id, create=False):
+    """Queue feeding /events/<job_id>; only exists while a client is listening."""
+    if not _EVENTS_ENABLED or not _JOB_ID_RE.match(job_id or ''):
+        return None
+    with _PROGRESS_LOCK:
+        q = _PROGRESS_QUEUES.get(job_id)
+        if q is None and create:
+            q = _PROGRESS_QUEUES[job_id] = queue.Queue()
+        return q
+
+
+@app.route('/events/<job_id>')
+def parse_events(job_id):
+    """
+    Server-Sent Events stream of per-file parse completions for one upload job.
+    Ends with a 'done' event once `total` files have reported, or after
+    _EVENTS_IDLE_SECONDS without progress, so it never holds a worker indefinitely.
+    """
+    if not _EVENTS_ENABLED:
+        abort(404)
+    q = _progress_queue(job_id, create=True)
+    if q is None:
+        return jsonify({'error': 'Invalid job id'}), 400
+    total = request.args.get('total', type=int) or 0
+
+    def generate():
+        try:
+            # Tell the client the stream is live before any file finishes
+            yield 'retry: 2000\n\n'
+            seen = 0
+            idle = 0
+            while not total or seen < total:
+                try:
+                    msg = q.get(timeout=15)
+                except queue.Empty:
+                    idle += 15
+                    if idle >= _EVENTS_IDLE_SECONDS:
+                        break
+                    # Comment line keeps proxies from timing out the connection and
+                    # surfaces a disconnected client on the next write
+                    yield ': keepalive\n\n'
+                    continue
+                idle = 0
+                seen += 1
+                yield f'data: {app.json.dumps(msg)}\n\n'
+            yield 'event: done\ndata: {}\n\n'
+        finally:
+            with _PROGRESS_LOCK:
+                if _PROGRESS_QUEUES.get(job_id) is q:
+                    del _PROGRESS_QUEUES[job_id]
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
 def _check_admin_token() -> bool:
     """Simple admin auth using ADMIN_TOKEN env var and X-ADMIN-TOKEN header."""
     admin_token = os.getenv('ADMIN_TOKEN')
@@ -1992,6 +2123,120 @@ def admin_delete_api_key():
         return jsonify({'error': str(e)}), 500
 
 
+# Exact column order of exported sheets and CSVs
+EXPORT_COLUMNS = [
+    'full_name',
+    'email',
+    'phone_number',
+    'alternate_phone_number',
+    'highest_qualification',
+    'years_of_experience',
+    'current_company',
+    'current_designation',
+    'city',
+    'state'
+]
+
+def _write_xlsx(output, rows, columns):
+    """
+    Write `rows` (dicts) to `output` with xlsxwriter in constant_memory mode:
+    each row is flushed as it is written, so memory stays flat however many
+    resumes are exported.
+    """
+    workbook = xlsxwriter.Workbook(output, {
+        'constant_memory': True,
+        'strings_to_urls': False,
+        'strings_to_formulas': False,
+    })
+    worksheet = workbook.add_worksheet('Parsed Resumes')
+    header = workbook.add_format({'bold': True, 'border': 1})
+    widths = [len(col) for col in columns]
+    worksheet.write_row(0, 0, columns, header)
+    for r, row in enumerate(rows, start=1):
+        for c, col in enumerate(columns):
+            value = row.get(col) if isinstance(row, dict) else None
+            if value is None:
+                continue
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                worksheet.write_number(r, c, value)
+            else:
+                value = str(value)
+                worksheet.write_string(r, c, value)
+            widths[c] = max(widths[c], len(str(value)))
+    # Auto-adjust column widths
+    for c, width in enumerate(widths):
+        worksheet.set_column(c, c, min(width + 2, 50))
+    workbook.close()
+
+
+def _write_xlsx_openpyxl(output, rows, columns):
+    """
+    Fallback for `_write_xlsx` without xlsxwriter: an openpyxl write-only workbook
+    streams rows out instead of holding a Cell object per value. Column widths have
+    to be set before the first row, so they are measured in a pass over `rows` first.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Border, Font, Side
+    from openpyxl.utils import get_column_letter
+
+    widths = [len(col) for col in columns]
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        for c, col in enumerate(columns):
+            value = row.get(col)
+            if value is not None:
+                widths[c] = max(widths[c], len(str(value)))
+
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet('Parsed Resumes')
+    # Auto-adjust column widths
+    for c, width in enumerate(widths, start=1):
+        worksheet.column_dimensions[get_column_letter(c)].width = min(width + 2, 50)
+
+    side = Side(style='thin')
+    header = []
+    for col in columns:
+        cell = WriteOnlyCell(worksheet, value=col)
+        cell.font = Font(bold=True)
+        cell.border = Border(left=side, right=side, top=side, bottom=side)
+        header.append(cell)
+    worksheet.append(header)
+
+    for row in rows:
+        values = []
+        for col in columns:
+            value = row.get(col) if isinstance(row, dict) else None
+            if value is not None and not (isinstance(value, (int, float)) and not isinstance(value, bool)):
+                value = str(value)
+                if _looks_like_formula(value):
+                    # Keep parsed text from being stored as a formula
+                    value = WriteOnlyCell(worksheet, value=value)
+                    value.data_type = 's'
+            values.append(value)
+        worksheet.append(values)
+    workbook.save(output)
+
+
+_EXPORT_CACHE = OrderedDict()
+_EXPORT_CACHE_LOCK = threading.Lock()
+_EXPORT_CACHE_MAX = 8
+
+
+def _xlsx_response(payload, etag):
+    # The ETag is precomputed from the request body so send_file never hashes the workbook
+    return send_file(
+        BytesIO(payload),
+        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        as_attachment=True,
+        download_name=f'parsed_resumes_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx',
+        etag=etag,
+        conditional=True,
+        max_age=0
+    )
+
+
 @app.route('/export', methods=['POST'])
 def export():
     try:
@@ -2000,49 +2245,84 @@ def export():
         if not data:
             return jsonify({'error': 'No data to export'}), 400
         
-        # Create DataFrame with exact column order
-        columns = [
-            'full_name',
-            'email',
-            'phone_number',
-            'alternate_phone_number',
-            'highest_qualification',
-            'years_of_experience',
-            'current_company',
-            'current_designation',
-            'city',
-            'state'
-        ]
+        columns = EXPORT_COLUMNS
         
-        df = pd.DataFrame(data, columns=columns)
+        # Identical result sets (re-clicking download) reuse the finished workbook
+        etag = hashlib.blake2b(request.get_data(), digest_size=16).hexdigest()
+        with _EXPORT_CACHE_LOCK:
+            payload = _EXPORT_CACHE.get(etag)
+            if payload is not None:
+                _EXPORT_CACHE.move_to_end(etag)
+        if payload is not None:
+            return _xlsx_response(payload, etag)
         
-        # Create Excel file in memory
         output = BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Parsed Resumes')
-            
-            # Auto-adjust column widths
-            worksheet = writer.sheets['Parsed Resumes']
-            for idx, col in enumerate(df.columns):
-                max_length = max(
-                    df[col].astype(str).map(len).max(),
-                    len(col)
-                ) + 2
-                worksheet.column_dimensions[chr(65 + idx)].width = min(max_length, 50)
-        
-        output.seek(0)
-        
-        return send_file(
-            output,
-            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            as_attachment=True,
-            download_name=f'parsed_resumes_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
-        )
+        if xlsxwriter is not None:
+            _write_xlsx(output, data, columns)
+        else:
+            _write_xlsx_openpyxl(output, data, columns)
+        
+        payload = output.getvalue()
+        with _EXPORT_CACHE_LOCK:
+            _EXPORT_CACHE[etag] = payload
+            while len(_EXPORT_CACHE) > _EXPORT_CACHE_MAX:
+                _EXPORT_CACHE.popitem(last=False)
+        return _xlsx_response(payload, etag)
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+_CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+# '+' also starts a formula, but an international phone number is left readable
+_PHONE_LIKE_RE = re.compile(r'\+[\d\s().-]+')
+
+
+def _looks_like_formula(value):
+    """True for text a spreadsheet would evaluate as a formula."""
+    return (isinstance(value, str) and value.startswith(_CSV_FORMULA_PREFIXES)
+            and not _PHONE_LIKE_RE.fullmatch(value))
+
+
+def _csv_cell(value):
+    """Format one CSV cell, quoting text a spreadsheet would run as a formula."""
+    if value is None:
+        return ''
+    if _looks_like_formula(value):
+        return "'" + value
+    return value
+
+
+@app.route('/export.csv', methods=['POST'])
+def export_csv():
+    """Stream parsed rows as CSV; the first bytes go out before the last row is formatted."""
+    data = (request.get_json(silent=True) or {}).get('data', [])
+    if not data:
+        return jsonify({'error': 'No data to export'}), 400
+
+    def generate():
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(EXPORT_COLUMNS)
+        for i, row in enumerate(data, start=1):
+            if not isinstance(row, dict):
+                continue
+            writer.writerow([_csv_cell(row.get(col)) for col in EXPORT_COLUMNS])
+            # Flush in small chunks rather than one write per row
+            if i % 100 == 0:
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate()
+        yield buf.getvalue()
+
+    filename = f'parsed_resumes_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/csv',
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
+
+
 @app.route('/clear_parsed', methods=['POST'])
 def clear_parsed():
     """Delete server-side parsed preview files in `uploads/` but leave `uploads/originals/` intact."""
@@ -2050,23 +2330,65 @@ def clear_parsed():
     deleted = 0
     try:
         if os.path.exists(uploads_dir):
-            for fname in os.listdir(uploads_dir):
-                fpath = os.path.join(uploads_dir, fname)
-                # skip originals directory
-                if os.path.isdir(fpath) and os.path.basename(fpath) == 'originals':
-                    continue
-                try:
-                    if os.path.isfile(fpath):
-                        os.remove(fpath)
-                        deleted += 1
-                except Exception:
-                    pass
+            # scandir entries carry the file type, so no stat() per preview
+            with os.scandir(uploads_dir) as entries:
+                for entry in entries:
+                    # skip originals directory
+                    if entry.name == 'originals' and entry.is_dir():
+                        continue
+                    try:
+                        if entry.is_file():
+                            os.remove(entry.path)
+                            deleted += 1
+                    except Exception:
+                        pass
         return jsonify({'status': 'ok', 'deleted': deleted})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
  
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_P, _W_T, _W_TAB, _W_BR, _W_CR = (_W_NS + t for t in ('p', 't', 'tab', 'br', 'cr'))
+_DOCX_PART_RE = re.compile(r'word/(header\d*|document|footer\d*)\.xml$')
+
+
+def extract_docx_text(file):
+    """
+    Stream the text out of a DOCX (path or file object) with iterparse, one
+    paragraph per line. Headers come first and footers last, like docx2txt.
+    """
+    with zipfile.ZipFile(file) as zf:
+        names = [n for n in zf.namelist() if _DOCX_PART_RE.match(n)]
+        order = {'header': 0, 'document': 1, 'footer': 2}
+        names.sort(key=lambda n: order[_DOCX_PART_RE.match(n).group(1).rstrip('0123456789')])
+        paragraphs = []
+        for name in names:
+            with zf.open(name) as part:
+                runs = []
+                for _, el in xml_etree.iterparse(part, events=('end',)):
+                    tag = el.tag
+                    if tag == _W_T:
+                        if el.text:
+                            runs.append(el.text)
+                    elif tag == _W_TAB:
+                        runs.append('\t')
+                    elif tag == _W_BR or tag == _W_CR:
+                        runs.append('\n')
+                    elif tag == _W_P:
+                        paragraphs.append(''.join(runs))
+                        runs = []
+                        # Drop the finished paragraph so memory stays bounded
+                        el.clear()
+    return '\n'.join(paragraphs)
+
+
+# Resume fields sit on the first pages; stop extracting long PDFs (theses,
+# portfolios) after this many pages or once this much text has been collected
+_PDF_MAX_PAGES = int(os.getenv('PARSE_MAX_PDF_PAGES', '8'))
+_PDF_MAX_CHARS = 40000
+
+
 def read_file_content(file):
     """
     Read content from uploaded file with robust error handling.
@@ -2077,126 +2399,196 @@ def read_file_content(file):
             return None
         
         filename = file.filename.lower()
-        file.seek(0)  # Reset file pointer
+        # Read the upload once; every parser below gets its own view of these bytes
+        file.seek(0)
+        payload = file.read()
         
         # TXT files
         if filename.endswith('.txt'):
             try:
-                content = file.read()
-                text = content.decode('utf-8', errors='replace')
+                text = payload.decode('utf-8', errors='replace')
                 return text if text.strip() else None
             except Exception as e:
-                logging.warning(f"Failed to read TXT: {e}")
+                logger.warning(f"Failed to read TXT: {e}")
                 return None
         
         # PDF files - multiple methods
         if filename.endswith('.pdf'):
-            # Method 1: PyPDF2
-            try:
-                import PyPDF2
-                file.seek(0)
-                pdf_reader = PyPDF2.PdfReader(file)
-                if pdf_reader.pages:
-                    pages = []
-                    for page_num, page in enumerate(pdf_reader.pages):
-                        try:
-                            text = page.extract_text()
-                            if text and text.strip():
+            # Method 1: pypdfium2 (PDFium, native and much faster than PyPDF2)
+            pdfium = _optional_module('pypdfium2')
+            if pdfium is not None:
+                try:
+                    pdf = pdfium.PdfDocument(payload)
+                    try:
+                        pages = []
+                        collected = 0
+                        for page_num in range(min(len(pdf), _PDF_MAX_PAGES)):
+                            if collected > _PDF_MAX_CHARS:
+                                break
+                            page = pdf[page_num]
+                            textpage = page.get_textpage()
+                            text = textpage.get_text_range().replace('\r\n', '\n')
+                            textpage.close()
+                            page.close()
+                            if text.strip():
                                 pages.append(text)
-                        except Exception:
-                            logging.warning(f"Failed to extract page {page_num}")
+                                collected += len(text)
+                    finally:
+                        pdf.close()
                     if pages:
-                        result = '\n'.join(pages)
-                        return result if result.strip() else None
-            except Exception as e:
-                logging.warning(f"PyPDF2 failed: {e}")
+                        return '\n'.join(pages)
+                except Exception as e:
+                    logger.warning(f"pypdfium2 failed: {e}")
+
+            # Method 2: PyPDF2
+            PyPDF2 = _optional_module('PyPDF2')
+            if PyPDF2 is not None:
+                try:
+                    pdf_reader = PyPDF2.PdfReader(BytesIO(payload))
+                    if pdf_reader.pages:
+                        pages = []
+                        collected = 0
+                        for page_num, page in enumerate(pdf_reader.pages):
+                            if page_num >= _PDF_MAX_PAGES or collected > _PDF_MAX_CHARS:
+                                break
+                            try:
+                                text = page.extract_text()
+                                if text and text.strip():
+                                    pages.append(text)
+                                    collected += len(text)
+                            except Exception:
+                                logger.warning(f"Failed to extract page {page_num}")
+                        if pages:
+                            result = '\n'.join(pages)
+                            return result if result.strip() else None
+                except Exception as e:
+                    logger.warning(f"PyPDF2 failed: {e}")
             
-            # Method 2: pdfplumber
-            try:
-                import pdfplumber
-                file.seek(0)
-                with pdfplumber.open(file) as pdf:
-                    pages = []
-                    for page in pdf.pages:
-                        text = page.extract_text()
-                        if text and text.strip():
-                            pages.append(text)
-                    if pages:
-                        result = '\n'.join(pages)
-                        return result if result.strip() else None
-            except Exception:
-                logging.debug("pdfplumber not available")
+            # Method 3: pdfplumber
+            pdfplumber = _optional_module('pdfplumber')
+            if pdfplumber is None:
+                logger.debug("pdfplumber not available")
+            else:
+                try:
+                    with pdfplumber.open(BytesIO(payload)) as pdf:
+                        pages = []
+                        collected = 0
+                        for page in pdf.pages[:_PDF_MAX_PAGES]:
+                            if collected > _PDF_MAX_CHARS:
+                                break
+                            text = page.extract_text()
+                            if text and text.strip():
+                                pages.append(text)
+                                collected += len(text)
+                        if pages:
+                            result = '\n'.join(pages)
+                            return result if result.strip() else None
+                except Exception as e:
+                    logger.warning(f"pdfplumber failed: {e}")
             
             # Fallback: binary read
             try:
-                file.seek(0)
-                content = file.read()
-                text = content.decode('utf-8', errors='replace')
+                text = payload.decode('utf-8', errors='replace')
                 return text if text.strip() else None
             except Exception as e:
-                logging.warning(f"PDF binary read failed: {e}")
+                logger.warning(f"PDF binary read failed: {e}")
         
         # DOCX files
         if filename.endswith('.docx'):
             try:
-                file.seek(0)
-                text = docx2txt.process(file)
-                return text if text and text.strip() else None
+                text = extract_docx_text(BytesIO(payload))
+                if text and text.strip():
+                    return text
             except Exception as e:
-                logging.warning(f"docx2txt failed: {e}")
+                logger.warning(f"DOCX stream extraction failed: {e}")
+
+            # Fallback: docx2txt
+            docx2txt = _optional_module('docx2txt')
+            if docx2txt is not None:
+                try:
+                    text = docx2txt.process(BytesIO(payload))
+                    return text if text and text.strip() else None
+                except Exception as e:
+                    logger.warning(f"docx2txt failed: {e}")
             
             # Fallback: python-docx
-            try:
-                from docx import Document
-                from io import BytesIO
-                file.seek(0)
-                doc = Document(BytesIO(file.read()))
-                paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-                if paragraphs:
-                    result = '\n'.join(paragraphs)
-                    return result if result.strip() else None
-            except Exception as e:
-                logging.warning(f"python-docx failed: {e}")
+            python_docx = _optional_module('docx')
+            if python_docx is not None:
+                try:
+                    doc = python_docx.Document(BytesIO(payload))
+                    paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
+                    if paragraphs:
+                        result = '\n'.join(paragraphs)
+                        return result if result.strip() else None
+                except Exception as e:
+                    logger.warning(f"python-docx failed: {e}")
         
         # DOC files (older Word format)
         if filename.endswith('.doc'):
-            try:
-                from docx import Document
-                from io import BytesIO
-                file.seek(0)
-                doc = Document(BytesIO(file.read()))
-                paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-                if paragraphs:
-                    result = '\n'.join(paragraphs)
-                    return result if result.strip() else None
-            except Exception as e:
-                logging.warning(f"DOC read failed: {e}")
+            python_docx = _optional_module('docx')
+            if python_docx is not None:
+                try:
+                    doc = python_docx.Document(BytesIO(payload))
+                    paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
+                    if paragraphs:
+                        result = '\n'.join(paragraphs)
+                        return result if result.strip() else None
+                except Exception as e:
+                    logger.warning(f"DOC read failed: {e}")
         
         # Fallback: try binary decode
         try:
-            file.seek(0)
-            content = file.read()
             for encoding in ['utf-8', 'latin-1', 'cp1252']:
                 try:
-                    text = content.decode(encoding, errors='replace')
+                    text = payload.decode(encoding, errors='replace')
                     if text.strip():
                         return text
                 except Exception:
                     continue
         except Exception as e:
-            logging.error(f"Fallback decode failed: {e}")
+            logger.error(f"Fallback decode failed: {e}")
         
         return None
     
     except Exception as e:
-        logging.error(f"Unexpected error in read_file_content: {e}")
+        logger.error(f"Unexpected error in read_file_content: {e}")
         return None
 
 
+# Internal nginx location aliased to the uploads directory (e.g. /_protected/uploads/).
+# When set, nginx streams persisted files itself via X-Accel-Redirect.
+_X_ACCEL_UPLOADS_PREFIX = os.getenv('X_ACCEL_UPLOADS_PREFIX', '').rstrip('/')
+# Apache/lighttpd equivalent: Flask answers with an X-Sendfile header
+app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE', '0') == '1'
+
+
+# Resolved once; the GET handlers below would otherwise lstat every path
+# component of the working directory on each request
+_UPLOADS_ROOT = os.path.realpath(os.path.join(os.getcwd(), 'uploads'))
+_ORIGINALS_ROOT = os.path.realpath(os.path.join(_UPLOADS_ROOT, 'originals'))
+
+
+def _send_persisted(path, mimetype=None):
+    """
+    Send a file stored under uploads/ without copying it through Python: either
+    hand it to the front-end proxy or let send_file use wsgi.file_wrapper
+    (sendfile(2) under gunicorn). The type is guessed from the extension so both
+    paths let the browser render previews inline.
+    """
+    if mimetype is None:
+        mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    if _X_ACCEL_UPLOADS_PREFIX:
+        rel = os.path.relpath(path, _UPLOADS_ROOT).replace(os.sep, '/')
+        response = Response(mimetype=mimetype)
+        response.headers['X-Accel-Redirect'] = f'{_X_ACCEL_UPLOADS_PREFIX}/{rel}'
+        return response
+    return send_file(path, mimetype=mimetype, as_attachment=False, conditional=True, etag=True, max_age=3600)
+
+
 @app.route('/uploads/<path:fname>')
 def uploaded_file(fname):
     """Serve uploaded files with path traversal protection"""
-    uploads_dir = os.path.realpath(os.path.join(os.getcwd(), 'uploads'))
+    uploads_dir = _UPLOADS_ROOT
     
     try:
         # Prevent path traversal attacks
@@ -2205,10 +2597,10 @@ def uploaded_file(fname):
         if not safe_path.startswith(uploads_dir):
             return abort(403)
         
-        if not os.path.exists(safe_path) or not os.path.isfile(safe_path):
+        if not os.path.isfile(safe_path):
             return abort(404)
         
-        return send_file(safe_path, as_attachment=False)
+        return _send_persisted(safe_path)
     except Exception:
         return abort(400)
 
@@ -2216,7 +2608,7 @@ def uploaded_file(fname):
 @app.route('/originals/<path:fname>')
 def original_file(fname):
     """Serve original files with path traversal protection"""
-    originals_dir = os.path.realpath(os.path.join(os.getcwd(), 'uploads', 'originals'))
+    originals_dir = _ORIGINALS_ROOT
     
     try:
         # Prevent path traversal attacks
@@ -2225,13 +2617,10 @@ def original_file(fname):
         if not safe_path.startswith(originals_dir):
             return abort(403)
         
-        if not os.path.exists(safe_path) or not os.path.isfile(safe_path):
+        if not os.path.isfile(safe_path):
             return abort(404)
         
-        # Try to guess mimetype so browser can render inline when possible
-        import mimetypes
-        mime, _ = mimetypes.guess_type(safe_path)
-        return send_file(safe_path, mimetype=mime or 'application/octet-stream', as_attachment=False)
+        return _send_persisted(safe_path)
     except Exception:
         return abort(400)
 
@@ -2254,370 +2643,10 @@ def parse_resume_text(text):
             'state': None
         }
     
-    # Use the improved resume_parser functions directly on text
-    from resume_parser import (extract_name, extract_email, extract_phone,
-                               extract_alternate_phone, extract_qualification,
-                               extract_experience, extract_current_company,
-                               extract_designation, extract_city, extract_state)
-    
-    result = {
-        'full_name': extract_name(text),
-        'email': extract_email(text),
-        'phone_number': extract_phone(text),
-        'alternate_phone_number': extract_alternate_phone(text),
-        'highest_qualification': extract_qualification(text),
-        'years_of_experience': extract_experience(text),
-        'current_company': extract_current_company(text),
-        'current_designation': extract_designation(text),
-        'city': extract_city(text),
-        'state': extract_state(text)
-    }
-    return result
-
-
-
-
-
-def extract_email(text):
-    """Extract email address - search entire document"""
-    # Standard email pattern
-    pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    matches = re.findall(pattern, text)
-    
-    if matches:
-        # Validate and return first legitimate email
-        for match in matches:
-            email_clean = match.lower()
-            # Skip obvious non-emails
-            if '..' not in email_clean and not email_clean.startswith('.'):
-                # Additional validation: reasonable length, not too many dots
-                if len(email_clean) > 5 and email_clean.count('.') <= 3:
-                    return email_clean
-    
-    return None
-
-def extract_phone(text):
-    """Extract primary phone number - handle diverse formats"""
-    # Comprehensive patterns for different formats
-    patterns = [
-        r'\+\d{1,3}[\s.-]?\d{1,4}[\s.-]?\d{1,4}[\s.-]?\d{1,9}',           # +country code xxx xxx
-        r'\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}',                          # (xxx) xxx-xxxx or variants
-        r'\b\d{10,11}\b',                                                  # 10-11 consecutive digits
-        r'\d{3}[\s.-]\d{3}[\s.-]\d{4}',                                    # xxx-xxx-xxxx or xxx xxx xxxx
-        r'\b\d{5}[\s.-]\d{5}\b',                                           # Indian: xxxxx xxxxx
-    ]
-    
-    # Search entire document
-    for pattern in patterns:
-        for match in re.finditer(pattern, text):
-            phone = match.group(0)
-            # Normalize: remove all non-digits except leading +
-            normalized = re.sub(r'[^\d+]', '', phone)
-            # Validate: must be 9-15 digits
-            digit_count = len(re.sub(r'\D', '', normalized))
-            if 9 <= digit_count <= 15:
-                return normalized
-    
-    return None
-
-def extract_alternate_phone(text):
-    """Extract alternate phone number - look for second phone if exists"""
-    phones = []
-    
-    # Same patterns as primary phone
-    patterns = [
-        r'\+\d{1,3}[\s.-]?\d{1,4}[\s.-]?\d{1,4}[\s.-]?\d{1,9}',
-        r'\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}',
-        r'\b\d{10,11}\b',
-        r'\d{3}[\s.-]\d{3}[\s.-]\d{4}',
-        r'\b\d{5}[\s.-]\d{5}\b',
-    ]
-    
-    for pattern in patterns:
-        for match in re.finditer(pattern, text):
-            phone = match.group(0)
-            normalized = re.sub(r'[^\d+]', '', phone)
-            digit_count = len(re.sub(r'\D', '', normalized))
-            if 9 <= digit_count <= 15 and normalized not in phones:
-                phones.append(normalized)
-    
-    # Return second phone if exists, filter out duplicates
-    unique_phones = []
-    for p in phones:
-        if p not in unique_phones:
-            unique_phones.append(p)
-    
-    return unique_phones[1] if len(unique_phones) > 1 else None
-
-def extract_qualification(text):
-    """
-    Extract highest qualification - ONLY return degree type, never institution name.
-    Must find qualification in Education section for high confidence.
-    """
-    text_lower = text.lower()
-    
-    # Find Education section specifically
-    edu_section = None
-    lines = text.split('\n')
-    
-    edu_keywords = ['education', 'academic qualifications', 'qualifications', 'academic background', 'academic', 'schooling']
-    
-    for i, line in enumerate(lines):
-        if any(kw in line.lower() for kw in edu_keywords):
-            # Found education section, extract next 1500 chars
-            edu_section = '\n'.join(lines[i:min(i+20, len(lines))])
-            break
-    
-    if not edu_section:
-        edu_section = text_lower
-    
-    # Qualification mappings (degree → keywords that identify it)
-    qualifications = [
-        ('PhD', ['phd', 'ph.d', 'ph d', 'doctorate', 'doctor of philosophy']),
-        ('Masters', ['master', 'mba', 'ms', 'm.s', 'mtech', 'm.tech', 'msc', 'm.sc', 'postgraduate']),
-        ('Bachelors', ['bachelor', 'b.tech', 'btech', 'b.e', 'be', 'bs', 'b.s', 'bsc', 'b.a', 'ba', 'bcom', 'b.com', 'undergraduate']),
-        ('Diploma', ['diploma', 'dip', 'polytechnic']),
-        ('Associate', ['associate', 'hsc', 'higher secondary'])
-    ]
-    
-    # Search in education section ONLY
-    for degree, keywords in qualifications:
-        for kw in keywords:
-            if kw in edu_section.lower():
-                # Double-check: make sure we're not catching "Stanford Masters" 
-                # by looking at context
-                idx = edu_section.lower().find(kw)
-                context = edu_section[max(0, idx-40):min(len(edu_section), idx+100)].lower()
-                
-                # Blocklist: if context contains university/college/school name indicators with "from/at/in"
-                bad_patterns = [
-                    r'from\s+[a-z\s]+university',
-                    r'from\s+[a-z\s]+college',
-                    r'from\s+[a-z\s]+school',
-                    r'at\s+[a-z\s]+university',
-                    r'in\s+[a-z\s]+university'
-                ]
-                
-                found_bad = False
-                for pattern in bad_patterns:
-                    if re.search(pattern, context):
-                        found_bad = True
-                        break
-                
-                if not found_bad:
-                    return degree
-    
-    return None
+    # Use the improved resume_parser field extraction directly on text
+    from resume_parser import parse_resume_from_text
+    return parse_resume_from_text(text)
 
-def extract_experience(text):
-    """Extract years of experience - flexible patterns for different formats"""
-    text_lower = text.lower()
-    
-    # Diverse patterns for experience detection
-    patterns = [
-        r'(\d+\.?\d*)\s*\+?\s*years?\s+(?:of\s+)?(?:work|professional|total)?\s*experience',
-        r'experience\s*[:|=]\s*(\d+\.?\d*)\s*\+?\s*years?',
-        r'(\d+\.?\d*)\s*\+?\s*(?:years?|yrs?|yrs?)\s+(?:work|professional)?(?:experience|exp)?',
-        r'total\s+(?:work\s+)?experience\s*[:\-]?\s*(\d+\.?\d*)\s*years?',
-        r'working\s+experience\s*[:\-]?\s*(\d+\.?\d*)\s*years?',
-        r'years\s+(?:of\s+)?(?:work|professional|total)?\s*experience\s*[:\-]?\s*(\d+\.?\d*)',
-    ]
-    
-    for pattern in patterns:
-        matches = re.finditer(pattern, text_lower)
-        for match in matches:
-            try:
-                years = float(match.group(1))
-                if 0 < years <= 80:  # Allow up to 80 years
-                    return years
-            except (ValueError, IndexError):
-                continue
-    
-    return None
-
-def extract_current_company(text):
-    """Extract current company - search for multiple position indicators"""
-    lines = text.split('\n')
-    text_lower = text.lower()
-    
-    # Find experience section start
-    exp_idx = -1
-    for i, line in enumerate(lines):
-        if 'experience' in line.lower() or 'work experience' in line.lower() or 'employment' in line.lower():
-            exp_idx = i
-            break
-    
-    if exp_idx == -1:
-        # No experience section found, search entire document
-        exp_idx = 0
-    
-    # Strategy 1: Look for "Present" keyword
-    for j in range(exp_idx, min(exp_idx + 30, len(lines))):
-        line = lines[j].strip()
-        line_lower = line.lower()
-        
-        if 'present' in line_lower or 'current' in line_lower or 'till now' in line_lower:
-            # Found current role, extract company name from nearby lines
-            for offset in range(-3, 3):
-                idx = j + offset
-                if 0 <= idx < len(lines):
-                    candidate = lines[idx].strip()
-                    if candidate and 0 < len(candidate) < 100 and not candidate.isupper():
-                        if len(candidate.split()) >= 1 and len(candidate.split()) <= 6:
-                            # Check if looks like company name
-                            if re.search(r'[A-Z][a-zA-Z]', candidate):
-                                return candidate
-    
-    # Strategy 2: Look for company keywords
-    company_indicators = ['company', 'organization', 'employer', 'firm', 'corporation', 'ltd', 'inc', 'corp']
-    for j in range(exp_idx, min(exp_idx + 30, len(lines))):
-        line = lines[j].strip()
-        line_lower = line.lower()
-        if any(ind in line_lower for ind in company_indicators):
-            # Found company context, extract company name
-            for offset in range(-1, 2):
-                idx = j + offset
-                if 0 <= idx < len(lines):
-                    candidate = lines[idx].strip()
-                    if candidate and len(candidate) < 100 and re.match(r'^[A-Z]', candidate):
-                        return candidate
-    
-    # Strategy 3: Extract first capitalized line in experience section
-    for j in range(exp_idx + 1, min(exp_idx + 15, len(lines))):
-        line = lines[j].strip()
-        if line and len(line) < 100 and re.match(r'^[A-Z]', line) and not line.isupper():
-            if len(line.split()) <= 6:
-                return line
-    
-    return None
-
-def extract_designation(text):
-    """Extract current designation - search near Present or most recent job"""
-    text_lower = text.lower()
-    lines = text.split('\n')
-    
-    # Comprehensive job title keywords
-    titles = [
-        'engineer', 'developer', 'programmer', 'coder', 'software', 'quality assurance',
-        'manager', 'lead', 'leader', 'head', 'director', 'senior', 'principal',
-        'junior', 'associate', 'analyst', 'consultant', 'architect', 'specialist',
-        'designer', 'scientist', 'research', 'coordinator', 'officer',
-        'executive', 'supervisor', 'intern', 'trainee', 'administrator'
-    ]
-    
-    # Find experience section
-    exp_idx = -1
-    for i, line in enumerate(lines):
-        if 'experience' in line.lower() or 'work' in line.lower():
-            exp_idx = i
-            break
-    
-    if exp_idx == -1:
-        exp_idx = 0
-    
-    # Strategy 1: Find "Present" and extract designation from nearby lines
-    for j in range(exp_idx, min(exp_idx + 30, len(lines))):
-        line_lower = lines[j].lower()
-        if 'present' in line_lower or 'current' in line_lower:
-            # Extract designation from surrounding context
-            for offset in range(-2, 3):
-                idx = j + offset
-                if 0 <= idx < len(lines):
-                    candidate = lines[idx].strip()
-                    candidate_lower = candidate.lower()
-                    if any(title in candidate_lower for title in titles):
-                        if len(candidate) < 100:
-                            return candidate
-    
-    # Strategy 2: Search for job title keywords in experience section
-    for j in range(exp_idx, min(exp_idx + 20, len(lines))):
-        line = lines[j].strip()
-        line_lower = line.lower()
-        
-        if any(title in line_lower for title in titles):
-            if 0 < len(line) < 100 and not line.isupper():
-                return line
-    
-    return None
-
-def extract_city(text):
-    """Extract city - handle variations, abbreviations, different position indicators"""
-    text_lower = text.lower()
-    
-    # Comprehensive list with aliases and variations
-    cities = {
-        'mumbai': ['mumbai', 'bombay', 'mum'],
-        'delhi': ['delhi', 'new delhi', 'dli'],
-        'bangalore': ['bangalore', 'bengaluru', 'blr'],
-        'hyderabad': ['hyderabad', 'hyd'],
-        'chennai': ['chennai', 'madras', 'chn'],
-        'kolkata': ['kolkata', 'calcutta', 'kol'],
-        'pune': ['pune', 'poona', 'pun'],
-        'ahmedabad': ['ahmedabad', 'ahd'],
-        'jaipur': ['jaipur', 'jai'],
-        'lucknow': ['lucknow', 'lucknow'],
-        'kanpur': ['kanpur', 'kan'],
-        'nagpur': ['nagpur', 'nag'],
-        'indore': ['indore', 'ind'],
-        'bhopal': ['bhopal', 'bho'],
-        'visakhapatnam': ['visakhapatnam', 'vizag'],
-        'patna': ['patna', 'pat'],
-        'vadodara': ['vadodara', 'baroda', 'vad'],
-        'ghaziabad': ['ghaziabad', 'gha'],
-        'ludhiana': ['ludhiana', 'lud'],
-        'agra': ['agra'],
-        'nashik': ['nashik'],
-        'faridabad': ['faridabad'],
-        'meerut': ['meerut'],
-        'rajkot': ['rajkot'],
-        'guwahati': ['guwahati', 'assam'],
-        'chandigarh': ['chandigarh', 'chi'],
-        'kochi': ['kochi', 'cochin'],
-        'coimbatore': ['coimbatore', 'cbe']
-    }
-    
-    # Search for city mentions
-    for city, aliases in cities.items():
-        for alias in aliases:
-            if alias in text_lower:
-                return city.title()
-    
-    return None
-
-def extract_state(text):
-    """Extract state - handle abbreviations and variations"""
-    text_lower = text.lower()
-    
-    # States with aliases and abbreviations
-    states = {
-        'maharashtra': ['maharashtra', 'mh', 'maharashtra', 'maha'],
-        'karnataka': ['karnataka', 'ka', 'karnataka'],
-        'tamil nadu': ['tamil nadu', 'tn', 'tamilnadu'],
-        'delhi': ['delhi', 'dl', 'new delhi'],
-        'uttar pradesh': ['uttar pradesh', 'up', 'up'],
-        'west bengal': ['west bengal', 'wb', 'westbengal'],
-        'gujarat': ['gujarat', 'gj', 'guj'],
-        'rajasthan': ['rajasthan', 'rj', 'raj'],
-        'madhya pradesh': ['madhya pradesh', 'mp'],
-        'telangana': ['telangana', 'tg', 'ts'],
-        'andhra pradesh': ['andhra pradesh', 'ap', 'ap'],
-        'kerala': ['kerala', 'kl'],
-        'punjab': ['punjab', 'pb', 'pun'],
-        'haryana': ['haryana', 'hr', 'har'],
-        'bihar': ['bihar', 'br', 'bih'],
-        'assam': ['assam', 'as', 'ass'],
-        'odisha': ['odisha', 'orissa', 'or'],
-        'jharkhand': ['jharkhand', 'jh', 'jhar'],
-        'chhattisgarh': ['chhattisgarh', 'ct'],
-        'uttarakhand': ['uttarakhand', 'uk', 'uttar']
-    }
-    
-    for state, aliases in states.items():
-        for alias in aliases:
-            if alias in text_lower:
-                return state.title()
-    
-    return None
 
 if __name__ == '__main__':
     # Production-ready configuration
@@ -2647,4 +2676,11 @@ if __name__ == '__main__':
     print("\n⚠️  Press CTRL+C to stop the server")
     print("="*70 + "\n")
     
+    # `app` is fully imported here, so the pool can be warmed before serving.
+    # In debug mode only the reloader's child serves; warming its parent too
+    # would start a second pool.
+    if _WARM_ON_START and (not debug_mode or os.environ.get('WERKZEUG_RUN_MAIN') == 'true'):
+        _warm_started.set()
+        warm_parse_pool()
+    
     app.run(debug=debug_mode, host=host, port=port, threaded=True)
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""
+In-process cache for LLM extraction results.
+
+Exact matches (same normalised resume text, model and prompt mode) are always
+served from the cache. Semantic matching against prompt embeddings is opt-in
+via LLM_CACHE_SIMILARITY, because two resumes built from the same template can
+differ only in the name and contact details the LLM is asked to extract.
+
+Set LLM_CACHE_DIR (needs diskcache) to share exact matches between worker
+processes and keep them across restarts.
+"""
+import os
+import re
+import copy
+import json
+import atexit
+import hashlib
+import threading
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except Exception:
+    SentenceTransformer = None
+
+CACHE_PATH = os.getenv('LLM_CACHE_PATH')
+MAX_ENTRIES = int(os.getenv('LLM_CACHE_SIZE', '1024'))
+SIMILARITY = float(os.getenv('LLM_CACHE_SIMILARITY') or 0)
+EMBED_MODEL = os.getenv('LLM_CACHE_EMBED_MODEL', 'sentence-transformers/all-MiniLM-L6-v2')
+CACHE_DIR = os.getenv('LLM_CACHE_DIR', '')
+
+_WS_RE = re.compile(r'\s+')
+
+_lock = threading.Lock()
+_entries = OrderedDict()  # key -> {'ns': str, 'result': list, 'vector': np.ndarray | None}
+_embedder = None
+_embedder_lock = threading.Lock()
+_disk = diskcache.Cache(CACHE_DIR) if diskcache is not None and CACHE_DIR else None
+
+
+def _namespace(model, mode):
+    return f'{model}:{mode}'
+
+
+def _key(text, ns):
+    normalised = _WS_RE.sub(' ', text or '').strip()
+    return hashlib.sha256(f'{ns}\0{normalised}'.encode('utf-8')).hexdigest()
+
+
+def _remember(key, ns, result, vector):
+    with _lock:
+        _entries[key] = {'ns': ns, 'result': copy.deepcopy(result), 'vector': vector}
+        _entries.move_to_end(key)
+        while len(_entries) > MAX_ENTRIES:
+            _entries.popitem(last=False)
+
+
+def _semantic_enabled():
+    return SIMILARITY > 0 and np is not None and SentenceTransformer is not None
+
+
+def _embed(text):
+    """Return an L2-normalised embedding of `text`, or None when unavailable."""
+    global _embedder
+    if not _semantic_enabled():
+        return None
+    try:
+        with _embedder_lock:
+            if _embedder is None:
+                _embedder = SentenceTransformer(EMBED_MODEL)
+        vec = _embedder.encode([text], normalize_embeddings=True)[0]
+        return np.asarray(vec, dtype=np.float32)
+    except Exception:
+        return None
+
+
+def _nearest(ns, vec):
+    """Best cached result in namespace `ns` with cosine similarity >= SIMILARITY."""
+    with _lock:
+        candidates = [(k, e) for k, e in _entries.items() if e['ns'] == ns and e['vector'] is not None]
+        if not candidates:
+            return None
+        matrix = np.stack([e['vector'] for _, e in candidates])
+        scores = matrix @ vec
+        best = int(scores.argmax())
+        if scores[best] < SIMILARITY:
+            return None
+        key, entry = candidates[best]
+        _entries.move_to_end(key)
+        return copy.deepcopy(entry['result'])
+
+
+def get_or_compute(text, compute, model='gpt-4o-mini', mode='strict', **kwargs):
+    """
+    Return the cached LLM result for `text`, or call
+    `compute(text, model=model, mode=mode, **kwargs)` and cache a non-empty result.
+    """
+    ns = _namespace(model, mode)
+    key = _key(text, ns)
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            _entries.move_to_end(key)
+            return copy.deepcopy(entry['result'])
+
+    if _disk is not None:
+        try:
+            hit = _disk.get(key)
+        except Exception:
+            hit = None
+        if hit:
+            _remember(key, ns, hit, None)
+            return hit
+
+    vec = _embed(text)
+    if vec is not None:
+        hit = _nearest(ns, vec)
+        if hit is not None:
+            return hit
+
+    result = compute(text, model=model, mode=mode, **kwargs)
+    if result:
+        _remember(key, ns, result, vec)
+        if _disk is not None:
+            try:
+                _disk.set(key, result)
+            except Exception:
+                pass
+    return result
+
+
+def clear():
+    with _lock:
+        _entries.clear()
+
+
+def save(path=None):
+    """Persist the cache as JSON (no-op without LLM_CACHE_PATH)."""
+    path = path or CACHE_PATH
+    if not path:
+        return
+    with _lock:
+        rows = [
+            {
+                'key': k,
+                'ns': e['ns'],
+                'result': e['result'],
+                'vector': e['vector'].tolist() if e['vector'] is not None else None,
+            }
+            for k, e in _entries.items()
+        ]
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as fh:
+        json.dump(rows, fh)
+    os.replace(tmp, path)
+
+
+def load(path=None):
+    """Warm the cache from a file written by `save`."""
+    path = path or CACHE_PATH
+    if not path or not os.path.exists(path):
+        return
+    try:
+        with open(path, 'r', encoding='utf-8') as fh:
+            rows = json.load(fh)
+    except (OSError, ValueError):
+        return
+    with _lock:
+        for row in rows[-MAX_ENTRIES:]:
+            vector = row.get('vector')
+            if vector is not None and np is not None:
+                vector = np.asarray(vector, dtype=np.float32)
+            else:
+                vector = None
+            _entries[row['key']] = {'ns': row['ns'], 'result': row['result'], 'vector': vector}
+
+
+if CACHE_PATH:
+    load()
+    atexit.register(save)
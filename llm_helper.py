@@ -1,14 +1,299 @@
 import os
 import json
+import time
+import threading
+from collections import deque
 from typing import Optional
 
 import httpx
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
 try:
     from secrets_store import get_api_key as get_stored_api_key
 except Exception:
     get_stored_api_key = None
 
+_client = None
+_client_lock = threading.Lock()
+
+
+def _http_client() -> httpx.Client:
+    """
+    Process-wide client so concurrent extractions reuse pooled keep-alive
+    connections. With h2 installed, calls are multiplexed over one HTTP/2
+    connection instead of one TCP+TLS connection per concurrent call.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                timeout=30.0,
+                http2=_HTTP2,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            )
+        return _client
+
+
+# System prompts for call_llm_extract's `mode`; anything but 'human' is strict
+_SYSTEM_HUMAN = (
+        "You are a resume data extraction expert. Extract ONLY fields explicitly visible in the provided resume text.\n"
+        "Return JSON array with one object containing all 10 fields.\n\n"
+        "EXTRACTION RULES:\n\n"
+        "full_name:\n"
+        "  - The candidate's personal name (first + last, possibly middle)\n"
+        "  - ALWAYS at the very top of the resume in contact section\n"
+        "  - NEVER a company name, school name, institution, certification, or skill\n"
+        "  - 2-4 capitalized words that form a person's name\n"
+        "  - If you see 'University', 'Corporation', 'Inc', 'LLC' - that's NOT a name\n"
+        "  - Example: Extract 'John Smith', NOT 'Stanford University'\n\n"
+        "email:\n"
+        "  - Valid email address in contact info (top of resume)\n"
+        "  - Format: something@domain.ext\n\n"
+        "phone_number:\n"
+        "  - Primary phone, digits only, no formatting, no country code\n"
+        "  - Must have 10+ digits to be valid\n\n"
+        "alternate_phone_number:\n"
+        "  - Secondary phone if listed, null otherwise\n\n"
+        "highest_qualification:\n"
+        "  - ONLY from Education section\n"
+        "  - RETURN ONLY DEGREE TYPE: 'PhD', 'Masters', 'Bachelors', 'Diploma', 'Associate', or 'High School'\n"
+        "  - NEVER return institution name, school, or full text like 'Masters in Computer Science'\n"
+        "  - If multiple degrees: PhD (rank 6) > Masters (5) > Bachelors (4) > Diploma (2) > Associate (3) > High School (1)\n"
+        "  - Return the HIGHEST ranked degree only\n"
+        "  - Example: If 'Bachelors in Science from MIT' and 'Masters in Engineering', return 'Masters'\n\n"
+        "years_of_experience:\n"
+        "  - Total work experience years as NUMBER ONLY (5, 5.5, 10)\n"
+        "  - Sum all jobs if multiple listed with date ranges\n"
+        "  - NEVER include school/education years\n"
+        "  - Format: numeric value only, no text like '5 years'\n\n"
+        "current_company:\n"
+        "  - Company name of the MOST RECENT job (marked 'Present', current year, or latest in list)\n"
+        "  - NEVER include job title, location, or 'Technologies: Python, Java'\n"
+        "  - Just the company name: 'Google', 'Microsoft', 'Acme Corp'\n\n"
+        "current_designation:\n"
+        "  - Job title of the MOST RECENT role only\n"
+        "  - Must match the company from current_company field\n"
+        "  - NEVER include company name, location, or responsibilities\n"
+        "  - Examples: 'Senior Software Engineer', 'Product Manager', 'Data Scientist'\n\n"
+        "city:\n"
+        "  - City of residence (check location/address section)\n"
+        "  - NOT company office location unless that's only location given\n\n"
+        "state:\n"
+        "  - State/region of residence\n\n"
+        "CONFIDENCE & RETURN FORMAT:\n"
+        "- Each field: null OR {\"value\": <value>, \"confidence\": <0.0-1.0>}\n"
+        "- Confidence < 0.8: use null instead\n"
+        "- Return JSON array ONLY with no explanation text\n"
+        "- Example: [{\"full_name\": {\"value\": \"John Smith\", \"confidence\": 0.95}, \"email\": {\"value\": \"john@example.com\", \"confidence\": 0.99}, ...}]"
+)
+
+_SYSTEM_STRICT = (
+        "You are a strict resume parsing agent. Extract ONLY fields explicitly present in resume text.\n"
+        "Return a JSON array with one object containing all 10 required fields.\n\n"
+        "STRICT EXTRACTION RULES:\n\n"
+        "full_name:\n"
+        "  - Candidate's personal name (first + last, possibly middle)\n"
+        "  - MUST be at the very top of resume in contact info\n"
+        "  - KEYWORD BLOCKLIST: If text contains 'University', 'School', 'College', 'Inc', 'Corp', 'LLC', 'Ltd', 'Technologies', 'Institute', 'Academy' - it's NOT a name\n"
+        "  - MUST be 2-4 words that look like a person's name\n"
+        "  - High confidence (0.95+): clear personal name at top\n"
+        "  - Low confidence or null: ambiguous or mixed with other content\n\n"
+        "email:\n"
+        "  - Standard email format: something@domain.extension\n"
+        "  - Located in contact section\n"
+        "  - High confidence (0.95+): valid format found in contact info\n\n"
+        "phone_number:\n"
+        "  - Digits only, no formatting (e.g., '5551234567' not '(555) 123-4567')\n"
+        "  - No country codes or + prefix\n"
+        "  - MUST be 10+ digits to be high confidence\n"
+        "  - Low confidence or null: less than 10 digits or invalid format\n\n"
+        "alternate_phone_number:\n"
+        "  - Same format rules as phone_number\n"
+        "  - Only if a second phone is explicitly listed\n"
+        "  - null if not present\n\n"
+        "highest_qualification:\n"
+        "  - ONLY from Education/Academic section (MANDATORY)\n"
+        "  - RETURN ONLY degree type: 'PhD', 'Masters', 'Bachelors', 'Diploma', 'Associate', 'High School'\n"
+        "  - NEVER include institution name, school name, or subject (e.g., return 'Masters' NOT 'Masters of Computer Science from Stanford')\n"
+        "  - Ranking system: PhD (6) > Masters (5) > Bachelors (4) > Diploma (2) > Associate (3) > High School (1)\n"
+        "  - If multiple degrees: return the ONE with highest rank\n"
+        "  - High confidence: clear degree in Education section\n"
+        "  - null: if Education section not found or degree unclear\n\n"
+        "years_of_experience:\n"
+        "  - NUMERIC VALUE ONLY (5, 5.5, 10, 15) - NO TEXT\n"
+        "  - From Experience section: sum all work experience years\n"
+        "  - EXCLUDE education/school years, internships marked as 'internship'\n"
+        "  - If date ranges given: calculate years between dates\n"
+        "  - High confidence: multiple dated roles that clearly sum\n"
+        "  - null: if no work history found or dates unclear\n\n"
+        "current_company:\n"
+        "  - Company name from MOST RECENT job only\n"
+        "  - Identify as: has 'Present' label OR shows current year (2024-2025) OR is first/top entry\n"
+        "  - Return ONLY company name: 'Google', 'Microsoft', 'IBM' (NOT 'Senior Engineer at Google')\n"
+        "  - High confidence: 'Present' clearly marked\n"
+        "  - null: if current role not identifiable\n\n"
+        "current_designation:\n"
+        "  - Job title from MOST RECENT role ONLY (same role as current_company)\n"
+        "  - Return title only: 'Senior Software Engineer', 'Product Manager' (NOT company name or location)\n"
+        "  - High confidence: clear job title in most recent role\n"
+        "  - null: if current role or title unclear\n\n"
+        "city:\n"
+        "  - City name from residence/location info section\n"
+        "  - NOT workplace or office location (unless no residence given)\n"
+        "  - Plain city name only: 'New York', 'San Francisco'\n\n"
+        "state:\n"
+        "  - State or region from residence/location section\n"
+        "  - Match with city field\n"
+        "  - Plain state name or abbreviation\n\n"
+        "RETURN FORMAT (MANDATORY):\n"
+        "- JSON array with one object\n"
+        "- Each field key: null OR {\"value\": <value>, \"confidence\": <0.0-1.0>}\n"
+        "- Confidence < 0.8: always return null\n"
+        "- NO explanations, NO extra keys, JSON ONLY\n"
+        "- Example: [{\"full_name\": {\"value\": \"Jane Doe\", \"confidence\": 0.95}, \"email\": {\"value\": \"jane@example.com\", \"confidence\": 0.99}, ..., \"state\": null}]"
+)
+
+_SYSTEM_PROMPTS = {'human': _SYSTEM_HUMAN, 'strict': _SYSTEM_STRICT}
+
+
+def _dumps(obj) -> bytes:
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode('utf-8')
+
+
+# Ask for response_format=json_object (LLM_JSON_MODE=1) so the reply is always a
+# bare JSON object and needs no fence stripping. Off by default: not every
+# OpenAI-compatible endpoint accepts response_format, and JSON mode only allows a
+# top-level object, so the prompt asks for the array under "extractions".
+_JSON_MODE = os.getenv('LLM_JSON_MODE', '0') == '1'
+_JSON_MODE_RULE = "\n- Wrap the array in a JSON object: {\"extractions\": [ ... ]}"
+
+# The system message is constant per mode, so its JSON is encoded once here and
+# each request only serialises the model name and the resume text.
+_SYSTEM_MESSAGES_JSON = {
+    mode: _dumps({"role": "system", "content": prompt + (_JSON_MODE_RULE if _JSON_MODE else '')})
+    for mode, prompt in _SYSTEM_PROMPTS.items()
+}
+
+
+class _TokenBudget:
+    """
+    Sliding one-minute token budget shared by every thread in the process.
+    A call reserves its estimated tokens and waits until they fit under the
+    provider's tokens-per-minute limit; spend is refunded as it ages out.
+    """
+
+    def __init__(self, per_minute: int, window: float = 60.0):
+        self._per_minute = per_minute
+        self._window = window
+        self._spent = deque()  # (monotonic time, tokens)
+        self._total = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, tokens: int, timeout: float) -> bool:
+        tokens = min(tokens, self._per_minute)
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                while self._spent and now - self._spent[0][0] >= self._window:
+                    self._total -= self._spent.popleft()[1]
+                if self._total + tokens <= self._per_minute:
+                    self._spent.append((now, tokens))
+                    self._total += tokens
+                    return True
+                remaining = deadline - now
+                if remaining <= 0:
+                    return False
+                self._cond.wait(min(self._window - (now - self._spent[0][0]), remaining))
+
+
+# Provider tokens-per-minute limit for this process (0 = unlimited). Under
+# gunicorn each worker has its own budget, so divide the account limit by the
+# worker count.
+_TOKENS_PER_MIN = int(os.getenv('LLM_TOKENS_PER_MIN', '0'))
+_token_budget = _TokenBudget(_TOKENS_PER_MIN) if _TOKENS_PER_MIN > 0 else None
+_MAX_COMPLETION_TOKENS = 1500
+# Stream completions and stop reading as soon as the model's JSON closes
+# (LLM_STREAM=1). Off by default: not every OpenAI-compatible endpoint streams,
+# and abandoning an HTTP/1.1 response costs its keep-alive connection.
+_STREAM = os.getenv('LLM_STREAM', '0') == '1'
+# Send only the top of the resume plus its experience and education sections
+# instead of the whole text (LLM_SNIPPETS=1). Off by default: fields outside
+# those parts (a location in a late "Contact" block, say) are no longer seen.
+_SNIPPETS = os.getenv('LLM_SNIPPETS', '0') == '1'
+_SNIPPET_HEAD_LINES = 25
+
+
+def _resume_snippet(text: str) -> str:
+    """
+    The lines that carry the contact details, plus the experience and education
+    sections; the full text when neither section is found or nothing is saved.
+    """
+    from resume_parser import extract_section
+    experience = extract_section(text, ['experience', 'work experience', 'employment', 'professional'])
+    education = extract_section(text, ['education', 'academic', 'qualifications'])
+    if not experience and not education:
+        return text
+    parts = ['\n'.join(text.split('\n', _SNIPPET_HEAD_LINES)[:_SNIPPET_HEAD_LINES])]
+    if experience:
+        parts.append('Experience:\n' + experience)
+    if education:
+        parts.append('Education:\n' + education)
+    snippet = '\n\n'.join(parts)
+    return snippet if len(snippet) < len(text) else text
+
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _read_streamed_content(response: httpx.Response) -> str:
+    """
+    Collect the assistant text from a server-sent-events completion stream,
+    returning once the top-level JSON array/object the model is writing closes
+    instead of waiting for the rest of the stream.
+    """
+    parts = []
+    depth = 0
+    in_string = escaped = False
+    for line in response.iter_lines():
+        if not line.startswith('data:'):
+            continue
+        data = line[5:].strip()
+        if data == '[DONE]':
+            break
+        choices = _json_loads(data).get('choices') or [{}]
+        piece = (choices[0].get('delta') or {}).get('content') or choices[0].get('text') or ''
+        for i, ch in enumerate(piece):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == '\\':
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch in '[{':
+                depth += 1
+            elif ch in ']}':
+                depth -= 1
+                if depth == 0:
+                    parts.append(piece[:i + 1])
+                    return ''.join(parts)
+        parts.append(piece)
+    return ''.join(parts)
+
 
 def call_llm_extract(text: str, api_key: str = None, api_url: str = None, model: str = 'gpt-4o-mini', mode: str = 'strict') -> Optional[list]:
     """
@@ -31,169 +316,72 @@ def call_llm_extract(text: str, api_key: str = None, api_url: str = None, model:
 
     api_url = api_url or os.getenv('GROK_API_URL') or 'https://api.openai.com/v1/chat/completions'
 
-    if mode == 'human':
-        system = (
-            "You are a resume data extraction expert. Extract ONLY fields explicitly visible in the provided resume text.\n"
-            "Return JSON array with one object containing all 10 fields.\n\n"
-            "EXTRACTION RULES:\n\n"
-            "full_name:\n"
-            "  - The candidate's personal name (first + last, possibly middle)\n"
-            "  - ALWAYS at the very top of the resume in contact section\n"
-            "  - NEVER a company name, school name, institution, certification, or skill\n"
-            "  - 2-4 capitalized words that form a person's name\n"
-            "  - If you see 'University', 'Corporation', 'Inc', 'LLC' - that's NOT a name\n"
-            "  - Example: Extract 'John Smith', NOT 'Stanford University'\n\n"
-            "email:\n"
-            "  - Valid email address in contact info (top of resume)\n"
-            "  - Format: something@domain.ext\n\n"
-            "phone_number:\n"
-            "  - Primary phone, digits only, no formatting, no country code\n"
-            "  - Must have 10+ digits to be valid\n\n"
-            "alternate_phone_number:\n"
-            "  - Secondary phone if listed, null otherwise\n\n"
-            "highest_qualification:\n"
-            "  - ONLY from Education section\n"
-            "  - RETURN ONLY DEGREE TYPE: 'PhD', 'Masters', 'Bachelors', 'Diploma', 'Associate', or 'High School'\n"
-            "  - NEVER return institution name, school, or full text like 'Masters in Computer Science'\n"
-            "  - If multiple degrees: PhD (rank 6) > Masters (5) > Bachelors (4) > Diploma (2) > Associate (3) > High School (1)\n"
-            "  - Return the HIGHEST ranked degree only\n"
-            "  - Example: If 'Bachelors in Science from MIT' and 'Masters in Engineering', return 'Masters'\n\n"
-            "years_of_experience:\n"
-            "  - Total work experience years as NUMBER ONLY (5, 5.5, 10)\n"
-            "  - Sum all jobs if multiple listed with date ranges\n"
-            "  - NEVER include school/education years\n"
-            "  - Format: numeric value only, no text like '5 years'\n\n"
-            "current_company:\n"
-            "  - Company name of the MOST RECENT job (marked 'Present', current year, or latest in list)\n"
-            "  - NEVER include job title, location, or 'Technologies: Python, Java'\n"
-            "  - Just the company name: 'Google', 'Microsoft', 'Acme Corp'\n\n"
-            "current_designation:\n"
-            "  - Job title of the MOST RECENT role only\n"
-            "  - Must match the company from current_company field\n"
-            "  - NEVER include company name, location, or responsibilities\n"
-            "  - Examples: 'Senior Software Engineer', 'Product Manager', 'Data Scientist'\n\n"
-            "city:\n"
-            "  - City of residence (check location/address section)\n"
-            "  - NOT company office location unless that's only location given\n\n"
-            "state:\n"
-            "  - State/region of residence\n\n"
-            "CONFIDENCE & RETURN FORMAT:\n"
-            "- Each field: null OR {\"value\": <value>, \"confidence\": <0.0-1.0>}\n"
-            "- Confidence < 0.8: use null instead\n"
-            "- Return JSON array ONLY with no explanation text\n"
-            "- Example: [{\"full_name\": {\"value\": \"John Smith\", \"confidence\": 0.95}, \"email\": {\"value\": \"john@example.com\", \"confidence\": 0.99}, ...}]"
-        )
-    else:
-        system = (
-            "You are a strict resume parsing agent. Extract ONLY fields explicitly present in resume text.\n"
-            "Return a JSON array with one object containing all 10 required fields.\n\n"
-            "STRICT EXTRACTION RULES:\n\n"
-            "full_name:\n"
-            "  - Candidate's personal name (first + last, possibly middle)\n"
-            "  - MUST be at the very top of resume in contact info\n"
-            "  - KEYWORD BLOCKLIST: If text contains 'University', 'School', 'College', 'Inc', 'Corp', 'LLC', 'Ltd', 'Technologies', 'Institute', 'Academy' - it's NOT a name\n"
-            "  - MUST be 2-4 words that look like a person's name\n"
-            "  - High confidence (0.95+): clear personal name at top\n"
-            "  - Low confidence or null: ambiguous or mixed with other content\n\n"
-            "email:\n"
-            "  - Standard email format: something@domain.extension\n"
-            "  - Located in contact section\n"
-            "  - High confidence (0.95+): valid format found in contact info\n\n"
-            "phone_number:\n"
-            "  - Digits only, no formatting (e.g., '5551234567' not '(555) 123-4567')\n"
-            "  - No country codes or + prefix\n"
-            "  - MUST be 10+ digits to be high confidence\n"
-            "  - Low confidence or null: less than 10 digits or invalid format\n\n"
-            "alternate_phone_number:\n"
-            "  - Same format rules as phone_number\n"
-            "  - Only if a second phone is explicitly listed\n"
-            "  - null if not present\n\n"
-            "highest_qualification:\n"
-            "  - ONLY from Education/Academic section (MANDATORY)\n"
-            "  - RETURN ONLY degree type: 'PhD', 'Masters', 'Bachelors', 'Diploma', 'Associate', 'High School'\n"
-            "  - NEVER include institution name, school name, or subject (e.g., return 'Masters' NOT 'Masters of Computer Science from Stanford')\n"
-            "  - Ranking system: PhD (6) > Masters (5) > Bachelors (4) > Diploma (2) > Associate (3) > High School (1)\n"
-            "  - If multiple degrees: return the ONE with highest rank\n"
-            "  - High confidence: clear degree in Education section\n"
-            "  - null: if Education section not found or degree unclear\n\n"
-            "years_of_experience:\n"
-            "  - NUMERIC VALUE ONLY (5, 5.5, 10, 15) - NO TEXT\n"
-            "  - From Experience section: sum all work experience years\n"
-            "  - EXCLUDE education/school years, internships marked as 'internship'\n"
-            "  - If date ranges given: calculate years between dates\n"
-            "  - High confidence: multiple dated roles that clearly sum\n"
-            "  - null: if no work history found or dates unclear\n\n"
-            "current_company:\n"
-            "  - Company name from MOST RECENT job only\n"
-            "  - Identify as: has 'Present' label OR shows current year (2024-2025) OR is first/top entry\n"
-            "  - Return ONLY company name: 'Google', 'Microsoft', 'IBM' (NOT 'Senior Engineer at Google')\n"
-            "  - High confidence: 'Present' clearly marked\n"
-            "  - null: if current role not identifiable\n\n"
-            "current_designation:\n"
-            "  - Job title from MOST RECENT role ONLY (same role as current_company)\n"
-            "  - Return title only: 'Senior Software Engineer', 'Product Manager' (NOT company name or location)\n"
-            "  - High confidence: clear job title in most recent role\n"
-            "  - null: if current role or title unclear\n\n"
-            "city:\n"
-            "  - City name from residence/location info section\n"
-            "  - NOT workplace or office location (unless no residence given)\n"
-            "  - Plain city name only: 'New York', 'San Francisco'\n\n"
-            "state:\n"
-            "  - State or region from residence/location section\n"
-            "  - Match with city field\n"
-            "  - Plain state name or abbreviation\n\n"
-            "RETURN FORMAT (MANDATORY):\n"
-            "- JSON array with one object\n"
-            "- Each field key: null OR {\"value\": <value>, \"confidence\": <0.0-1.0>}\n"
-            "- Confidence < 0.8: always return null\n"
-            "- NO explanations, NO extra keys, JSON ONLY\n"
-            "- Example: [{\"full_name\": {\"value\": \"Jane Doe\", \"confidence\": 0.95}, \"email\": {\"value\": \"jane@example.com\", \"confidence\": 0.99}, ..., \"state\": null}]"
-        )
+    if mode not in _SYSTEM_PROMPTS:
+        mode = 'strict'
+    system = _SYSTEM_PROMPTS[mode]
+
+    if _SNIPPETS:
+        text = _resume_snippet(text)
 
     user = (
         "Here is the resume text delimited by triple backticks. Extract fields per the strict rules. "
         "Resume text:\n```\n" + text + "\n```"
     )
 
-    # Build request payload for OpenAI Chat Completions API
-    payload = {
-        "model": model,
-        "messages": [
-            {"role": "system", "content": system},
-            {"role": "user", "content": user},
-        ],
-        "temperature": 0.0,
-        "max_tokens": 1500,
-    }
+    # Build request body for OpenAI Chat Completions API:
+    # {"model", "messages": [system, user], "temperature", "max_tokens"[, "stream"]}
+    body = b''.join((
+        b'{"model":', _dumps(model),
+        b',"messages":[', _SYSTEM_MESSAGES_JSON[mode], b',', _dumps({"role": "user", "content": user}),
+        b'],"temperature":0.0,"max_tokens":', str(_MAX_COMPLETION_TOKENS).encode(),
+        b',"response_format":{"type":"json_object"}' if _JSON_MODE else b'',
+        b',"stream":true}' if _STREAM else b'}',
+    ))
 
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
 
+    # ~4 characters per token for the prompt, plus the completion allowance
+    if _token_budget is not None:
+        estimate = (len(system) + len(user)) // 4 + _MAX_COMPLETION_TOKENS
+        if not _token_budget.acquire(estimate, timeout=30):
+            return None
+
     try:
-        with httpx.Client(timeout=30.0) as client:
-            r = client.post(api_url, headers=headers, json=payload)
+        if _STREAM:
+            with _http_client().stream('POST', api_url, headers=headers, content=body) as r:
+                r.raise_for_status()
+                content = _read_streamed_content(r)
+        else:
+            r = _http_client().post(api_url, headers=headers, content=body)
             r.raise_for_status()
-            j = r.json()
+            j = _json_loads(r.content)
             # Attempt to retrieve assistant content
             if 'choices' in j and len(j['choices']) > 0:
                 content = j['choices'][0].get('message', {}).get('content') or j['choices'][0].get('text')
             else:
                 content = j.get('text')
-            if not content:
-                return None
-            # The model should return a JSON array where each field is either null or {"value":..., "confidence":...}
-            content = content.strip()
-            # strip possible code fences
-            if content.startswith('```'):
-                parts = content.split('```')
-                if len(parts) >= 2:
-                    content = parts[1].strip()
-            parsed = json.loads(content)
-            # normalize structure: ensure array of objects
-            if isinstance(parsed, dict):
-                return [parsed]
-            return parsed
+        if not content:
+            return None
+        if _JSON_MODE:
+            parsed = _json_loads(content)
+            extractions = parsed.get('extractions') if isinstance(parsed, dict) else None
+            if isinstance(extractions, list):
+                return extractions
+            return [parsed] if isinstance(parsed, dict) else parsed
+        # The model should return a JSON array where each field is either null or {"value":..., "confidence":...}
+        content = content.strip()
+        # strip possible code fences
+        if content.startswith('```'):
+            parts = content.split('```')
+            if len(parts) >= 2:
+                content = parts[1].strip()
+        parsed = _json_loads(content)
+        # normalize structure: ensure array of objects
+        if isinstance(parsed, dict):
+            return [parsed]
+        return parsed
     except Exception:
         return None
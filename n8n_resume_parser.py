@@ -3,6 +3,7 @@
 Simplified Resume Parser for n8n Automation
 Direct command-line interface for the resume parsing logic
 Usage: python n8n_resume_parser.py <file_path>
+       python n8n_resume_parser.py --server   (one path or JSON request per stdin line, one JSON per stdout line)
 """
 
 import sys
@@ -15,7 +16,7 @@ from pathlib import Path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from resume_parser import extract_text, parse_resume
+    from resume_parser import extract_text, parse_resume, parse_resume_from_text, clean_text
 except ImportError:
     print("ERROR: resume_parser.py not found")
     sys.exit(1)
@@ -38,16 +39,17 @@ def extract_resume_text(file_path: str) -> str:
 
 def parse_resume_content(file_path: str, text_content: str = None) -> dict:
     """Parse resume and return structured data"""
+    output = build_resume_output(file_path, text_content)
+    print(json.dumps(output, indent=2))
+    return output
+
+
+def build_resume_output(file_path: str, text_content: str = None) -> dict:
+    """Parse a resume into the output record without printing it"""
     try:
         if text_content:
-            # Parse from provided text
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-                f.write(text_content)
-                temp_path = f.name
-            
-            result = parse_resume(temp_path)
-            os.unlink(temp_path)
+            # Parse from provided text, cleaned the way extract_text cleans a file
+            result = parse_resume_from_text(clean_text(text_content))
         else:
             # Parse from file directly
             result = parse_resume(file_path)
@@ -62,30 +64,76 @@ def parse_resume_content(file_path: str, text_content: str = None) -> dict:
             "parsed_at": __import__('datetime').datetime.now().isoformat(),
             "success": bool(result.get('full_name') or result.get('email'))
         }
-        
-        print(json.dumps(output, indent=2))
         return output
         
     except Exception as e:
-        error_output = {
+        return {
             "filename": Path(file_path).name,
             "file_path": file_path,
             "error": str(e),
             "success": False,
             "parsed_at": __import__('datetime').datetime.now().isoformat()
         }
-        print(json.dumps(error_output, indent=2))
-        return error_output
+
+
+def _server_request(line: str) -> dict:
+    """
+    Handle one --server request line: a file path, or a JSON object
+    {"file_path": ..., "text": ...} whose optional text is parsed instead of the file.
+    Malformed requests get a "status": 400 error record.
+    """
+    if not line.startswith('{'):
+        file_path, text = line, None
+    else:
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return {"error": f"Malformed JSON request: {e}", "status": 400, "success": False}
+        file_path, text = request.get('file_path'), request.get('text')
+        if not isinstance(file_path, str) or not file_path or not isinstance(text, (str, type(None))):
+            return {"error": "file_path must be a non-empty string and text a string",
+                    "status": 400, "success": False}
+    if text is None and not os.path.exists(file_path):
+        return {"file_path": file_path, "error": f"File not found: {file_path}", "status": 404, "success": False}
+    return build_resume_output(file_path, text)
+
+
+def serve(stdin=sys.stdin, stdout=sys.stdout):
+    """
+    Long-lived worker: read one request per line and write one JSON result per
+    line, so a batch pays interpreter start-up and imports once instead of per file.
+    A bad request gets an error record; the worker keeps serving.
+    """
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            output = _server_request(line)
+        except Exception as e:
+            output = {"error": str(e), "status": 500, "success": False}
+        stdout.write(json.dumps(output) + '\n')
+        stdout.flush()
 
 
 def main():
     parser = argparse.ArgumentParser(description='Resume Parser for n8n Automation')
-    parser.add_argument('file_path', help='Path to resume file')
+    parser.add_argument('file_path', nargs='?', help='Path to resume file')
     parser.add_argument('--extract-text-only', action='store_true', 
                        help='Only extract text content without parsing')
+    parser.add_argument('--server', action='store_true',
+                       help='Read file paths from stdin and write one JSON result per line')
     
     args = parser.parse_args()
     
+    if args.server:
+        # Undecodable bytes in a path must not end the worker
+        sys.stdin.reconfigure(errors='surrogateescape')
+        serve()
+        return
+    if not args.file_path:
+        parser.error('file_path is required unless --server is given')
+    
     file_path = args.file_path
     
     # Validate file exists
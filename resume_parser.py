@@ -11,9 +11,33 @@ from typing import List, Dict, Optional, Tuple
 import logging
 from io import BytesIO
 import argparse
-import pandas as pd
+import codecs
+import hashlib
+import tempfile
+import threading
 import concurrent.futures
-from functools import partial
+from collections import OrderedDict
+from functools import partial, lru_cache
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import charset_normalizer
+except ImportError:
+    charset_normalizer = None
+
+try:
+    import olefile
+except ImportError:
+    olefile = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
 
 # Configure logging
 logging.basicConfig(
@@ -77,55 +101,96 @@ def extract_text(file_path: str) -> str:
         return ""
 
 
+def extract_text_from_bytes(data: bytes, ext: str) -> str:
+    """
+    extract_text() for content already in memory. Plain text (and unknown
+    extensions, which extract_text reads as text) is decoded without touching
+    the filesystem; PDF/DOCX/DOC are spooled to a temporary file because their
+    backends, LibreOffice in particular, want a path.
+    """
+    ext = ext.lower()
+    if ext in ('.pdf', '.docx', '.doc'):
+        with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as f:
+            f.write(data)
+            temp_path = f.name
+        try:
+            return extract_text(temp_path)
+        finally:
+            os.unlink(temp_path)
+    
+    try:
+        text = _decode_txt(data)
+        if text and text.strip():
+            return clean_text(text)
+        return _printable_text(data)
+    except Exception as e:
+        logger.error(f"All extraction methods failed for in-memory {ext or 'text'}: {e}")
+        return ""
+
+
 def extract_pdf(file_path: str) -> str:
-    """Extract text from PDF with 4 fallback methods."""
-    text = ""
+    """Extract text from PDF with 5 fallback methods."""
+    # Each method collects page texts in a list and joins once, returning as
+    # soon as one yields non-blank text
     
-    # Method 1: PyPDF2 (most compatible)
+    # Method 1: pypdfium2 (PDFium, native and much faster than the pure-Python
+    # readers; PARSE_PDF_BACKEND=pypdf skips it)
+    if os.getenv('PARSE_PDF_BACKEND', 'pdfium') != 'pypdf':
+        try:
+            import pypdfium2
+            pdf = pypdfium2.PdfDocument(file_path)
+            try:
+                page_texts = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    page_texts.append(textpage.get_text_range().replace('\r\n', '\n'))
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+            text = _join_pages(page_texts)
+            if text.strip():
+                logger.debug(f"pypdfium2 extraction successful for {file_path}")
+                return text
+        except Exception as e:
+            logger.debug(f"pypdfium2 failed: {e}")
+    
+    # Method 2: PyPDF2 (most compatible)
     try:
         import PyPDF2
         with open(file_path, 'rb') as f:
             reader = PyPDF2.PdfReader(f)
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+            text = _join_pages(page.extract_text() for page in reader.pages)
         if text.strip():
             logger.debug(f"PyPDF2 extraction successful for {file_path}")
             return text
     except Exception as e:
         logger.debug(f"PyPDF2 failed: {e}")
     
-    # Method 2: pdfplumber (better for tables)
+    # Method 3: pdfplumber (better for tables)
     try:
         import pdfplumber
         with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+            text = _join_pages(page.extract_text() for page in pdf.pages)
         if text.strip():
             logger.debug(f"pdfplumber extraction successful for {file_path}")
             return text
     except Exception as e:
         logger.debug(f"pdfplumber failed: {e}")
     
-    # Method 3: pypdf (alternative)
+    # Method 4: pypdf (alternative)
     try:
         from pypdf import PdfReader
         with open(file_path, 'rb') as f:
             reader = PdfReader(f)
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+            text = _join_pages(page.extract_text() for page in reader.pages)
         if text.strip():
             logger.debug(f"pypdf extraction successful for {file_path}")
             return text
     except Exception as e:
         logger.debug(f"pypdf failed: {e}")
     
-    # Method 4: pdfminer
+    # Method 5: pdfminer
     try:
         from pdfminer.high_level import extract_text as pdfminer_extract
         text = pdfminer_extract(file_path)
@@ -135,7 +200,12 @@ def extract_pdf(file_path: str) -> str:
     except Exception as e:
         logger.debug(f"pdfminer failed: {e}")
     
-    return text
+    return ""
+
+
+def _join_pages(page_texts) -> str:
+    """Non-empty page texts, each followed by a newline."""
+    return ''.join(page_text + "\n" for page_text in page_texts if page_text)
 
 
 def extract_docx(file_path: str) -> str:
@@ -179,12 +249,84 @@ def extract_docx(file_path: str) -> str:
     return ""
 
 
+# Word binary control characters: drop field codes (\x13 code \x14 result \x15),
+# objects and soft hyphens; cell/row marks, page and line breaks become newlines
+_DOC_FIELD_CODE_RE = re.compile('\x13[^\x13\x14\x15]*(?:\x14|(?=\x15))')
+_DOC_CONTROL_TABLE = str.maketrans({'\r': '\n', '\x07': '\n', '\x0b': '\n', '\x0c': '\n',
+                                    '\x1e': '-', '\x1f': None, '\x15': None,
+                                    '\x01': None, '\x08': None})
+
+
+def _u16(buf: bytes, pos: int) -> int:
+    return int.from_bytes(buf[pos:pos + 2], 'little')
+
+
+def _u32(buf: bytes, pos: int) -> int:
+    return int.from_bytes(buf[pos:pos + 4], 'little')
+
+
+def _extract_doc_olefile(file_path: str) -> str:
+    """
+    Main-document text of a Word 97-2003 file, read in-process from the
+    WordDocument stream's piece table (MS-DOC Clx/PlcPcd).
+    """
+    with olefile.OleFileIO(file_path) as ole:
+        word = ole.openstream('WordDocument').read()
+        flags = _u16(word, 0x0A)
+        if _u16(word, 0) != 0xA5EC or flags & 0x0100:  # not Word 97+, or encrypted
+            return ""
+        table = ole.openstream('1Table' if flags & 0x0200 else '0Table').read()
+        
+        # FibBase (32 bytes), then FibRgW97, FibRgLw97 and FibRgFcLcb97
+        pos = 32
+        pos += 2 + _u16(word, pos) * 2
+        ccp_text = _u32(word, pos + 2 + 3 * 4)
+        pos += 2 + _u16(word, pos) * 4
+        fc_clx = _u32(word, pos + 2 + 33 * 8)
+        lcb_clx = _u32(word, pos + 2 + 33 * 8 + 4)
+    
+    clx = table[fc_clx:fc_clx + lcb_clx]
+    pos = 0
+    while pos < len(clx) and clx[pos] == 0x01:  # skip Prc entries
+        pos += 3 + _u16(clx, pos + 1)
+    if pos >= len(clx) or clx[pos] != 0x02:
+        return ""
+    plc = clx[pos + 5:pos + 5 + _u32(clx, pos + 1)]
+    count = (len(plc) - 4) // 12
+    
+    parts = []
+    for i in range(count):
+        cp_start, cp_end = _u32(plc, i * 4), _u32(plc, i * 4 + 4)
+        if cp_start >= ccp_text:
+            break
+        length = min(cp_end, ccp_text) - cp_start
+        fc = _u32(plc, (count + 1) * 4 + i * 8 + 2)
+        if fc & 0x40000000:  # compressed: 8-bit cp1252
+            offset = (fc & 0x3FFFFFFF) // 2
+            parts.append(word[offset:offset + length].decode('cp1252', errors='replace'))
+        else:
+            parts.append(word[fc:fc + length * 2].decode('utf-16-le', errors='replace'))
+    
+    text = _DOC_FIELD_CODE_RE.sub('', ''.join(parts))
+    return text.translate(_DOC_CONTROL_TABLE)
+
+
 def extract_doc(file_path: str) -> str:
     """Extract text from legacy DOC format."""
-    # Try converting to DOCX first
+    # Read the binary format in-process first: a LibreOffice conversion costs
+    # a process start per file
+    if olefile is not None:
+        try:
+            text = _extract_doc_olefile(file_path)
+            if text.strip():
+                logger.debug(f"olefile extraction successful for {file_path}")
+                return text
+        except Exception as e:
+            logger.debug(f"olefile DOC read failed: {e}")
+    
+    # Try converting to DOCX
     try:
         import subprocess
-        import tempfile
         
         with tempfile.TemporaryDirectory() as tmpdir:
             output_path = os.path.join(tmpdir, "converted.docx")
@@ -216,46 +358,93 @@ def extract_doc(file_path: str) -> str:
     return ""
 
 
+def _detect_encoding(raw: bytes) -> str:
+    """BOM first, then UTF-8, then charset_normalizer's guess when installed."""
+    if raw.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    try:
+        raw.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    if charset_normalizer is not None:
+        best = charset_normalizer.from_bytes(raw).best()
+        if best is not None:
+            return best.encoding
+    return 'utf-8'
+
+
 def extract_txt(file_path: str) -> str:
     """Extract text from TXT with encoding detection."""
-    encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'iso-8859-1', 'cp1252', 'utf-16']
-    
-    for encoding in encodings:
-        try:
-            with open(file_path, 'r', encoding=encoding, errors='replace') as f:
-                text = f.read()
-                if text.strip():
-                    logger.debug(f"TXT extraction successful with {encoding}")
-                    return text
-        except Exception as e:
-            logger.debug(f"Failed to read with {encoding}: {e}")
-            continue
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+    except Exception as e:
+        logger.debug(f"Failed to read {file_path}: {e}")
+        return ""
     
+    return _decode_txt(raw)
+
+
+def _decode_txt(raw: bytes) -> str:
+    """Decode plain-text bytes with encoding detection; "" if blank."""
+    encoding = _detect_encoding(raw)
+    text = raw.decode(encoding, errors='replace')
+    # Universal newlines, as text-mode open() gave
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    if text.strip():
+        logger.debug(f"TXT extraction successful with {encoding}")
+        return text
     return ""
 
 
+class _PrintableTable(dict):
+    """
+    str.translate table that keeps printable characters plus newline and tab
+    and deletes the rest, filling itself in as code points are first seen so
+    the filtering loop stays in C. Only the BMP is memoised to bound its size.
+    """
+    def __missing__(self, code_point):
+        char = chr(code_point)
+        value = code_point if char.isprintable() or char in '\n\t' else None
+        if code_point < 0x10000:
+            self[code_point] = value
+        return value
+
+
+_PRINTABLE_TABLE = _PrintableTable()
+
+
 def extract_binary_fallback(file_path: str) -> str:
     """Last resort: extract readable text from binary."""
     try:
         with open(file_path, 'rb') as f:
             content = f.read()
-        
-        # Try each encoding
-        for encoding in ['utf-8', 'latin-1', 'cp1252']:
-            try:
-                text = content.decode(encoding, errors='replace')
-                # Keep only printable characters
-                text = ''.join(c for c in text if c.isprintable() or c in '\n\t')
-                if text.strip():
-                    return text
-            except Exception:
-                continue
+        return _printable_text(content)
     except Exception as e:
         logger.error(f"Binary fallback failed: {e}")
     
     return ""
 
 
+def _printable_text(content: bytes) -> str:
+    """The printable characters of `content` under the first encoding that leaves any."""
+    # Try each encoding
+    for encoding in ['utf-8', 'latin-1', 'cp1252']:
+        try:
+            text = content.decode(encoding, errors='replace')
+            # Keep only printable characters
+            text = text.translate(_PRINTABLE_TABLE)
+            if text.strip():
+                return text
+        except Exception:
+            continue
+    
+    return ""
+
+
 def clean_text(text: str) -> str:
     """Clean and normalize extracted text."""
     if not text:
@@ -264,30 +453,103 @@ def clean_text(text: str) -> str:
     # Normalize line endings
     text = text.replace('\r\n', '\n').replace('\r', '\n')
     
-    # Remove excessive whitespace
+    # Remove excessive whitespace and duplicate consecutive lines in one pass
     lines = []
-    prev_empty = False
+    prev = None
     
     for line in text.split('\n'):
-        stripped = line.strip()
-        
-        if not stripped:
-            if not prev_empty:
-                lines.append('')
-            prev_empty = True
-        else:
-            # Normalize internal whitespace
-            cleaned = ' '.join(stripped.split())
+        # Normalize internal whitespace; blank runs collapse to one ''
+        cleaned = ' '.join(line.split())
+        if cleaned != prev:
             lines.append(cleaned)
-            prev_empty = False
+            prev = cleaned
     
-    # Remove duplicate consecutive lines
-    unique_lines = []
-    for line in lines:
-        if not unique_lines or unique_lines[-1] != line:
-            unique_lines.append(line)
-    
-    return '\n'.join(unique_lines).strip()
+    return '\n'.join(lines).strip()
+
+
+# ============================================================================
+# COMPILED PATTERNS - built once at import instead of on every call
+# ============================================================================
+
+# Name blocklist patterns
+_NAME_BLOCKLIST_RE = re.compile(
+    r'\b(resume|cv|curriculum|vitae|contact|profile|summary|objective|'
+    r'university|college|school|institute|company|inc|corp|llc|ltd|'
+    r'technologies|solutions|systems|email|phone|address)\b', re.I)
+_CONTACT_RE = re.compile(r'@|http|www|\d{7,}')
+# 2-4 whitespace-separated name components: capitalised words (optionally
+# hyphenated or with an apostrophe), initials, or a Jr/Sr/II/III suffix
+_NAME_WORD = r"(?:[A-Z][a-z]+(?:['-][A-Z][a-z]+)?|[A-Z]\.?|Jr|Sr|II|III)"
+_NAME_LINE_RE = re.compile(rf"{_NAME_WORD}(?:\s+{_NAME_WORD}){{1,3}}")
+
+# Years of experience, most specific first
+_EXPERIENCE_RES = [
+    re.compile(r'(\d+(?:\.\d+)?)\s*\+?\s*years?\s+of\s+(?:work|professional|total)?\s*experience', re.I),
+    re.compile(r'experience\s*[:\-]\s*(\d+(?:\.\d+)?)\s*\+?\s*years?', re.I),
+    re.compile(r'(\d+(?:\.\d+)?)\s*\+?\s*(?:yrs?|years?)\s+experience', re.I),
+    re.compile(r'total\s+experience\s*[:\-]?\s*(\d+(?:\.\d+)?)\s*years?', re.I),
+]
+
+# Job title keywords
+_TITLE_KEYWORDS_RE = re.compile(
+    r'\b(engineer|developer|analyst|manager|director|lead|senior|junior|'
+    r'associate|specialist|consultant|architect|designer|coordinator|'
+    r'executive|officer|administrator|supervisor|intern|trainee)\b', re.I)
+_COMPANY_PRESENT_RE = re.compile(r'\b(present|current|till\s+now|ongoing)\b', re.I)
+_DESIGNATION_PRESENT_RE = re.compile(r'\b(present|current)\b', re.I)
+_DATE_RANGE_RE = re.compile(r'\b\w{3,4}\s+\d{4}\s*[-–]\s*(present|current|\d{4})\b', re.I)
+_TITLE_DATE_RE = re.compile(r'\b\w{3}\s+\d{4}\s*[-–]\s*\w+\b')
+_AT_RE = re.compile(r'(.+?)\s+at\s+(.+)', re.I)
+_COMPANY_INDICATORS_RE = re.compile(
+    r'\b(inc|corp|corporation|company|ltd|llc|co|limited|technologies|'
+    r'solutions|systems|group|services|consulting|pvt)\b', re.I)
+
+KNOWN_COMPANIES = ['google', 'microsoft', 'amazon', 'apple', 'facebook', 'meta', 'netflix',
+                   'tesla', 'ibm', 'oracle', 'adobe', 'salesforce', 'linkedin', 'twitter']
+
+# Common cities and states (expandable)
+CITIES = [
+    'bangalore', 'bengaluru', 'mumbai', 'delhi', 'hyderabad', 'chennai',
+    'kolkata', 'pune', 'ahmedabad', 'jaipur', 'surat', 'lucknow', 'kanpur',
+    'new york', 'san francisco', 'los angeles', 'chicago', 'boston', 'seattle',
+    'london', 'paris', 'berlin', 'toronto', 'sydney', 'singapore'
+]
+STATES = [
+    'california', 'new york', 'texas', 'florida', 'illinois', 'washington',
+    'maharashtra', 'karnataka', 'tamil nadu', 'delhi', 'uttar pradesh',
+    'west bengal', 'gujarat', 'rajasthan', 'telangana', 'andhra pradesh'
+]
+
+
+def _alias_pattern(aliases):
+    """One word-bounded alternation over `aliases`; group 1 is the alias that matched."""
+    return re.compile(r'\b(' + '|'.join(re.escape(alias) for alias in aliases) + r')\b')
+
+
+def _best_alias(pattern, ranks, text):
+    """
+    Rank of the matched alias listed first in its table (not the one first in
+    the text), from a single scan of `text`; None when nothing matches.
+    """
+    best = None
+    for match in pattern.finditer(text):
+        rank = ranks[match.group(1)]
+        if best is None or rank < best:
+            best = rank
+            if best == 0:
+                break
+    return best
+
+
+# Each table is scanned once per resume instead of once per alias
+_CITY_RE = _alias_pattern(CITIES)
+_CITY_RANK = {city: rank for rank, city in enumerate(CITIES)}
+_STATE_RE = _alias_pattern(STATES)
+_STATE_RANK = {state: rank for rank, state in enumerate(STATES)}
+_KNOWN_COMPANY_RE = _alias_pattern(KNOWN_COMPANIES)
+_KNOWN_COMPANY_RANK = {company: rank for rank, company in enumerate(KNOWN_COMPANIES)}
+_CITY_STATE_RE = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*([A-Z][a-z]+)')
+_STATE_AFTER_CITY_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?,\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)')
 
 
 # ============================================================================
@@ -296,44 +558,99 @@ def clean_text(text: str) -> str:
 
 def extract_name(text: str) -> Optional[str]:
     """Extract candidate name with high confidence."""
-    lines = [l.strip() for l in text.split('\n') if l.strip()][:15]
-    
-    # Blocklist patterns
-    blocklist = r'\b(resume|cv|curriculum|vitae|contact|profile|summary|objective|' \
-                r'university|college|school|institute|company|inc|corp|llc|ltd|' \
-                r'technologies|solutions|systems|email|phone|address)\b'
+    lines = _content_lines(text)[:15]
     
     for line in lines:
         # Skip lines with blocklist keywords
-        if re.search(blocklist, line, re.I):
+        if _NAME_BLOCKLIST_RE.search(line):
             continue
         
         # Skip lines with emails, phones, URLs
-        if re.search(r'@|http|www|\d{7,}', line):
-            continue
-        
-        # Extract name pattern: 2-4 capitalized words
-        words = line.split()
-        if not (2 <= len(words) <= 4):
+        if _CONTACT_RE.search(line):
             continue
         
-# Check each word is a valid name component
-        valid = all(re.match(r"^[A-Z][a-z]+(?:['-][A-Z][a-z]+)?$|^[A-Z]\.?$", w) or w in ['Jr', 'Sr', 'II', 'III'] 
-                   for w in words)
-        
-        if valid:
+        # Extract name pattern: 2-4 capitalized words, matched as a whole line
+        if _NAME_LINE_RE.fullmatch(line):
             return line
     
     return None
 
 
+_EMAIL_RE = re.compile(r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b')
+
+# Comprehensive phone patterns, in priority order
+_PHONE_RES = [
+    re.compile(r'\+\d{1,3}[\s.-]?\(?\d{1,4}\)?[\s.-]?\d{1,4}[\s.-]?\d{1,9}'),  # International
+    re.compile(r'\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}'),  # US format
+    re.compile(r'\b\d{10,11}\b'),  # 10-11 consecutive digits
+    re.compile(r'\d{5}[\s.-]\d{5}'),  # Indian format
+]
+_PHONE_STRIP_RE = re.compile(r'[^\d+]')
+
+
+@lru_cache(maxsize=8)
+def _lower(text: str) -> str:
+    """text.lower(), shared by the extractors that all lowercase the same resume."""
+    return text.lower()
+
+
+def _build_prefilter():
+    """
+    Optional Hyperscan database over the email and phone patterns
+    (id 0 = email, i = _PHONE_RES[i-1]). Hyperscan has no word boundaries in
+    Unicode mode, so they are dropped: the database matches a superset of what
+    `re` would and is only used to skip patterns that cannot match.
+    """
+    if hyperscan is None:
+        return None
+    patterns = [_EMAIL_RE] + _PHONE_RES
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.pattern.replace(r'\b', '').encode() for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP] * len(patterns),
+        )
+    except Exception as e:
+        logger.warning(f"Hyperscan prefilter unavailable: {e}")
+        return None
+    return db
+
+
+_PREFILTER_DB = _build_prefilter()
+_PREFILTER_LOCK = threading.Lock()  # the database's scratch space is single-threaded
+
+
+@lru_cache(maxsize=8)
+def _scan_prefilter(text: str) -> frozenset:
+    hits = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        hits.add(pattern_id)
+
+    with _PREFILTER_LOCK:
+        _PREFILTER_DB.scan(text.encode('utf-8', 'replace'), match_event_handler=on_match)
+    return frozenset(hits)
+
+
+def _prefilter_hits(text: str) -> Optional[frozenset]:
+    """
+    Ids of the email/phone patterns present in `text`, from one Hyperscan pass
+    shared by the email and both phone extractors; None without Hyperscan.
+    """
+    if _PREFILTER_DB is None:
+        return None
+    return _scan_prefilter(text)
+
+
 def extract_email(text: str) -> Optional[str]:
     """Extract email with validation."""
-    pattern = r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b'
-    matches = re.findall(pattern, text)
-    
-    for match in matches:
-        email = match.lower().strip()
+    hits = _prefilter_hits(text)
+    if hits is not None and 0 not in hits:
+        return None
+    for match in _EMAIL_RE.finditer(text):
+        email = match.group(0).lower().strip()
         # Validate structure
         if '.' in email.split('@')[1] and len(email) >= 6:
             return email
@@ -341,64 +658,67 @@ def extract_email(text: str) -> Optional[str]:
     return None
 
 
-def extract_phone(text: str) -> Optional[str]:
-    """Extract primary phone number."""
-    # Comprehensive phone patterns
-    patterns = [
-        r'\+\d{1,3}[\s.-]?\(?\d{1,4}\)?[\s.-]?\d{1,4}[\s.-]?\d{1,9}',  # International
-        r'\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}',  # US format
-        r'\b\d{10,11}\b',  # 10-11 consecutive digits
-        r'\d{5}[\s.-]\d{5}',  # Indian format
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        for match in matches:
-            # Normalize: remove non-digits except leading +
-            normalized = re.sub(r'[^\d+]', '', match)
-            digits = re.sub(r'\D', '', normalized)
+def _phone_candidates(text: str):
+    """Yield valid phone numbers in pattern priority order, normalised to +<digits>."""
+    hits = _prefilter_hits(text)
+    for pattern_id, pattern in enumerate(_PHONE_RES, 1):
+        if hits is not None and pattern_id not in hits:
+            continue
+        for match in pattern.finditer(text):
+            # Normalize: remove non-digits except leading +. What is left is digits
+            # and '+', so dropping the '+' gives the digits without a second regex pass
+            normalized = _PHONE_STRIP_RE.sub('', match.group(0))
+            digits = normalized.replace('+', '')
             
             # Validate length
             if 10 <= len(digits) <= 15:
                 # Add country code if missing
                 if len(digits) == 10 and not normalized.startswith('+'):
-                    return f"+1{digits}"
+                    yield f"+1{digits}"
                 elif not normalized.startswith('+'):
-                    return f"+{digits}"
-                return normalized
-    
-    return None
+                    yield f"+{digits}"
+                else:
+                    yield normalized
+
+
+@lru_cache(maxsize=8)
+def _phone_numbers(text: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    The first phone number and the first one that differs from it, from one
+    walk over the candidates shared by the primary and alternate extractors.
+    """
+    first = None
+    for phone in _phone_candidates(text):
+        if first is None:
+            first = phone
+        elif phone != first:
+            return first, phone
+    return first, None
+
+
+def extract_phone(text: str) -> Optional[str]:
+    """Extract primary phone number."""
+    return _phone_numbers(text)[0]
 
 
 def extract_alternate_phone(text: str) -> Optional[str]:
     """Extract secondary phone number."""
-    phones = []
-    
-    patterns = [
-        r'\+\d{1,3}[\s.-]?\(?\d{1,4}\)?[\s.-]?\d{1,4}[\s.-]?\d{1,9}',
-        r'\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}',
-        r'\b\d{10,11}\b',
-        r'\d{5}[\s.-]\d{5}',
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        for match in matches:
-            normalized = re.sub(r'[^\d+]', '', match)
-            digits = re.sub(r'\D', '', normalized)
-            
-            if 10 <= len(digits) <= 15:
-                if len(digits) == 10 and not normalized.startswith('+'):
-                    phone = f"+1{digits}"
-                elif not normalized.startswith('+'):
-                    phone = f"+{digits}"
-                else:
-                    phone = normalized
-                
-                if phone not in phones:
-                    phones.append(phone)
-    
-    return phones[1] if len(phones) > 1 else None
+    return _phone_numbers(text)[1]
+
+
+# Degree mappings (highest to lowest)
+_DEGREES = [
+    ('PhD', ['phd', 'ph.d', 'ph d', 'doctorate', 'doctor of philosophy', 'doctoral']),
+    ('Masters', ['master', 'masters', 'mba', 'ms', 'm.s', 'msc', 'm.sc', 'mtech', 'm.tech', 'ma', 'm.a']),
+    ('Bachelors', ['bachelor', 'bachelors', 'btech', 'b.tech', 'be', 'b.e', 'bs', 'b.s', 'bsc', 'b.sc', 'ba', 'b.a', 'bcom', 'b.com']),
+    ('Diploma', ['diploma', 'dip', 'polytechnic']),
+    ('Associate', ['associate', 'assoc'])
+]
+# keyword -> index into _DEGREES, lower is higher
+_DEGREE_RANK = {kw: rank for rank, (_, keywords) in enumerate(_DEGREES) for kw in keywords}
+# Every keyword in one alternation, so the section is scanned once instead of
+# once per keyword
+_DEGREE_RE = _alias_pattern(_DEGREE_RANK)
 
 
 def extract_qualification(text: str) -> Optional[str]:
@@ -408,39 +728,14 @@ def extract_qualification(text: str) -> Optional[str]:
     if not edu_section:
         edu_section = text
     
-    # Degree mappings (highest to lowest)
-    degrees = [
-        ('PhD', ['phd', 'ph.d', 'ph d', 'doctorate', 'doctor of philosophy', 'doctoral']),
-        ('Masters', ['master', 'masters', 'mba', 'ms', 'm.s', 'msc', 'm.sc', 'mtech', 'm.tech', 'ma', 'm.a']),
-        ('Bachelors', ['bachelor', 'bachelors', 'btech', 'b.tech', 'be', 'b.e', 'bs', 'b.s', 'bsc', 'b.sc', 'ba', 'b.a', 'bcom', 'b.com']),
-        ('Diploma', ['diploma', 'dip', 'polytechnic']),
-        ('Associate', ['associate', 'assoc'])
-    ]
-    
-    edu_lower = edu_section.lower()
-    
-    for degree_name, keywords in degrees:
-        for kw in keywords:
-            # Use word boundaries to avoid false matches
-            if re.search(rf'\b{re.escape(kw)}\b', edu_lower):
-                return degree_name
-    
-    return None
+    best = _best_alias(_DEGREE_RE, _DEGREE_RANK, _lower(edu_section))
+    return _DEGREES[best][0] if best is not None else None
 
 
 def extract_experience(text: str) -> Optional[float]:
     """Extract years of experience."""
-    # Priority patterns (most specific first)
-    patterns = [
-        r'(\d+(?:\.\d+)?)\s*\+?\s*years?\s+of\s+(?:work|professional|total)?\s*experience',
-        r'experience\s*[:\-]\s*(\d+(?:\.\d+)?)\s*\+?\s*years?',
-        r'(\d+(?:\.\d+)?)\s*\+?\s*(?:yrs?|years?)\s+experience',
-        r'total\s+experience\s*[:\-]?\s*(\d+(?:\.\d+)?)\s*years?',
-    ]
-    
-    for pattern in patterns:
-        matches = re.finditer(pattern, text, re.I)
-        for match in matches:
+    for pattern in _EXPERIENCE_RES:
+        for match in pattern.finditer(text):
             try:
                 years = float(match.group(1))
                 if 0 < years <= 50:  # Reasonable range
@@ -453,16 +748,19 @@ def extract_experience(text: str) -> Optional[float]:
 
 def extract_current_company(text: str) -> Optional[str]:
     """Extract current/most recent company."""
-    exp_section = extract_section(text, ['experience', 'work experience', 'employment', 'professional'])
+    # Same as extract_section(text, [...three headers..., 'professional'])
+    exp_section = _experience_section(text)
+    if exp_section is None:
+        exp_section = extract_section(text, ['professional'])
     
     if not exp_section:
         exp_section = text  # Fallback to full text
     
-    lines = [l.strip() for l in exp_section.split('\n') if l.strip()]
+    lines = _content_lines(exp_section)
     
     # Look for "Present" indicator and find associated company
     for i, line in enumerate(lines[:30]):
-        if re.search(r'\b(present|current|till\s+now|ongoing)\b', line, re.I):
+        if _COMPANY_PRESENT_RE.search(line):
             # Check surrounding lines for company name
             for offset in range(-3, 4):
                 idx = i + offset
@@ -470,61 +768,44 @@ def extract_current_company(text: str) -> Optional[str]:
                     candidate = lines[idx]
                     
                     # Clean date patterns
-                    candidate = re.sub(r'\b\w{3,4}\s+\d{4}\s*[-–]\s*(present|current|\d{4})\b', '', candidate, flags=re.I)
+                    candidate = _DATE_RANGE_RE.sub('', candidate)
                     candidate = candidate.strip()
                     
                     # Skip if it's a job title or contains title keywords
-                    title_keywords = r'\b(engineer|developer|analyst|manager|director|lead|senior|junior|' \
-                                   r'associate|specialist|consultant|architect|designer|coordinator|' \
-                                   r'executive|officer|administrator|supervisor|intern|trainee)\b'
-                    
-                    if not re.search(title_keywords, candidate, re.I) and _looks_like_company(candidate):
+                    if not _TITLE_KEYWORDS_RE.search(candidate) and _looks_like_company(candidate):
                         return candidate
     
     # Fallback: Look for "at Company" patterns
     for line in lines[:20]:
-        at_match = re.search(r'(.+?)\s+at\s+(.+)', line, re.I)
+        at_match = _AT_RE.search(line)
         if at_match:
             title_part = at_match.group(1).strip()
             company_part = at_match.group(2).strip()
             
             # Check if title part has title keywords
-            title_keywords = r'\b(engineer|developer|analyst|manager|director|lead|senior|junior|' \
-                           r'associate|specialist|consultant|architect|designer|coordinator|' \
-                           r'executive|officer|administrator|supervisor|intern|trainee)\b'
-            
-            if re.search(title_keywords, title_part, re.I) and _looks_like_company(company_part):
+            if _TITLE_KEYWORDS_RE.search(title_part) and _looks_like_company(company_part):
                 return company_part
     
     # Another fallback: Look for well-known company names
-    known_companies = ['google', 'microsoft', 'amazon', 'apple', 'facebook', 'meta', 'netflix', 
-                     'tesla', 'ibm', 'oracle', 'adobe', 'salesforce', 'linkedin', 'twitter']
-    
-    text_lower = text.lower()
-    for company in known_companies:
-        if re.search(rf'\b{re.escape(company)}\b', text_lower):
-            return company.title()
+    rank = _best_alias(_KNOWN_COMPANY_RE, _KNOWN_COMPANY_RANK, _lower(text))
+    if rank is not None:
+        return KNOWN_COMPANIES[rank].title()
     
     return None
 
 
 def extract_designation(text: str) -> Optional[str]:
     """Extract current/most recent job title."""
-    exp_section = extract_section(text, ['experience', 'work experience', 'employment'])
+    exp_section = _experience_section(text)
     
     if not exp_section:
         exp_section = text  # Fallback to full text
     
-    lines = [l.strip() for l in exp_section.split('\n') if l.strip()]
-    
-    # Job title keywords
-    title_keywords = r'\b(engineer|developer|analyst|manager|director|lead|senior|junior|' \
-                     r'associate|specialist|consultant|architect|designer|coordinator|' \
-                     r'executive|officer|administrator|supervisor|intern|trainee)\b'
+    lines = _content_lines(exp_section)
     
     # Look for "Present" context
     for i, line in enumerate(lines[:30]):
-        if re.search(r'\b(present|current)\b', line, re.I):
+        if _DESIGNATION_PRESENT_RE.search(line):
             # Check surrounding lines for job title
             for offset in range(-3, 4):
                 idx = i + offset
@@ -532,11 +813,11 @@ def extract_designation(text: str) -> Optional[str]:
                     candidate = lines[idx]
                     
                     # Clean date patterns
-                    candidate = re.sub(r'\b\w{3,4}\s+\d{4}\s*[-–]\s*(present|current|\d{4})\b', '', candidate, flags=re.I)
+                    candidate = _DATE_RANGE_RE.sub('', candidate)
                     candidate = candidate.strip()
                     
                     # Skip if looks like company name
-                    if not _looks_like_company(candidate) and re.search(title_keywords, candidate, re.I):
+                    if not _looks_like_company(candidate) and _TITLE_KEYWORDS_RE.search(candidate):
                         # Extract just the title part
                         title = _extract_title_from_line(candidate)
                         if title and len(title) < 80:
@@ -544,20 +825,20 @@ def extract_designation(text: str) -> Optional[str]:
     
     # Fallback: Look for "Title at Company" patterns
     for line in lines[:20]:
-        at_match = re.search(r'(.+?)\s+at\s+(.+)', line, re.I)
+        at_match = _AT_RE.search(line)
         if at_match:
             title_part = at_match.group(1).strip()
             company_part = at_match.group(2).strip()
             
             # Check if title part has title keywords and company part looks like company
-            if re.search(title_keywords, title_part, re.I) and _looks_like_company(company_part):
+            if _TITLE_KEYWORDS_RE.search(title_part) and _looks_like_company(company_part):
                 title = _extract_title_from_line(title_part)
                 if title and len(title) < 80:
                     return title
     
     # Another fallback: Find first line with job title keyword
     for line in lines[:15]:
-        if not _looks_like_company(line) and re.search(title_keywords, line, re.I):
+        if not _looks_like_company(line) and _TITLE_KEYWORDS_RE.search(line):
             title = _extract_title_from_line(line)
             if title and len(title) < 80:
                 return title
@@ -565,31 +846,27 @@ def extract_designation(text: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=8)
+def _before_skills(text: str) -> Tuple[str, str]:
+    """The text before the first 'skills' mention, and its lowercase, for city and state."""
+    skills_pos = _lower(text).find('skills')
+    if skills_pos == -1:
+        return text, _lower(text)
+    text_to_search = text[:skills_pos]
+    return text_to_search, text_to_search.lower()
+
+
 def extract_city(text: str) -> Optional[str]:
     """Extract city name."""
     # Exclude skills section
-    text_lower = text.lower()
-    skills_pos = text_lower.find('skills')
-    if skills_pos != -1:
-        text_to_search = text[:skills_pos]
-    else:
-        text_to_search = text
+    text_to_search, search_lower = _before_skills(text)
     
-    # Common cities (expandable)
-    cities = [
-        'bangalore', 'bengaluru', 'mumbai', 'delhi', 'hyderabad', 'chennai', 
-        'kolkata', 'pune', 'ahmedabad', 'jaipur', 'surat', 'lucknow', 'kanpur',
-        'new york', 'san francisco', 'los angeles', 'chicago', 'boston', 'seattle',
-        'london', 'paris', 'berlin', 'toronto', 'sydney', 'singapore'
-    ]
-    
-    for city in cities:
-        if re.search(rf'\b{re.escape(city)}\b', text_to_search.lower()):
-            return city.title()
+    rank = _best_alias(_CITY_RE, _CITY_RANK, search_lower)
+    if rank is not None:
+        return CITIES[rank].title()
     
     # Pattern: City, State
-    location_pattern = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*([A-Z][a-z]+)'
-    matches = re.findall(location_pattern, text_to_search)
+    matches = _CITY_STATE_RE.findall(text_to_search)
     if matches:
         return matches[0][0]
     
@@ -599,27 +876,14 @@ def extract_city(text: str) -> Optional[str]:
 def extract_state(text: str) -> Optional[str]:
     """Extract state/province name."""
     # Exclude skills section
-    text_lower = text.lower()
-    skills_pos = text_lower.find('skills')
-    if skills_pos != -1:
-        text_to_search = text[:skills_pos]
-    else:
-        text_to_search = text
+    text_to_search, search_lower = _before_skills(text)
     
-    # Common states (expandable)
-    states = [
-        'california', 'new york', 'texas', 'florida', 'illinois', 'washington',
-        'maharashtra', 'karnataka', 'tamil nadu', 'delhi', 'uttar pradesh',
-        'west bengal', 'gujarat', 'rajasthan', 'telangana', 'andhra pradesh'
-    ]
-    
-    for state in states:
-        if re.search(rf'\b{re.escape(state)}\b', text_to_search.lower()):
-            return state.title()
+    rank = _best_alias(_STATE_RE, _STATE_RANK, search_lower)
+    if rank is not None:
+        return STATES[rank].title()
     
     # Pattern: City, State
-    location_pattern = r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?,\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)'
-    matches = re.findall(location_pattern, text_to_search)
+    matches = _STATE_AFTER_CITY_RE.findall(text_to_search)
     if matches:
         return matches[0]
     
@@ -630,31 +894,62 @@ def extract_state(text: str) -> Optional[str]:
 # HELPER FUNCTIONS
 # ============================================================================
 
+def _line_offsets(lines) -> List[int]:
+    """Start offset of each of `lines` (the result of text.split('\\n')) in the text."""
+    offsets = []
+    pos = 0
+    for line in lines:
+        offsets.append(pos)
+        pos += len(line) + 1
+    return offsets
+
+
+@lru_cache(maxsize=8)
+def _section_lines(text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[int, ...]]:
+    """
+    The lines of `text`, raw and stripped+lowercased, with their start offsets.
+    Cached so the section lookups for education, experience and designation on
+    one resume split and lowercase it once instead of once per header.
+    """
+    lines = tuple(text.split('\n'))
+    return lines, tuple(line.strip().lower() for line in lines), tuple(_line_offsets(lines))
+
+
+@lru_cache(maxsize=8)
+def _content_lines(text: str) -> Tuple[str, ...]:
+    """Non-blank lines of `text`, stripped; shared by the extractors that walk them."""
+    return tuple(l.strip() for l in text.split('\n') if l.strip())
+
+
+@lru_cache(maxsize=8)
+def _experience_section(text: str) -> Optional[str]:
+    """
+    The experience section, looked up once per resume for company and
+    designation (the company lookup only adds a 'professional' fallback).
+    """
+    return extract_section(text, ['experience', 'work experience', 'employment'])
+
+
 def extract_section(text: str, headers: List[str], window: int = 1500) -> Optional[str]:
     """Extract text section by headers."""
-    lines = text.split('\n')
-    text_lower = text.lower()
+    # A header line starts with the header, so a header absent from the whole
+    # text cannot match any line; resumes without the section skip the walk
+    text_lower = _lower(text)
+    headers = [header for header in headers if header in text_lower]
+    if not headers:
+        return None
+    lines, lowered, offsets = _section_lines(text)
     
     for header in headers:
         # Look for header as a standalone line (or with minimal following text)
-        for i, line in enumerate(lines):
-            line_lower = line.strip().lower()
-            
+        for line, line_lower, line_start_pos in zip(lines, lowered, offsets):
             # Check if line starts with header (exact match or followed by colon/space)
             if (line_lower == header or 
                 line_lower.startswith(header + ':') or 
                 line_lower.startswith(header + ' ')):
                 
-                # Get the position in original text
-                line_start_pos = text.find(line)
-                
-                # Find end of this line (start after header line)
-                line_end = text.find('\n', line_start_pos)
-                if line_end == -1:
-                    line_end = len(text)
-                
                 # Start after this line
-                section_start = line_end + 1
+                section_start = line_start_pos + len(line) + 1
                 
                 # Get remaining text starting from after header line
                 remaining_text = text[section_start:section_start + window]
@@ -662,18 +957,19 @@ def extract_section(text: str, headers: List[str], window: int = 1500) -> Option
                 # Try to find next section header
                 next_headers = ['education', 'experience', 'skills', 'projects', 'certification', 'summary', 'objective', 'contact']
                 min_next = len(remaining_text)
+                next_lines = remaining_text.split('\n')
+                next_lowered = [next_line.strip().lower() for next_line in next_lines]
+                next_offsets = _line_offsets(next_lines)
                 
                 for nh in next_headers:
                     if nh != header:
                         # Look for next header as standalone line
                         next_pos = -1
-                        next_lines = remaining_text.split('\n')
-                        for j, next_line in enumerate(next_lines):
-                            next_line_lower = next_line.strip().lower()
+                        for next_line_lower, next_line_pos in zip(next_lowered, next_offsets):
                             if (next_line_lower == nh or 
                                 next_line_lower.startswith(nh + ':') or 
                                 next_line_lower.startswith(nh + ' ')):
-                                next_pos = remaining_text.find(next_line)
+                                next_pos = next_line_pos
                                 break
                         
                         if next_pos != -1 and next_pos < min_next:
@@ -690,10 +986,7 @@ def _looks_like_company(text: str) -> bool:
         return False
     
     # Company indicators
-    indicators = r'\b(inc|corp|corporation|company|ltd|llc|co|limited|technologies|' \
-                 r'solutions|systems|group|services|consulting|pvt)\b'
-    
-    if re.search(indicators, text, re.I):
+    if _COMPANY_INDICATORS_RE.search(text):
         return True
     
     # Check if starts with capital and has reasonable length
@@ -720,7 +1013,7 @@ def _extract_title_from_line(line: str) -> Optional[str]:
     # If no separator, return cleaned line if not too long
     if len(line) < 80:
         # Remove date patterns
-        cleaned = re.sub(r'\b\w{3}\s+\d{4}\s*[-–]\s*\w+\b', '', line)
+        cleaned = _TITLE_DATE_RE.sub('', line)
         cleaned = cleaned.strip()
         if cleaned:
             return cleaned
@@ -732,10 +1025,67 @@ def _extract_title_from_line(line: str) -> Optional[str]:
 # MAIN PARSING FUNCTION
 # ============================================================================
 
+# Opt-in memo of parse_resume results by file content, for batch runs that see
+# the same resume more than once (RESUME_PARSER_CACHE_SIZE entries in memory;
+# RESUME_PARSER_CACHE_DIR adds an on-disk tier, needs diskcache). Bump
+# _CACHE_VERSION whenever extraction or parsing output changes.
+_CACHE_VERSION = '1'
+_RESULT_CACHE = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+_RESULT_CACHE_MAX = int(os.getenv('RESUME_PARSER_CACHE_SIZE', '0'))
+_RESULT_CACHE_DIR = os.getenv('RESUME_PARSER_CACHE_DIR', '')
+_RESULT_DISK_CACHE = diskcache.Cache(_RESULT_CACHE_DIR) if diskcache is not None and _RESULT_CACHE_DIR else None
+
+
+def _result_cache_key(file_path: str) -> Optional[str]:
+    """SHA-256 of the file plus its extension and the cache version."""
+    digest = hashlib.sha256()
+    try:
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return f"{digest.hexdigest()}:{os.path.splitext(file_path)[1].lower()}:{_CACHE_VERSION}"
+
+
 def parse_resume(file_path: str) -> Dict[str, Optional[object]]:
     """
     Main parsing function - combines rule-based extraction.
     """
+    if _RESULT_CACHE_MAX <= 0 and _RESULT_DISK_CACHE is None:
+        return _parse_resume_file(file_path)
+    
+    key = _result_cache_key(file_path)
+    if key is None:
+        return _parse_resume_file(file_path)
+    with _RESULT_CACHE_LOCK:
+        hit = _RESULT_CACHE.get(key)
+        if hit is not None:
+            _RESULT_CACHE.move_to_end(key)
+    if hit is None and _RESULT_DISK_CACHE is not None:
+        try:
+            hit = _RESULT_DISK_CACHE.get(key)
+        except Exception:
+            hit = None
+    if hit is None:
+        hit = _parse_resume_file(file_path)
+        if _RESULT_DISK_CACHE is not None:
+            try:
+                _RESULT_DISK_CACHE.set(key, hit)
+            except Exception:
+                pass
+    if _RESULT_CACHE_MAX > 0:
+        with _RESULT_CACHE_LOCK:
+            _RESULT_CACHE[key] = hit
+            _RESULT_CACHE.move_to_end(key)
+            while len(_RESULT_CACHE) > _RESULT_CACHE_MAX:
+                _RESULT_CACHE.popitem(last=False)
+    # Callers may annotate the result, so hand out a copy
+    return dict(hit)
+
+
+def _parse_resume_file(file_path: str) -> Dict[str, Optional[object]]:
     # Extract text
     text = extract_text(file_path)
     
@@ -747,6 +1097,14 @@ def parse_resume(file_path: str) -> Dict[str, Optional[object]]:
             'current_designation', 'city', 'state'
         ]}
     
+    return parse_resume_from_text(text)
+
+
+def parse_resume_from_text(text: str) -> Dict[str, Optional[object]]:
+    """
+    Field extraction on text that has already been extracted, for callers that
+    have the text in hand and should not round-trip it through a file.
+    """
     # Rule-based extraction
     result = {
         'full_name': extract_name(text),
@@ -764,15 +1122,82 @@ def parse_resume(file_path: str) -> Dict[str, Optional[object]]:
     return result
 
 
+def iter_parse_resumes(file_paths: List[str], max_workers: Optional[int] = None,
+                       executor: str = 'process'):
+    """
+    Parse several resumes concurrently, yielding results in input order as
+    they complete. A file that cannot be read or parsed yields an entry with
+    every field None and an 'error' message instead of ending the batch.
+
+    Worker processes are the default: PyPDF2, pdfplumber and the field regexes
+    are pure Python and hold the GIL, so threads ('thread') mostly help when
+    the time goes to I/O.
+    """
+    use_processes = executor == 'process'
+    if max_workers is None:
+        cpus = os.cpu_count() or 1
+        max_workers = cpus if use_processes else min(32, cpus * 4)
+    max_workers = max(1, min(max_workers, len(file_paths) or 1))
+    if max_workers == 1:
+        for path in file_paths:
+            yield _parse_batch_entry(path)
+        return
+    
+    executor_cls = (concurrent.futures.ProcessPoolExecutor if use_processes
+                    else concurrent.futures.ThreadPoolExecutor)
+    with executor_cls(max_workers=max_workers) as pool:
+        yield from pool.map(_parse_batch_entry, file_paths)
+
+
+def _parse_batch_entry(file_path: str) -> Dict[str, Optional[object]]:
+    """parse_resume for one file of a batch: failures become an 'error' entry."""
+    if not os.path.isfile(file_path) or not os.access(file_path, os.R_OK):
+        return {**{field: None for field in FIELD_NAMES}, 'error': f'Cannot read file: {file_path}'}
+    try:
+        return parse_resume(file_path)
+    except Exception as e:
+        logger.error(f"Failed to parse {file_path}: {e}")
+        return {**{field: None for field in FIELD_NAMES}, 'error': str(e)}
+
+
+def parse_resumes(file_paths: List[str], max_workers: Optional[int] = None,
+                  executor: str = 'process') -> List[Dict[str, Optional[object]]]:
+    """Parse several resumes concurrently, returning results in input order."""
+    return list(iter_parse_resumes(file_paths, max_workers=max_workers, executor=executor))
+
+
 # CLI interface
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Parse resume files')
-    parser.add_argument('file_path', help='Path to resume file')
+    parser.add_argument('file_paths', nargs='+', metavar='file_path', help='Path to resume file(s)')
     parser.add_argument('--output', '-o', help='Output JSON file')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Files parsed concurrently (default: one per CPU for processes, 4 per CPU for threads)')
+    parser.add_argument('--executor', choices=['process', 'thread'], default='process',
+                        help='Parse in worker processes (default) or threads')
+    parser.add_argument('--ndjson', action='store_true',
+                        help='Write one compact JSON record per file as each one is parsed')
     
     args = parser.parse_args()
     
-    result = parse_resume(args.file_path)
+    if args.ndjson:
+        # Stream records instead of building and serialising one document
+        out = open(args.output, 'w') if args.output else sys.stdout
+        try:
+            results = iter_parse_resumes(args.file_paths, max_workers=args.workers, executor=args.executor)
+            for path, result in zip(args.file_paths, results):
+                out.write(json.dumps({'file_path': path, **result}) + '\n')
+                out.flush()
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        sys.exit(0)
+    
+    if len(args.file_paths) == 1:
+        result = parse_resume(args.file_paths[0])
+    else:
+        results = parse_resumes(args.file_paths, max_workers=args.workers, executor=args.executor)
+        result = dict(zip(args.file_paths, results))
     
     output = json.dumps(result, indent=2)
     
@@ -8,12 +8,18 @@ API_KEY_PATH = STORAGE_DIR / "api_key.enc"
 def _ensure_storage_dir():
     STORAGE_DIR.mkdir(exist_ok=True)
 
+# Fernet instances by MASTER_KEY, so the key is decoded once rather than per call
+_FERNETS = {}
+
 def _get_fernet():
     master = os.environ.get("MASTER_KEY")
     if not master:
         return None
-    # MASTER_KEY should be a urlsafe_b64-encoded 32-byte key (Fernet)
-    return Fernet(master.encode())
+    f = _FERNETS.get(master)
+    if f is None:
+        # MASTER_KEY should be a urlsafe_b64-encoded 32-byte key (Fernet)
+        f = _FERNETS[master] = Fernet(master.encode())
+    return f
 
 def store_api_key(api_key: str):
     """Encrypt and store API key to disk. Requires MASTER_KEY env var."""
@@ -30,18 +36,31 @@ def store_api_key(api_key: str):
     except Exception:
         pass
 
+# Last decrypted key with the file signature and MASTER_KEY it came from; the
+# LLM helper asks for the key on every call, and it only changes on store/delete
+_decrypted = None
+
 def get_api_key() -> str | None:
     """Return decrypted API key if available, else None."""
-    if not API_KEY_PATH.exists():
+    global _decrypted
+    try:
+        st = API_KEY_PATH.stat()
+    except FileNotFoundError:
         return None
     f = _get_fernet()
     if f is None:
         raise RuntimeError("MASTER_KEY not set; cannot decrypt stored API key.")
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino, f)
+    cached = _decrypted
+    if cached is not None and cached[0] == signature:
+        return cached[1]
     data = API_KEY_PATH.read_bytes()
     try:
-        return f.decrypt(data).decode()
+        api_key = f.decrypt(data).decode()
     except InvalidToken:
         raise RuntimeError("Decryption failed. Check MASTER_KEY and stored data.")
+    _decrypted = (signature, api_key)
+    return api_key
 
 def delete_api_key():
     if API_KEY_PATH.exists():
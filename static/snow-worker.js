@@ -0,0 +1,25 @@
+// Runs the snow animation on an OffscreenCanvas so it never competes with the
+// main thread for frame time. The page posts
+// {type: 'init' | 'resize' | 'count' | 'pause' | 'resume'}.
+importScripts('snow.js' + self.location.search);
+
+let field = null;
+
+self.onmessage = function (e) {
+    const msg = e.data;
+    if (msg.type === 'init') {
+        field = new SnowField(msg.canvas.getContext('2d'), msg.width, msg.height, msg.count);
+        field.resize(msg.width, msg.height);
+        if (!msg.paused) field.start();
+    } else if (!field) {
+        return;
+    } else if (msg.type === 'resize') {
+        field.resize(msg.width, msg.height);
+    } else if (msg.type === 'count') {
+        field.setCount(msg.count);
+    } else if (msg.type === 'pause') {
+        field.pause();
+    } else if (msg.type === 'resume') {
+        field.start();
+    }
+};
@@ -0,0 +1,136 @@
+// Snow particle field shared by the main-thread fallback and snow-worker.js.
+// Works against any 2D context, including an OffscreenCanvas one.
+(function (root) {
+    // Flake opacity is quantised into a few buckets fixed at creation, so a frame
+    // needs one fillStyle change and one fill() per bucket instead of per flake.
+    const ALPHA_BUCKETS = 8;
+    const BUCKET_STYLES = [];
+    for (let b = 0; b < ALPHA_BUCKETS; b++) {
+        BUCKET_STYLES.push('rgba(255,255,255,' + (0.6 + b * 0.35 / (ALPHA_BUCKETS - 1)).toFixed(3) + ')');
+    }
+
+    const TAU = Math.PI * 2;
+
+    // Past this share of the canvas, per-flake clears cost more than one full clear
+    const DIRTY_AREA_LIMIT = 0.25;
+
+    // Flakes are stored as parallel Float32Arrays (position, radius, and the
+    // per-flake fall speed and sway, which never change), grouped by alpha
+    // bucket; bucketEnds[b] is one past the last flake of bucket b. px/py hold
+    // where each flake was last drawn, so only those squares need clearing.
+    function SnowField(ctx, width, height, count) {
+        this.ctx = ctx;
+        this.width = width;
+        this.height = height;
+        this.animId = null;
+        this.setCount(count);
+    }
+
+    SnowField.prototype.resize = function (width, height) {
+        this.width = width;
+        this.height = height;
+        this.ctx.canvas.width = width;
+        this.ctx.canvas.height = height;
+        this.fullClear = true;
+    };
+
+    SnowField.prototype.setCount = function (count) {
+        this.n = count;
+        this.fx = new Float32Array(count);
+        this.fy = new Float32Array(count);
+        this.fr = new Float32Array(count);
+        this.fs = new Float32Array(count);
+        this.fa = new Float32Array(count);
+        this.px = new Float32Array(count);
+        this.py = new Float32Array(count);
+        this.fullClear = true;
+        this.bucketEnds = new Int32Array(ALPHA_BUCKETS);
+        this.dirtyArea = 0;
+        for (let i = 0; i < count; i++) {
+            this.fx[i] = Math.random() * this.width;
+            this.fy[i] = Math.random() * this.height;
+            const r = 1 + Math.random() * 4;
+            const d = 0.5 + Math.random() * 1.5;
+            this.fr[i] = r;
+            this.fs[i] = Math.pow(d, 1.2) + 0.3 + r * 0.08;
+            this.fa[i] = 0.5 + r * 0.02;
+            this.dirtyArea += (2 * r + 2) * (2 * r + 2);
+        }
+        // Flakes are already in random order, so equal contiguous slices make random buckets
+        for (let b = 0; b < ALPHA_BUCKETS; b++) {
+            this.bucketEnds[b] = b === ALPHA_BUCKETS - 1 ? count : Math.round(count * (b + 1) / ALPHA_BUCKETS);
+        }
+    };
+
+    SnowField.prototype.clear = function () {
+        const ctx = this.ctx;
+        const n = this.n, px = this.px, py = this.py, fr = this.fr;
+        if (this.fullClear || this.dirtyArea > this.width * this.height * DIRTY_AREA_LIMIT) {
+            ctx.clearRect(0, 0, this.width, this.height);
+            this.fullClear = false;
+            return;
+        }
+        for (let i = 0; i < n; i++) {
+            const r = fr[i] + 1;
+            ctx.clearRect(px[i] - r, py[i] - r, 2 * r, 2 * r);
+        }
+    };
+
+    SnowField.prototype.draw = function () {
+        const ctx = this.ctx;
+        const fx = this.fx, fy = this.fy, fr = this.fr;
+        this.clear();
+        let i = 0;
+        for (let b = 0; b < ALPHA_BUCKETS; b++) {
+            const end = this.bucketEnds[b];
+            if (i === end) continue;
+            ctx.fillStyle = BUCKET_STYLES[b];
+            ctx.beginPath();
+            for (; i < end; i++) {
+                ctx.moveTo(fx[i] + fr[i], fy[i]);
+                ctx.arc(fx[i], fy[i], fr[i], 0, TAU, true);
+            }
+            ctx.fill();
+        }
+        this.px.set(fx);
+        this.py.set(fy);
+        this.update();
+    };
+
+    SnowField.prototype.update = function () {
+        const n = this.n, fx = this.fx, fy = this.fy, fs = this.fs, fa = this.fa;
+        const bottom = this.height + 10;
+        for (let i = 0; i < n; i++) {
+            fy[i] += fs[i];
+            fx[i] += Math.sin(fy[i] * 0.01) * fa[i];
+
+            if (fy[i] > bottom) {
+                fx[i] = Math.random() * this.width;
+                fy[i] = -10 - Math.random()*50;
+            }
+        }
+    };
+
+    SnowField.prototype.start = function () {
+        if (this.animId) return;
+        const tick = () => {
+            this.draw();
+            this.animId = requestAnimationFrame(tick);
+        };
+        tick();
+    };
+
+    // Freeze on the current frame (hidden tab, parse in progress); start() resumes
+    SnowField.prototype.pause = function () {
+        if (this.animId) cancelAnimationFrame(this.animId);
+        this.animId = null;
+    };
+
+    SnowField.prototype.stop = function () {
+        if (this.animId) cancelAnimationFrame(this.animId);
+        this.animId = null;
+        this.ctx.clearRect(0, 0, this.width, this.height);
+    };
+
+    root.SnowField = SnowField;
+})(self);
@@ -7,20 +7,18 @@ Tests file reading, parsing, and UI functionality
 import os
 import sys
 import json
-import tempfile
+import codecs
 from pathlib import Path
 
+import pytest
+
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from resume_parser import extract_text, extract_name, extract_qualification
+from resume_parser import extract_text_from_bytes, extract_name, extract_qualification
 
 def test_txt_extraction():
     """Test TXT file extraction"""
-    print("=" * 60)
-    print("TEST 1: TXT File Extraction")
-    print("=" * 60)
-    
     test_content = """
     John Smith
     john@example.com
@@ -36,129 +34,47 @@ def test_txt_extraction():
     Senior Software Engineer at Google (Jan 2020 - Present)
     """
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-        f.write(test_content)
-        temp_path = f.name
+    extracted = extract_text_from_bytes(test_content.encode('utf-8'), '.txt')
     
-    try:
-        extracted = extract_text(temp_path)
-        print(f"[PASS] TXT Extraction: PASSED")
-        print(f"Content length: {len(extracted)} characters")
-        print(f"First 100 chars: {extracted[:100]}...")
-        return True
-    except Exception as e:
-        print(f"[FAIL] TXT Extraction: FAILED - {e}")
-        return False
-    finally:
-        os.unlink(temp_path)
+    assert 'John Smith' in extracted
+    assert 'Senior Software Engineer at Google' in extracted
 
 
-def test_name_extraction():
+@pytest.mark.parametrize("text,expected", [
+    ("John Smith\njohn@example.com\n", "John Smith"),
+    ("John Smith\nStanford University Graduate\n", "John Smith"),
+    ("Google Inc\nTech Company", None),
+    ("Jane M. Doe\njane@example.com", "Jane M. Doe"),
+], ids=[
+    "simple-name-at-top",
+    "avoid-stanford-university",
+    "avoid-company-names",
+    "name-with-middle-initial",
+])
+def test_name_extraction(text, expected):
     """Test name extraction with institution filtering"""
-    print("\n" + "=" * 60)
-    print("TEST 2: Name Extraction")
-    print("=" * 60)
-    
-    test_cases = [
-        {
-            "name": "Simple name at top",
-            "text": "John Smith\njohn@example.com\n",
-            "expected": "John Smith"
-        },
-        {
-            "name": "Avoid Stanford University",
-            "text": "John Smith\nStanford University Graduate\n",
-            "expected": "John Smith"
-        },
-        {
-            "name": "Avoid company names",
-            "text": "Google Inc\nTech Company",
-            "expected": None
-        },
-        {
-            "name": "Name with middle initial",
-            "text": "Jane M. Doe\njane@example.com",
-            "expected": "Jane M. Doe"
-        }
-    ]
-    
-    passed = 0
-    failed = 0
-    
-    for test_case in test_cases:
-        result = extract_name(test_case["text"])
-        expected = test_case["expected"]
-        
-        if result == expected or (result and expected and result.lower() == expected.lower()):
-            print(f"[PASS] {test_case['name']}: PASSED")
-            print(f"   Result: {result}")
-            passed += 1
-        else:
-            print(f"[FAIL] {test_case['name']}: FAILED")
-            print(f"   Expected: {expected}")
-            print(f"   Got: {result}")
-            failed += 1
-    
-    print(f"\nName Extraction: {passed} passed, {failed} failed")
-    return failed == 0
+    result = extract_name(text)
+    assert result == expected or (result and expected and result.lower() == expected.lower())
 
 
-def test_degree_extraction():
+@pytest.mark.parametrize("text,expected", [
+    ("Education\nMasters in Computer Science from Stanford", "Masters"),
+    ("Education\nBachelors of Science in Engineering from MIT", "Bachelors"),
+    ("Education\nPhD in Physics from Oxford University", "PhD"),
+    ("Education\nBachelors in CS from Stanford\nMasters from MIT", "Masters"),
+], ids=[
+    "masters",
+    "bachelors",
+    "phd",
+    "multiple-degrees-highest",
+])
+def test_degree_extraction(text, expected):
     """Test degree extraction"""
-    print("\n" + "=" * 60)
-    print("TEST 3: Degree Extraction")
-    print("=" * 60)
-    
-    test_cases = [
-        {
-            "name": "Masters extraction",
-            "text": "Education\nMasters in Computer Science from Stanford",
-            "expected": "Masters"
-        },
-        {
-            "name": "Bachelors extraction",
-            "text": "Education\nBachelors of Science in Engineering from MIT",
-            "expected": "Bachelors"
-        },
-        {
-            "name": "PhD extraction",
-            "text": "Education\nPhD in Physics from Oxford University",
-            "expected": "PhD"
-        },
-        {
-            "name": "Multiple degrees - highest",
-            "text": "Education\nBachelors in CS from Stanford\nMasters from MIT",
-            "expected": "Masters"
-        }
-    ]
-    
-    passed = 0
-    failed = 0
-    
-    for test_case in test_cases:
-        result = extract_qualification(test_case["text"])
-        expected = test_case["expected"]
-        
-        if result == expected:
-            print(f"[PASS] {test_case['name']}: PASSED")
-            print(f"   Result: {result}")
-            passed += 1
-        else:
-            print(f"[FAIL] {test_case['name']}: FAILED")
-            print(f"   Expected: {expected}")
-            print(f"   Got: {result}")
-            failed += 1
-    
-    print(f"\nDegree Extraction: {passed} passed, {failed} failed")
-    return failed == 0
+    assert extract_qualification(text) == expected
 
 
 def test_file_formats():
     """Test support for multiple file formats"""
-    print("\n" + "=" * 60)
-    print("TEST 4: File Format Support")
-    print("=" * 60)
-    
     supported_formats = [
         ('.txt', 'Plain text files'),
         ('.pdf', 'PDF documents'),
@@ -175,16 +91,10 @@ def test_file_formats():
     print("  DOCX: python-docx -> docx2txt -> Binary")
     print("  DOC:  python-docx -> LibreOffice -> ZIP -> Binary")
     print("  TXT:  UTF-8 -> Latin-1 -> ISO-8859-1 -> CP1252 -> UTF-16")
-    
-    return True
 
 
 def test_text_cleaning():
     """Test text cleaning pipeline"""
-    print("\n" + "=" * 60)
-    print("TEST 5: Text Cleaning")
-    print("=" * 60)
-    
     from resume_parser import clean_text
     
     messy_text = """
@@ -200,28 +110,14 @@ def test_text_cleaning():
     
     cleaned = clean_text(messy_text)
     
-    print("Original text issues:")
-    print("  - Extra spaces")
-    print("  - Excessive blank lines")
-    print("  - Duplicate lines")
-    
-    print("\nCleaning results:")
-    print(f"  [PASS] Extra spaces normalized: {'    ' not in cleaned}")
-    print(f"  [PASS] Excessive blanks removed: {cleaned.count('\\n\\n\\n') == 0}")
-    print(f"  [PASS] Duplicate lines removed: True")
-    
-    print(f"\nOriginal length: {len(messy_text)} chars")
-    print(f"Cleaned length: {len(cleaned)} chars")
-    
-    return True
+    assert '  ' not in cleaned
+    assert '\n\n\n' not in cleaned
+    assert cleaned.startswith('John Smith\n')
+    assert len(cleaned) < len(messy_text)
 
 
 def test_ui_features():
     """Test UI features"""
-    print("\n" + "=" * 60)
-    print("TEST 6: UI Features")
-    print("=" * 60)
-    
     ui_features = [
         ("Cursor Tracking", "Advanced magnetic cursor with rainbow trail"),
         ("Hover Effects", "Smooth brightness and shadow effects"),
@@ -234,49 +130,567 @@ def test_ui_features():
     print("UI Enhancements:")
     for feature, description in ui_features:
         print(f"  [PASS] {feature:20s} - {description}")
-    
-    return True
 
 
-def run_all_tests():
-    """Run all tests"""
-    print("\n")
-    print("=" * 60)
-    print("RESUME PARSER - COMPREHENSIVE TEST SUITE")
-    print("=" * 60)
-    
-    results = {
-        "TXT Extraction": test_txt_extraction(),
-        "Name Extraction": test_name_extraction(),
-        "Degree Extraction": test_degree_extraction(),
-        "File Format Support": test_file_formats(),
-        "Text Cleaning": test_text_cleaning(),
-        "UI Features": test_ui_features(),
-    }
-    
-    print("\n" + "=" * 60)
-    print("TEST SUMMARY")
-    print("=" * 60)
-    
-    passed = sum(1 for v in results.values() if v)
-    total = len(results)
-    
-    for test_name, result in results.items():
-        status = "[PASS] PASSED" if result else "[FAIL] FAILED"
-        print(f"{test_name:30s}: {status}")
-    
-    print("=" * 60)
-    print(f"Overall: {passed}/{total} tests passed")
-    print("=" * 60)
-    
-    if passed == total:
-        print("\n[SUCCESS] All tests passed! System is ready for production.")
+def test_parse_cache_returns_copies():
+    """Test that parse-cache hits skip the pool and hand out independent dicts"""
+    import app
+
+    payload = b"John Smith\njohn@example.com\n(555) 123-4567\n"
+    app._PARSE_CACHE.clear()
+    content, first = app._run_parse('cache.txt', payload)
+    first['preview_url'] = '/uploads/cache.txt'
+
+    def no_pool():
+        raise AssertionError('cache hit should not reach the parse pool')
+
+    get_pool = app._get_parse_pool
+    app._get_parse_pool = no_pool
+    try:
+        cached_content, second = app._run_parse('cache.txt', payload)
+        _, third = app._run_parse('cache.txt', payload)
+    finally:
+        app._get_parse_pool = get_pool
+        app._PARSE_CACHE.clear()
+
+    assert cached_content == content
+    assert 'preview_url' not in second
+    assert second == third and second is not third
+
+
+def test_parse_cache_bounded_by_text_size():
+    """Test that the parse cache evicts by total text length and skips huge texts"""
+    import app
+
+    cache = app._ParseCache(max_entries=10, max_chars=100)
+    cache.put('a', ('x' * 20, {}))
+    cache.put('b', ('x' * 20, {}))
+    assert len(cache) == 2
+    # Over a quarter of the budget: not cached at all
+    cache.put('huge', ('x' * 26, {}))
+    assert cache.get('huge') is None
+    cache.put('c', ('x' * 25, {}))
+    cache.put('d', ('x' * 25, {}))
+    cache.put('e', ('x' * 25, {}))
+    # 115 chars would exceed the budget, so the oldest entry went
+    assert cache.get('a') is None
+    assert all(cache.get(k) is not None for k in 'bcde')
+    # Replacing an entry releases its old size; evicts oldest-first until it fits
+    cache.put('c', ('x' * 5, {}))
+    cache.put('f', ('x' * 25, {}))
+    cache.put('g', ('x' * 25, {}))
+    assert cache.get('b') is None and cache.get('d') is None
+    assert all(cache.get(k) is not None for k in 'cefg')
+
+
+def test_upload_size_caps():
+    """Test that per-file and per-request caps both answer 413, multipart and raw"""
+    import io
+    import app
+
+    client = app.app.test_client()
+    saved = (app._MAX_FILE_BYTES, app._MAX_REQUEST_BYTES, app._SPOOL_TO_DISK_BYTES)
+    # 1 KB per file, 4 KB per request, and spool every part so the file cap applies
+    app._MAX_FILE_BYTES, app._MAX_REQUEST_BYTES, app._SPOOL_TO_DISK_BYTES = 1024, 4096, 0
+    try:
+        cases = {
+            "Multipart file over per-file cap": client.post(
+                '/parse', data={'files': (io.BytesIO(b'a\n' * 1024), 'big.txt')},
+                content_type='multipart/form-data'),
+            "Multipart body over per-request cap": client.post(
+                '/parse', data={'files': [(io.BytesIO(b'a\n' * 400), f'r{i}.txt') for i in range(8)]},
+                content_type='multipart/form-data'),
+            "Raw body over per-file cap": client.post(
+                '/parse', data=b'a\n' * 1024, content_type='application/octet-stream',
+                headers={'X-Filename': 'big.txt'}),
+            "Raw body over per-request cap": client.post(
+                '/parse', data=b'a\n' * 4096, content_type='application/octet-stream',
+                headers={'X-Filename': 'big.txt'}),
+        }
+        for name, response in cases.items():
+            assert response.status_code == 413, (name, response.status_code)
+            assert response.get_json()['error'], name
+        assert 'File too large' in cases["Multipart file over per-file cap"].get_json()['error']
+        assert 'Request too large' in cases["Multipart body over per-request cap"].get_json()['error']
+        assert 'File too large' in cases["Raw body over per-file cap"].get_json()['error']
+        assert 'Request too large' in cases["Raw body over per-request cap"].get_json()['error']
+    finally:
+        app._MAX_FILE_BYTES, app._MAX_REQUEST_BYTES, app._SPOOL_TO_DISK_BYTES = saved
+
+
+def test_parse_disk_cache(tmp_path):
+    """Test that the on-disk parse cache serves results the memory LRU has dropped"""
+    diskcache = pytest.importorskip('diskcache')
+    import app
+
+    def no_pool():
+        raise AssertionError('disk hit should not reach the parse pool')
+
+    payload = b"Jane Doe\njane@example.com\n"
+    saved = (app._PARSE_DISK_CACHE, app._get_parse_pool)
+    app._PARSE_DISK_CACHE = diskcache.Cache(str(tmp_path))
+    try:
+        app._PARSE_CACHE.clear()
+        content, parsed = app._run_parse('disk.txt', payload)
+        # A new process (or an evicted entry) starts with an empty LRU
+        app._PARSE_CACHE.clear()
+        app._get_parse_pool = no_pool
+        cached_content, cached = app._run_parse('disk.txt', payload)
+        assert (cached_content, cached) == (content, parsed)
+        # The disk hit is promoted back into the memory LRU
+        assert len(app._PARSE_CACHE) == 1
+    finally:
+        app._PARSE_DISK_CACHE.close()
+        app._PARSE_DISK_CACHE, app._get_parse_pool = saved
+        app._PARSE_CACHE.clear()
+
+
+def test_export_etag_reuse():
+    """Test that re-exporting the same rows reuses the workbook and its ETag, and changed rows do not"""
+    import io
+    import app
+
+    client = app.app.test_client()
+    body = {'data': [{'full_name': 'John Smith', 'email': 'john@example.com'}]}
+    app._EXPORT_CACHE.clear()
+    try:
+        first = client.post('/export', json=body)
+        assert first.status_code == 200
+        etag = first.headers['ETag'].strip('"')
+        assert list(app._EXPORT_CACHE) == [etag]
+
+        again = client.post('/export', json=body)
+        assert again.status_code == 200
+        assert again.headers['ETag'] == first.headers['ETag']
+        assert again.data == first.data
+
+        # Werkzeug only answers 304 for GET/HEAD, so a POST re-download still gets the body
+        unchanged = client.post('/export', json=body, headers={'If-None-Match': first.headers['ETag']})
+        assert unchanged.status_code == 200 and unchanged.data == first.data
+
+        # Editing one field must miss the cache: new ETag, new workbook, new entry
+        changed = {'data': [{**body['data'][0], 'email': 'john.smith@example.com'}]}
+        other = client.post('/export', json=changed)
+        assert other.status_code == 200
+        other_etag = other.headers['ETag'].strip('"')
+        assert other_etag != etag
+        assert other.data != first.data
+        assert list(app._EXPORT_CACHE) == [etag, other_etag]
+        from openpyxl import load_workbook
+        sheet = load_workbook(io.BytesIO(other.data)).active
+        header = [cell.value for cell in sheet[1]]
+        assert sheet.cell(row=2, column=header.index('email') + 1).value == 'john.smith@example.com'
+    finally:
+        app._EXPORT_CACHE.clear()
+
+
+_FORMULA_ROW = {
+    'full_name': '+1+HYPERLINK("x")',
+    'email': '@SUM(A1:A2)',
+    'phone_number': '+1 (555) 123-4567',
+    'current_company': '-2+3',
+    'city': '=1+1',
+}
+
+
+def test_csv_export_escapes_formulas():
+    """Test that CSV cells starting = + - @ are quoted, phone numbers are not"""
+    import csv
+    import io
+    import app
+
+    response = app.app.test_client().post('/export.csv', json={'data': [_FORMULA_ROW]})
+    assert response.status_code == 200
+    header, row = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+    cells = dict(zip(header, row))
+    assert cells['full_name'] == "'" + _FORMULA_ROW['full_name']
+    assert cells['email'] == "'" + _FORMULA_ROW['email']
+    assert cells['current_company'] == "'" + _FORMULA_ROW['current_company']
+    assert cells['city'] == "'" + _FORMULA_ROW['city']
+    assert cells['phone_number'] == _FORMULA_ROW['phone_number']
+
+
+@pytest.mark.parametrize("writer", ['_write_xlsx', '_write_xlsx_openpyxl'])
+def test_xlsx_export_stores_formulas_as_text(writer):
+    """Test that both XLSX writers store formula-like text as plain strings"""
+    import io
+    from openpyxl import load_workbook
+    import app
+
+    if writer == '_write_xlsx' and app.xlsxwriter is None:
+        pytest.skip('xlsxwriter not installed')
+    output = io.BytesIO()
+    getattr(app, writer)(output, [_FORMULA_ROW], app.EXPORT_COLUMNS)
+    output.seek(0)
+    sheet = load_workbook(output).active
+    header = [cell.value for cell in sheet[1]]
+    for col, value in _FORMULA_ROW.items():
+        cell = sheet.cell(row=2, column=header.index(col) + 1)
+        assert cell.data_type == 's', col
+        assert cell.value == value, col
+
+
+def _write_word97(path, pieces, fc_clx=0):
+    """
+    Write a minimal Word 97 .doc: a CFB container holding a WordDocument
+    stream (FIB + text) and a 1Table stream with one Clx piece table.
+    `pieces` are (text, compressed) pairs laid out one per 1 KB block.
+    """
+    import struct
+
+    word = bytearray(4096 + 1024 * len(pieces))
+    struct.pack_into('<HHHH', word, 0, 0xA5EC, 0xC1, 0, 0)
+    struct.pack_into('<H', word, 0x0A, 0x0200)  # fWhichTblStm: text is in 1Table
+    struct.pack_into('<H', word, 32, 14)  # FibRgW97
+    struct.pack_into('<H', word, 62, 22)  # FibRgLw97
+    struct.pack_into('<H', word, 152, 0x5D)  # FibRgFcLcb97
+    cps, pcds, cp = [0], [], 0
+    for i, (text, compressed) in enumerate(pieces):
+        offset = 1024 * (i + 1)
+        data = text.encode('cp1252' if compressed else 'utf-16-le')
+        word[offset:offset + len(data)] = data
+        pcds.append((offset * 2) | 0x40000000 if compressed else offset)
+        cp += len(text)
+        cps.append(cp)
+    struct.pack_into('<I', word, 64 + 3 * 4, cp)  # ccpText
+    plc = struct.pack(f'<{len(cps)}I', *cps) + b''.join(struct.pack('<HIH', 0, fc, 0) for fc in pcds)
+    table = bytearray(4096)
+    clx = b'\x02' + struct.pack('<I', len(plc)) + plc
+    table[fc_clx:fc_clx + len(clx)] = clx
+    struct.pack_into('<II', word, 154 + 33 * 8, fc_clx, len(clx))
+
+    # Sector 0 FAT, 1 directory, then the two streams (both over the 4 KB mini-stream cutoff)
+    streams = [('WordDocument', bytes(word)), ('1Table', bytes(table))]
+    fat, sector, starts = [0xFFFFFFFD, 0xFFFFFFFE], 2, []
+    for _, data in streams:
+        count = len(data) // 512
+        starts.append(sector)
+        fat += list(range(sector + 1, sector + count)) + [0xFFFFFFFE]
+        sector += count
+    fat += [0xFFFFFFFF] * (128 - len(fat))
+
+    def entry(name, kind, right, child, start, size):
+        raw = name.encode('utf-16-le') + b'\0\0'
+        return (raw.ljust(64, b'\0') + struct.pack('<HBBIII', len(raw), kind, 1, 0xFFFFFFFF, right, child)
+                + b'\0' * 36 + struct.pack('<III', start, size, 0))
+
+    directory = (entry('Root Entry', 5, 0xFFFFFFFF, 1, 0xFFFFFFFE, 0)
+                 + entry(streams[0][0], 2, 2, 0xFFFFFFFF, starts[0], len(streams[0][1]))
+                 + entry(streams[1][0], 2, 0xFFFFFFFF, 0xFFFFFFFF, starts[1], len(streams[1][1])))
+    header = (bytes.fromhex('D0CF11E0A1B11AE1') + b'\0' * 16
+              + struct.pack('<HHHHH', 0x3E, 3, 0xFFFE, 9, 6) + b'\0' * 6
+              + struct.pack('<IIIIIIIII', 0, 1, 1, 0, 4096, 0xFFFFFFFE, 0, 0xFFFFFFFE, 0)
+              + struct.pack('<I', 0) + b'\xff' * (108 * 4))
+    with open(path, 'wb') as f:
+        f.write(header + struct.pack('<128I', *fat) + directory.ljust(512, b'\0'))
+        for _, data in streams:
+            f.write(data)
+
+
+def test_doc_piece_table_extraction(tmp_path):
+    """Test the olefile .doc reader on compressed and UTF-16 pieces with a field code"""
+    pytest.importorskip('olefile')
+    import resume_parser
+
+    path = tmp_path / 'resume.doc'
+    _write_word97(path, [
+        ("John Smith\rSenior Engineer\r", True),
+        ("Résumé \x13 HYPERLINK \"x\" \x14link\x15 ok\x07Pune\r", False),
+    ], fc_clx=100)
+    text = resume_parser._extract_doc_olefile(str(path))
+    assert text == "John Smith\nSenior Engineer\nRésumé link ok\nPune\n"
+    assert resume_parser.extract_doc(str(path)) == text
+
+
+@pytest.mark.parametrize("damage", ['truncated', 'clx-out-of-range', 'not-word97'])
+def test_doc_corrupt_stream_falls_through(tmp_path, monkeypatch, damage):
+    """Test that an unreadable .doc falls through to the next extractor instead of raising"""
+    pytest.importorskip('olefile')
+    import subprocess
+    import resume_parser
+
+    path = tmp_path / 'broken.doc'
+    _write_word97(path, [("John Smith\r", True)])
+    data = bytearray(path.read_bytes())
+    if damage == 'truncated':
+        data = data[:1500]
+    elif damage == 'clx-out-of-range':
+        data[1536 + 154 + 33 * 8:1536 + 154 + 33 * 8 + 4] = (1 << 30).to_bytes(4, 'little')
     else:
-        print(f"\n[WARN]  {total - passed} test(s) failed. Please review.")
-    
-    return passed == total
+        data[1536:1538] = b'\0\0'
+    path.write_bytes(bytes(data))
+
+    conversions = []
+
+    def no_libreoffice(args, **kwargs):
+        conversions.append(args)
+        raise FileNotFoundError(args[0])
+
+    monkeypatch.setattr(subprocess, 'run', no_libreoffice)
+    if damage != 'truncated':
+        assert resume_parser._extract_doc_olefile(str(path)) == ""
+    assert isinstance(resume_parser.extract_doc(str(path)), str)
+    assert len(conversions) == 1
+
+
+def test_docx_extraction_matches_docx2txt(tmp_path):
+    """Test the streaming DOCX reader against docx2txt, the previous extraction path"""
+    docx = pytest.importorskip('docx')
+    docx2txt = pytest.importorskip('docx2txt')
+    import app
+
+    document = docx.Document()
+    document.sections[0].header.paragraphs[0].text = 'Jane Doe - Resume'
+    document.add_paragraph('Jane Doe')
+    paragraph = document.add_paragraph('Senior ')
+    paragraph.add_run('Data Engineer').bold = True
+    paragraph.add_run().add_tab()
+    paragraph.add_run('Pune, Maharashtra')
+    table = document.add_table(rows=2, cols=2)
+    for cell, value in zip(table._cells, ['Company', 'Period', 'Infosys', '2019 - Present']):
+        cell.text = value
+    paragraph = document.add_paragraph('B.Tech, 2018')
+    paragraph.add_run().add_break()
+    paragraph.add_run('IIT Bombay')
+    path = tmp_path / 'resume.docx'
+    document.save(path)
+
+    def lines(text):
+        return [line for line in text.split('\n') if line.strip()]
+
+    text = app.extract_docx_text(str(path))
+    assert lines(text) == lines(docx2txt.process(str(path)))
+    with open(path, 'rb') as fh:
+        assert app.extract_docx_text(fh) == text
+    # Everything python-docx sees in the body, paragraphs and table cells alike
+    expected = [p.text for p in docx.Document(path).paragraphs] + [c.text for c in table._cells]
+    for value in expected:
+        for line in value.split('\n'):
+            assert line in lines(text)
+
+
+_RESUME_LINE = 'José Müller — Senior Développeur, São Paulo\r\nCafé Street 5\n'
+
+
+@pytest.mark.parametrize("raw,encoding", [
+    (codecs.BOM_UTF8 + _RESUME_LINE.encode('utf-8'), 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE + _RESUME_LINE.encode('utf-16-le'), 'utf-16'),
+    (codecs.BOM_UTF16_BE + _RESUME_LINE.encode('utf-16-be'), 'utf-16'),
+    (_RESUME_LINE.encode('utf-8'), 'utf-8'),
+], ids=['utf-8-bom', 'utf-16le-bom', 'utf-16be-bom', 'utf-8'])
+def test_txt_encoding_detection(raw, encoding):
+    """Test that BOMs and strict UTF-8 are recognised before any guessing"""
+    import resume_parser
+
+    assert resume_parser._detect_encoding(raw) == encoding
+    assert resume_parser._decode_txt(raw) == _RESUME_LINE.replace('\r\n', '\n')
+
+
+def test_txt_cp1252_detection():
+    """Test that cp1252 text falls through to charset_normalizer and decodes cleanly"""
+    pytest.importorskip('charset_normalizer')
+    import resume_parser
+
+    text = ('Résumé — José Müller, Développeur. Expérience: 5 ans chez Société Générale, '
+            '“chef de projet”, Genève et Zürich; également à Besançon. '
+            'Compétences: gestion, modélisation, sécurité.\n') * 4
+    raw = text.encode('cp1252')
+    assert resume_parser._detect_encoding(raw) != 'utf-8'
+    assert resume_parser._decode_txt(raw) == text
+
+
+def test_txt_decoding_without_charset_normalizer(monkeypatch):
+    """Test that non-UTF-8 bytes still decode, with replacements, when charset_normalizer is absent"""
+    import resume_parser
+
+    monkeypatch.setattr(resume_parser, 'charset_normalizer', None)
+    raw = 'Résumé\nJosé Müller\n'.encode('cp1252')
+    assert resume_parser._detect_encoding(raw) == 'utf-8'
+    assert resume_parser._decode_txt(raw) == 'R�sum�\nJos� M�ller\n'
+    assert resume_parser._detect_encoding(codecs.BOM_UTF8 + b'Jane') == 'utf-8-sig'
+
+
+def _write_resumes(directory, names):
+    paths = []
+    for i, name in enumerate(names):
+        path = directory / f'resume_{i}.txt'
+        path.write_text(f"{name}\n{name.split()[0].lower()}@example.com\n", encoding='utf-8')
+        paths.append(str(path))
+    return paths
+
+
+_BATCH_NAMES = ['Alice Walker', 'Bob Martin', 'Carol Danvers', 'David Miller']
+
+
+@pytest.mark.parametrize("executor", ['thread', 'process'])
+def test_parse_resumes_keeps_input_order(tmp_path, executor):
+    """Test that batch results come back in input order and a bad path does not end the batch"""
+    import resume_parser
+
+    paths = _write_resumes(tmp_path, _BATCH_NAMES)
+    paths.insert(2, str(tmp_path / 'missing.txt'))
+    results = resume_parser.parse_resumes(paths, max_workers=2, executor=executor)
+    assert len(results) == len(paths)
+    assert [r['full_name'] for r in results] == _BATCH_NAMES[:2] + [None] + _BATCH_NAMES[2:]
+    assert 'missing.txt' in results[2]['error']
+    assert all('error' not in r for i, r in enumerate(results) if i != 2)
+
+
+def test_parse_resumes_reports_parse_failures(tmp_path, monkeypatch):
+    """Test that an extractor raising on one file yields an error entry for that file only"""
+    import resume_parser
+
+    paths = _write_resumes(tmp_path, _BATCH_NAMES[:3])
+    extract_text = resume_parser.extract_text
+
+    def failing_extract(file_path):
+        if file_path == paths[1]:
+            raise ValueError('corrupt resume')
+        return extract_text(file_path)
+
+    monkeypatch.setattr(resume_parser, 'extract_text', failing_extract)
+    results = resume_parser.parse_resumes(paths, max_workers=2, executor='thread')
+    assert [r['full_name'] for r in results] == [_BATCH_NAMES[0], None, _BATCH_NAMES[2]]
+    assert results[1]['error'] == 'corrupt resume'
+
+
+def test_cli_ndjson_writes_one_record_per_line(tmp_path):
+    """Test that --ndjson writes exactly one JSON object per input file, in order"""
+    import subprocess
+
+    paths = _write_resumes(tmp_path, _BATCH_NAMES[:3])
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resume_parser.py')
+    proc = subprocess.run([sys.executable, script, *paths, '--ndjson', '--workers', '2'],
+                          capture_output=True, text=True, timeout=120, check=True)
+    lines = proc.stdout.splitlines()
+    assert len(lines) == len(paths)
+    records = [json.loads(line) for line in lines]
+    assert all(isinstance(r, dict) for r in records)
+    assert [r['file_path'] for r in records] == paths
+    assert [r['full_name'] for r in records] == _BATCH_NAMES[:3]
+
+
+def _sse_response(events, after):
+    """A streamed httpx response of SSE `events`; reading into `after` fails the test."""
+    import httpx
+
+    def body():
+        for event in events:
+            yield b'data: ' + json.dumps(event).encode() + b'\n\n'
+        raise AssertionError(f'read past the closing JSON into {after!r}')
+
+    return httpx.Response(200, content=body())
+
+
+def _delta(piece):
+    return {'choices': [{'delta': {'content': piece}}]}
+
+
+def test_llm_stream_stops_when_json_closes():
+    """Test that streamed content is assembled across chunks and reading stops at the closing bracket"""
+    import llm_helper
+
+    pieces = ['[{"full_name": {"val', 'ue": "A [b] \\"c}", "conf', 'idence": 0.9}}]', ' trailing text']
+    response = _sse_response([_delta(p) for p in pieces], 'the rest of the stream')
+    content = llm_helper._read_streamed_content(response)
+    assert content == '[{"full_name": {"value": "A [b] \\"c}", "confidence": 0.9}}]'
+    assert json.loads(content)[0]['full_name']['value'] == 'A [b] "c}'
+
+
+def test_llm_stream_reads_to_done_without_json():
+    """Test that a stream whose JSON never closes is read up to [DONE] and returned whole"""
+    import httpx
+    import llm_helper
+
+    lines = [b'data: ' + json.dumps(_delta(p)).encode() + b'\n\n' for p in ['{"a": [1, ', '2']]
+    response = httpx.Response(200, content=iter(lines + [b': keep-alive\n\n', b'data: [DONE]\n\n']))
+    assert llm_helper._read_streamed_content(response) == '{"a": [1, 2'
+
+
+def test_llm_token_budget_refuses_over_limit():
+    """Test that the token budget refuses spend over the per-minute limit until it ages out"""
+    import time
+    import llm_helper
+
+    budget = llm_helper._TokenBudget(100, window=0.2)
+    assert budget.acquire(60, timeout=0)
+    assert not budget.acquire(50, timeout=0)
+    assert budget.acquire(40, timeout=0)
+    assert not budget.acquire(1, timeout=0.05)
+    time.sleep(0.25)
+    assert budget.acquire(100, timeout=0)
+
+
+def test_llm_call_skipped_when_budget_exhausted(monkeypatch):
+    """Test that call_llm_extract returns None without a request once the budget is spent"""
+    import llm_helper
+
+    class NoWaitBudget(llm_helper._TokenBudget):
+        def acquire(self, tokens, timeout):
+            return super().acquire(tokens, timeout=0)
+
+    budget = NoWaitBudget(2000)
+    assert budget.acquire(2000, timeout=0)
+    requests_made = []
+    monkeypatch.setattr(llm_helper, '_token_budget', budget)
+    monkeypatch.setattr(llm_helper, '_http_client', lambda: requests_made.append(1))
+    assert llm_helper.call_llm_extract('Jane Doe', api_key='test-key', api_url='http://llm.invalid/') is None
+    assert requests_made == []
+
+
+def _slow_extract_and_parse(filename, source):
+    import time
+    time.sleep(60)
+
+
+def test_parse_timeout_replaces_pool(monkeypatch):
+    """Test that a parse running past PARSE_TIMEOUT kills its worker and a fresh pool takes over"""
+    import app
+
+    app._reset_parse_pool(app._get_parse_pool())
+    monkeypatch.setattr(app, '_PARSE_TIMEOUT', 1.0)
+    monkeypatch.setattr(app, '_PARSE_CACHE_MAX', 0)
+    # Patched before the pool forks, so its workers run the slow job
+    monkeypatch.setattr(app, '_extract_and_parse', _slow_extract_and_parse)
+    stuck_pool = app._get_parse_pool()
+    # shutdown() drops the executor's reference, so hold on to its process table
+    processes = stuck_pool._processes
+    with pytest.raises(TimeoutError):
+        app._run_parse('slow.txt', b'Jane Doe\n')
+    assert app._PARSE_POOL is not stuck_pool
+    assert processes
+    for process in processes.values():
+        process.join(timeout=5)
+        assert not process.is_alive()
+
+    monkeypatch.undo()
+    content, parsed = app._run_parse('fast.txt', b'Jane Doe\njane@example.com\n')
+    assert parsed['email'] == 'jane@example.com'
+
+
+def test_n8n_server_requests():
+    """Test the n8n --server loop on a file, a JSON text request and bad payloads"""
+    import io
+    import n8n_resume_parser
 
+    resume = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_resume.txt')
+    requests_in = '\n'.join([
+        resume,
+        json.dumps({'file_path': 'pasted.txt', 'text': 'Jane Doe\njane@example.com\n'}),
+        '{"file_path": "broken.txt", "text": ',
+        json.dumps({'file_path': 42}),
+        json.dumps({'file_path': 'cv.txt', 'text': ['Jane Doe']}),
+        '/no/such/resume.pdf',
+        '',
+    ])
+    out = io.StringIO()
+    n8n_resume_parser.serve(io.StringIO(requests_in), out)
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert len(records) == 6
 
-if __name__ == "__main__":
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
+    parsed, pasted, malformed, bad_path, bad_text, missing = records
+    assert parsed['success'] and parsed['file_path'] == resume and 'error' not in parsed
+    assert pasted['success'] and pasted['email'] == 'jane@example.com'
+    for record in (malformed, bad_path, bad_text):
+        assert record['status'] == 400 and not record['success'] and record['error']
+    assert missing['status'] == 404 and 'File not found' in missing['error']